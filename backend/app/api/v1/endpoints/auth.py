@@ -65,7 +65,6 @@ async def register(
     db.add(user)
     await db.commit()
     await db.refresh(user)
-    await db.refresh(org)
 
     # Generate JWT token pair
     tokens = await jwt_svc.create_token_pair(
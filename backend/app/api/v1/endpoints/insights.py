@@ -10,6 +10,7 @@ import time
 from typing import Optional, Literal
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, desc
 
@@ -590,6 +591,55 @@ async def ask_dataset_question(
         )
 
 
+@router.post(
+    "/datasets/{dataset_id}/ask/stream",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_permission("data:view"))]
+)
+async def stream_dataset_question(
+    dataset_id: UUID,
+    request: InsightQuestionRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_current_organization_id)
+):
+    """
+    Natural language query endpoint with a streamed answer.
+
+    Returns the answer as plain text, sent chunk by chunk as the model
+    generates it, so clients can render it before it is complete.
+
+    **Required Permission:** `data:view`
+    """
+    # Verify dataset exists and belongs to organization
+    dataset = await db.get(Dataset, dataset_id)
+    if not dataset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Dataset {dataset_id} not found"
+        )
+
+    if dataset.organization_id != organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Dataset does not belong to your organization"
+        )
+
+    logger.info(f"User {current_user.id} asked streamed question about dataset {dataset_id}")
+
+    # Load the question's context now: with this FastAPI version the session
+    # is closed before the response body is streamed
+    insight_service = InsightGeneratorService(db)
+    answer_chunks = await insight_service.answer_data_question_stream(
+        dataset_id=dataset_id,
+        question=request.question
+    )
+    return StreamingResponse(
+        answer_chunks,
+        media_type="text/plain; charset=utf-8"
+    )
+
+
 @router.get(
     "/datasets/{dataset_id}/summary",
     response_model=dict,
@@ -657,7 +707,7 @@ async def get_dataset_summary(
         
         llm_client = get_llm_client()
         
-        prompt = DATASET_SUMMARY_PROMPT.format(
+        prompt = DATASET_SUMMARY_PROMPT.render(
             dataset_name=dataset.name,
             row_count=dataset_summary.get("row_count", 0),
             column_count=dataset_summary.get("column_count", 0),
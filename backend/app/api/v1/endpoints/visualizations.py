@@ -5,14 +5,17 @@ Handles visualization creation, retrieval, updates, deletion, chart suggestions,
 and data aggregation with proper authentication and permissions.
 """
 
+import json
 import logging
-from typing import Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal, get_db
 from app.api.v1.dependencies.auth import get_current_user
 from app.api.v1.dependencies.tenant import get_current_organization_id
 from app.api.v1.dependencies.permissions import require_permission
@@ -589,6 +592,157 @@ async def suggest_visualizations(
         )
 
 
+async def _stream_suggestion_events(
+    http_request: Request,
+    request: ChartSuggestionRequest
+) -> AsyncIterator[str]:
+    """
+    Yield chart suggestion events as NDJSON lines until done or the client leaves.
+
+    A disconnect while the AI request is in flight cancels this task
+    (StreamingResponse watches for it), which cancels the LLM call; one
+    noticed between events closes the generator before the AI request starts.
+    """
+    # The request's session is closed before the body streams, so use our own
+    async with AsyncSessionLocal() as session:
+        chart_suggester = ChartSuggesterService(session)
+        events = chart_suggester.stream_visualizations(
+            dataset_id=request.dataset_id,
+            use_ai=request.use_ai,
+            max_suggestions=request.max_suggestions
+        )
+        async with aclosing(events):
+            async for event in events:
+                if await http_request.is_disconnected():
+                    logger.info(f"Client disconnected from chart suggestions for dataset {request.dataset_id}")
+                    return
+                yield json.dumps(event, default=str) + "\n"
+
+
+@router.post(
+    "/suggest/stream",
+    dependencies=[Depends(require_permission("data:view"))]
+)
+async def stream_suggestions(
+    http_request: Request,
+    request: ChartSuggestionRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_current_organization_id)
+):
+    """
+    Stream chart suggestions for a dataset as newline-delimited JSON.
+
+    Rule-based suggestions are sent as soon as they are ready
+    (`{"type": "suggestions", ...}`); with `use_ai`, the AI re-ranked list
+    follows (`{"type": "ai_suggestions", ...}`). If the client disconnects,
+    the pending AI request is cancelled instead of running to completion.
+
+    **Required Permission:** `data:view`
+    """
+    dataset = await db.get(Dataset, request.dataset_id)
+    if not dataset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Dataset {request.dataset_id} not found"
+        )
+
+    if dataset.organization_id != organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Dataset does not belong to your organization"
+        )
+
+    return StreamingResponse(
+        _stream_suggestion_events(http_request, request),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.post(
+    "/suggestions",
+    response_model=dict,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_permission("data:view"))]
+)
+async def enqueue_suggestions(
+    request: ChartSuggestionRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_current_organization_id)
+):
+    """
+    Queue chart suggestions for a dataset on a background worker.
+
+    Returns a job ID immediately; poll `GET /suggestions/{job_id}` for results.
+    Rule-based suggestions appear as soon as they are ready, before any AI
+    enhancement completes.
+
+    **Required Permission:** `data:view`
+    """
+    dataset = await db.get(Dataset, request.dataset_id)
+    if not dataset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Dataset {request.dataset_id} not found"
+        )
+
+    if dataset.organization_id != organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Dataset does not belong to your organization"
+        )
+
+    try:
+        chart_suggester = ChartSuggesterService(db)
+        job_id = await chart_suggester.enqueue_suggestions(
+            dataset_id=request.dataset_id,
+            use_ai=request.use_ai,
+            max_suggestions=request.max_suggestions
+        )
+    except Exception as e:
+        logger.error(f"Failed to queue chart suggestions: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to queue chart suggestions: {str(e)}"
+        )
+
+    return {"job_id": job_id, "status": "pending"}
+
+
+@router.get(
+    "/suggestions/{job_id}",
+    response_model=dict,
+    dependencies=[Depends(require_permission("data:view"))]
+)
+async def get_suggestions(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_current_organization_id)
+):
+    """
+    Get the status and results of a queued chart suggestion job.
+
+    **Required Permission:** `data:view`
+    """
+    job = await ChartSuggesterService.get_suggestions(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Suggestion job {job_id} not found"
+        )
+
+    dataset = await db.get(Dataset, UUID(job["dataset_id"]))
+    if not dataset or dataset.organization_id != organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Suggestion job {job_id} not found"
+        )
+
+    return job
+
+
 @router.get(
     "/{viz_id}/data",
     response_model=dict,
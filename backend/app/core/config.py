@@ -61,6 +61,13 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: Optional[str] = None
     OPENAI_API_KEY: Optional[str] = None
     DEFAULT_LLM_PROVIDER: str = "anthropic"  # anthropic or openai
+    LLM_CONCURRENCY: int = 50  # Max concurrent LLM requests per process
+    LLM_REQUESTS_PER_MINUTE: int = 500
+    ANTHROPIC_CONCURRENCY: int = 50  # Max in-flight Anthropic API requests per process
+    OPENAI_CONCURRENCY: int = 50  # Max in-flight OpenAI API requests per process
+    LLM_RESPONSE_CACHE_TTL: int = 604800  # 7 days
+    LLM_RESPONSE_CACHE_MAXSIZE: int = 1024  # In-process entries
+    LLM_RESPONSE_CACHE_REDIS: bool = True  # Share cached responses across workers
 
     # Stripe (Billing)
     STRIPE_API_KEY: Optional[str] = None
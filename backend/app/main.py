@@ -15,6 +15,7 @@ from app.middleware.logging import LoggingMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.tenant import TenantMiddleware
 from app.services.auth.jwt import jwt_service
+from app.services.llm.client import close_llm_clients
 
 logging.basicConfig(
     level=logging.INFO,
@@ -50,6 +51,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Datapilot application...")
 
+    # Close pooled LLM provider connections
+    await close_llm_clients()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
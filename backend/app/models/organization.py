@@ -24,6 +24,10 @@ class SubscriptionStatus(str, PyEnum):
 class Organization(Base):
     __tablename__ = "organizations"
 
+    # Fetch server-generated timestamps via RETURNING on flush, so new or
+    # updated instances don't need a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
     name: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
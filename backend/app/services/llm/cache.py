@@ -0,0 +1,169 @@
+"""
+Response cache for LLM completions.
+
+Identical requests (same provider, model, prompts and sampling parameters)
+are answered from a process-local LRU first and a shared Redis cache second,
+so repeated prompts skip the network round-trip and token cost entirely.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Optional
+
+import orjson
+from redis.asyncio import Redis, from_url
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when prompt templates change in a way that should invalidate cached answers
+PROMPT_VERSION = "1"
+
+_REDIS_KEY_PREFIX = "llm:response"
+
+# redis.asyncio connections are bound to the loop that opened them, and Celery
+# tasks each run their own loop, so keep one client per running loop
+_loop_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_redis_client() -> Redis:
+    loop = asyncio.get_running_loop()
+    client = _loop_redis_clients.get(loop)
+    if client is None:
+        client = from_url(
+            settings.REDIS_URL,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS
+        )
+        _loop_redis_clients[loop] = client
+    return client
+
+
+async def close_cache_redis_client():
+    """Close the response cache's Redis client for the running loop."""
+    client = _loop_redis_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+def make_cache_key(**params: Any) -> str:
+    """
+    Build a cache key from request parameters.
+
+    Args:
+        **params: Everything that determines the response (provider, model,
+            prompts, sampling parameters, extra provider kwargs)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    canonical = orjson.dumps(
+        {"prompt_version": PROMPT_VERSION, **params},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+    return blake2b(canonical, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-level cache for completion text.
+
+    Features:
+    - Process-local LRU with per-entry expiry
+    - Optional shared Redis layer (survives restarts, shared across workers)
+    - Cache failures never fail the request; they are logged and treated as misses
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: int = 7 * 24 * 3600,
+        use_redis: bool = True
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            maxsize: Maximum entries held in process memory
+            ttl: Entry lifetime in seconds
+            use_redis: Whether to also read/write the shared Redis cache
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.use_redis = use_redis
+        self._local: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                return value
+            del self._local[key]
+
+        if not self.use_redis:
+            return None
+
+        try:
+            value = await _get_redis_client().get(f"{_REDIS_KEY_PREFIX}:{key}")
+        except Exception as e:
+            logger.warning(f"LLM response cache read failed: {e}")
+            return None
+
+        if value is not None:
+            self._set_local(key, value, self.ttl)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None):
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+            value: Response text
+            ttl: Optional lifetime override in seconds
+        """
+        ttl = ttl or self.ttl
+        self._set_local(key, value, ttl)
+
+        if not self.use_redis:
+            return
+
+        try:
+            await _get_redis_client().setex(f"{_REDIS_KEY_PREFIX}:{key}", ttl, value)
+        except Exception as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+
+    def _set_local(self, key: str, value: str, ttl: int):
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        if len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+
+# Shared by every LLMClient in the process
+response_cache = ResponseCache(
+    maxsize=settings.LLM_RESPONSE_CACHE_MAXSIZE,
+    ttl=settings.LLM_RESPONSE_CACHE_TTL,
+    use_redis=settings.LLM_RESPONSE_CACHE_REDIS
+)
@@ -5,40 +5,245 @@ Provides rule-based and AI-powered chart suggestions based on data
 characteristics, user questions, and best practices.
 """
 
+import json
 import logging
-from typing import Any, Optional, Literal
-from uuid import UUID
-
+import re
+import weakref
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Any, AsyncIterator, Optional, Literal
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.redis import get_redis_client
 from app.models import Dataset, ChartType
 from app.services.llm.client import get_llm_client, LLMClient
-from app.services.llm.prompts import CHART_SUGGESTION_PROMPT, SYSTEM_PROMPTS, format_schema, format_column_list
+from app.services.llm.prompts import CHART_SUGGESTION_PROMPT, SYSTEM_PROMPTS, format_schema, format_column_list, schema_key
 from app.services.visualization.summary import SummaryService
+from app.workers.celery_app import celery_app
 
 
 logger = logging.getLogger(__name__)
 
+# Rule-based suggestions depend only on the shape of the dataset summary, so
+# they are memoized process-wide (the service itself is created per request).
+_RULES_CACHE_MAXSIZE = 512
+_rules_cache: "OrderedDict[tuple, list[tuple]]" = OrderedDict()
+
+# AI enhancement is skipped for datasets at most this wide when every rule
+# suggestion is already high-confidence
+_AI_SKIP_MAX_COLUMNS = 8
+
+# Parsed view of dataset.schema_info plus the prompt fragments derived from it
+SchemaProjection = namedtuple(
+    "SchemaProjection",
+    "columns numeric categorical datetime column_types_str schema_str available_columns_str"
+)
+
+# Background suggestion jobs: Celery task name, Redis key prefix and result TTL
+SUGGESTION_TASK_NAME = "app.workers.suggestion_worker.generate_chart_suggestions"
+SUGGESTION_JOB_KEY_PREFIX = "chart_suggestions"
+SUGGESTION_JOB_TTL = 3600  # 1 hour
+
+# Keyed by (dataset_id, dataset fingerprint) so edits to a dataset invalidate its entry
+_SCHEMA_PROJECTION_CACHE_MAXSIZE = 512
+_schema_projection_cache: "OrderedDict[tuple, SchemaProjection]" = OrderedDict()
+
+# Visualization intent keywords (matched as substrings of the lowercased question)
+_INTENTS: dict[str, frozenset[str]] = {
+    "trend": frozenset({"trend", "over time", "change", "growth", "decline", "historical"}),
+    "comparison": frozenset({"compare", "versus", "vs", "difference", "better", "worse"}),
+    "relationship": frozenset({"relationship", "correlation", "related", "connected", "association"}),
+    "distribution": frozenset({"distribution", "spread", "range", "variance", "outliers"}),
+    "composition": frozenset({"composition", "breakdown", "proportion", "percentage", "share"}),
+    "ranking": frozenset({"top", "bottom", "highest", "lowest", "rank", "best", "worst"})
+}
+
+_INTENT_TO_CHARTS: dict[str, tuple[str, ...]] = {
+    "trend": ("line", "area"),
+    "comparison": ("bar", "line"),
+    "relationship": ("scatter", "heatmap"),
+    "distribution": ("bar", "area"),
+    "composition": ("pie", "doughnut", "bar"),
+    "ranking": ("bar",),
+    "general": ("bar", "line")
+}
+
+_ALL_KEYWORDS: frozenset[str] = frozenset().union(*_INTENTS.values())
+
+# One-scan pre-check for "no keyword present"; a substring regex rather than a
+# word split so matching stays identical to the per-intent checks ("trends")
+_ALL_KEYWORDS_PATTERN = re.compile("|".join(re.escape(k) for k in sorted(_ALL_KEYWORDS)))
+
+# Expected structure of an AI chart suggestion
+_SUGGESTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "chart_type": {"type": "string"},
+        "x_axis": {"type": "string"},
+        "y_axis": {"type": "string"},
+        "grouping": {"type": "string"},
+        "aggregation": {"type": "string"},
+        "reasoning": {"type": "string"},
+        "alternative_charts": {"type": "array"},
+        "confidence": {"type": "number"}
+    }
+}
+
+# Expected structure of the AI review of rule-based suggestions: suggestion
+# numbers (1-based, as listed in the prompt) in ranked order, plus titles
+_ENHANCEMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "reordering": {"type": "array", "items": {"type": "integer"}},
+        "improved_titles": {
+            "type": "object",
+            "additionalProperties": {"type": "string"}
+        }
+    }
+}
+
+# Only the top suggestions are sent for review
+_ENHANCEMENT_MAX_REVIEWED = 5
+
+
+def _line_suggestion(datetime_col: str, num_col: str) -> dict[str, Any]:
+    return {
+        "chart_type": "line",
+        "title": f"{num_col} Over Time",
+        "x_axis": datetime_col,
+        "y_axis": num_col,
+        "aggregation": "avg",
+        "reasoning": "Time-series data is best visualized with line charts to show trends."
+    }
+
+
+def _bar_suggestion(cat_col: str, num_col: str, unique_values: int) -> dict[str, Any]:
+    return {
+        "chart_type": "bar",
+        "title": f"{num_col} by {cat_col}",
+        "x_axis": cat_col,
+        "y_axis": num_col,
+        "aggregation": "sum",
+        "reasoning": f"Bar charts effectively compare {num_col} across {unique_values} categories."
+    }
+
+
+def _scatter_suggestion(col1: str, col2: str) -> dict[str, Any]:
+    return {
+        "chart_type": "scatter",
+        "title": f"{col1} vs {col2}",
+        "x_axis": col1,
+        "y_axis": col2,
+        "reasoning": f"Scatter plots reveal relationships between {col1} and {col2}."
+    }
+
+
+def _histogram_suggestion(num_col: str) -> dict[str, Any]:
+    return {
+        "chart_type": "bar",  # Using bar chart for distribution
+        "title": f"Distribution of {num_col}",
+        "x_axis": num_col,
+        "y_axis": "count",
+        "aggregation": "count",
+        "reasoning": f"Shows the distribution of values in {num_col}."
+    }
+
+
+def _pie_suggestion(cat_col: str, unique_values: int) -> dict[str, Any]:
+    return {
+        "chart_type": "pie",
+        "title": f"Composition by {cat_col}",
+        "values_column": cat_col,
+        "labels_column": cat_col,
+        "reasoning": f"Pie chart shows proportions across {unique_values} categories."
+    }
+
+
+def _area_suggestion(datetime_col: str, num_col: str) -> dict[str, Any]:
+    return {
+        "chart_type": "area",
+        "title": f"Cumulative {num_col}",
+        "x_axis": datetime_col,
+        "y_axis": num_col,
+        "aggregation": "sum",
+        "reasoning": "Area charts emphasize magnitude and cumulative values over time."
+    }
+
+
+# Rule candidates are kept as (priority, -confidence, seq, kind, args) tuples and
+# only turned into dicts for the suggestions actually returned
+_TUPLE_TO_DICT = {
+    "line": _line_suggestion,
+    "bar": _bar_suggestion,
+    "scatter": _scatter_suggestion,
+    "histogram": _histogram_suggestion,
+    "pie": _pie_suggestion,
+    "area": _area_suggestion
+}
+
+
+def _materialize_suggestion(candidate: tuple) -> dict[str, Any]:
+    priority, neg_confidence, _, kind, args = candidate
+    suggestion = _TUPLE_TO_DICT[kind](*args)
+    suggestion["confidence"] = -neg_confidence
+    suggestion["priority"] = priority
+    return suggestion
+
+
+def _dataset_fingerprint(dataset: Row) -> str:
+    """Hash a dataset's version and schema; changes whenever either is edited."""
+    updated_at = dataset.updated_at.isoformat() if dataset.updated_at else ""
+    schema_json = json.dumps(dataset.schema_info, sort_keys=True, default=str)
+    return blake2b(f"{updated_at}|{schema_json}".encode(), digest_size=16).hexdigest()
+
+
+def _summary_fingerprint(summary: dict[str, Any]) -> tuple:
+    """Build a cheap hashable fingerprint of the summary fields the rules read."""
+    columns_info = summary.get("columns", {})
+    return (
+        summary.get("column_count", 0),
+        summary.get("row_count", 0),
+        tuple(summary.get("numeric_columns", [])),
+        tuple(summary.get("categorical_columns", [])),
+        tuple(
+            (name, info.get("type"), info.get("stats", {}).get("unique_values", 0))
+            for name, info in columns_info.items()
+        )
+    )
+
 
+@dataclass(slots=True, weakref_slot=True)
 class ChartSuggesterService:
     """
     Service for suggesting appropriate visualizations.
 
     Combines rule-based heuristics with optional AI enhancement to
     recommend the best charts for datasets and user questions.
+
+    Attributes:
+        db: Database session
+        llm_client: Optional LLM client for AI-powered suggestions
+        suggestion_max_tokens: Token cap for question-based chart suggestions
+        enhancement_max_tokens: Token cap for AI review of rule-based suggestions
+        ai_skip_confidence: Minimum rule confidence at which AI enhancement is skipped
     """
 
-    def __init__(self, db: AsyncSession, llm_client: Optional[LLMClient] = None):
-        """
-        Initialize chart suggester.
+    db: AsyncSession
+    llm_client: Optional[LLMClient] = None
+    suggestion_max_tokens: int = 256
+    enhancement_max_tokens: int = 256
+    ai_skip_confidence: float = 0.85
+    summary_service: SummaryService = field(init=False)
 
-        Args:
-            db: Database session
-            llm_client: Optional LLM client for AI-powered suggestions
-        """
-        self.db = db
-        self.llm_client = llm_client or get_llm_client()
-        self.summary_service = SummaryService(db)
+    def __post_init__(self):
+        if self.llm_client is None:
+            self.llm_client = get_llm_client()
+        self.summary_service = SummaryService(self.db)
 
     async def suggest_visualizations(
         self,
@@ -65,15 +270,23 @@ class ChartSuggesterService:
         logger.info(f"Generating chart suggestions for dataset {dataset_id}")
 
         # Get dataset
-        dataset = await self.db.get(Dataset, dataset_id)
-        if not dataset:
-            raise ValueError(f"Dataset {dataset_id} not found")
+        dataset = await self._get_dataset_fields(dataset_id)
 
-        # Get dataset summary
-        summary = await self.summary_service.generate_dataset_summary(dataset_id)
+        # Rules only need column names, types and cardinality, which are
+        # already on the dataset row. The full (query-heavy) summary is only
+        # needed when the AI prompt is built.
+        if use_ai:
+            summary = await self.summary_service.generate_dataset_summary(dataset_id)
+        else:
+            summary = self.summary_service.get_schema_projection(dataset)
 
         # Generate rule-based suggestions
-        suggestions = self._generate_rule_based_suggestions(summary, dataset)
+        suggestions = self._generate_rule_based_suggestions(summary, dataset, max_suggestions)
+
+        # Nothing for the AI to add when the suggestion set is already obvious
+        if use_ai and suggestions and self._is_confident_enough(summary, suggestions[:max_suggestions]):
+            logger.debug(f"Skipping AI enhancement for dataset {dataset_id}: rule confidence is high")
+            return suggestions[:max_suggestions]
 
         # Optionally enhance with AI
         if use_ai and suggestions:
@@ -85,6 +298,69 @@ class ChartSuggesterService:
         # Limit results
         return suggestions[:max_suggestions]
 
+    async def enqueue_suggestions(
+        self,
+        dataset_id: UUID,
+        use_ai: bool = False,
+        max_suggestions: int = 5
+    ) -> str:
+        """
+        Queue suggestion generation on a background worker.
+
+        The worker runs the same pipeline as ``suggest_visualizations`` and
+        writes its progress to Redis, so the HTTP request returns before any
+        LLM call is made. Rule-based suggestions are stored as soon as they
+        are ready; AI enhancement is added to the same record when it finishes.
+
+        Args:
+            dataset_id: Dataset UUID
+            use_ai: Whether to enhance suggestions with AI
+            max_suggestions: Maximum number of suggestions to return
+
+        Returns:
+            Job ID to pass to ``get_suggestions``
+        """
+        job_id = str(uuid4())
+
+        # Seed the record so polling before the worker picks the job up
+        # reports "pending" rather than "not found"
+        redis = get_redis_client()
+        await redis.setex(
+            f"{SUGGESTION_JOB_KEY_PREFIX}:{job_id}",
+            SUGGESTION_JOB_TTL,
+            json.dumps({
+                "job_id": job_id,
+                "dataset_id": str(dataset_id),
+                "status": "pending",
+                "suggestions": []
+            })
+        )
+
+        celery_app.send_task(
+            SUGGESTION_TASK_NAME,
+            args=[str(dataset_id), use_ai, max_suggestions],
+            task_id=job_id
+        )
+
+        logger.info(f"Queued chart suggestion job {job_id} for dataset {dataset_id}")
+        return job_id
+
+    @staticmethod
+    async def get_suggestions(job_id: str) -> Optional[dict[str, Any]]:
+        """
+        Get the current state of a background suggestion job.
+
+        Args:
+            job_id: Job ID returned by ``enqueue_suggestions``
+
+        Returns:
+            Job record with ``status`` ("pending", "partial", "completed" or
+            "failed") and ``suggestions``, or None if unknown or expired
+        """
+        redis = get_redis_client()
+        data = await redis.get(f"{SUGGESTION_JOB_KEY_PREFIX}:{job_id}")
+        return json.loads(data) if data else None
+
     async def suggest_chart_for_question(
         self,
         dataset_id: UUID,
@@ -105,50 +381,32 @@ class ChartSuggesterService:
         logger.info(f"Suggesting chart for question: {question}")
 
         # Get dataset
-        dataset = await self.db.get(Dataset, dataset_id)
-        if not dataset:
-            raise ValueError(f"Dataset {dataset_id} not found")
+        dataset = await self._get_dataset_fields(dataset_id)
 
         # Get schema info
-        schema_info = dataset.schema_info or {}
-        columns = schema_info.get("columns", [])
-
-        # Determine column types
-        column_types = {
-            col["name"]: col.get("type", "unknown")
-            for col in columns
-        }
+        projection = self._get_schema_projection(dataset)
+        columns = projection.columns
 
         # Build AI prompt
-        prompt = CHART_SUGGESTION_PROMPT.format(
-            schema=format_schema(columns),
-            column_types="\n".join([f"  - {name}: {type_}" for name, type_ in column_types.items()]),
+        prompt = CHART_SUGGESTION_PROMPT.render(
+            schema=projection.schema_str,
+            column_types=projection.column_types_str,
             user_question=question,
-            available_columns=format_column_list(columns)
+            available_columns=projection.available_columns_str
         )
 
         try:
             # Get suggestion from AI
-            schema = {
-                "type": "object",
-                "properties": {
-                    "chart_type": {"type": "string"},
-                    "x_axis": {"type": "string"},
-                    "y_axis": {"type": "string"},
-                    "grouping": {"type": "string"},
-                    "aggregation": {"type": "string"},
-                    "reasoning": {"type": "string"},
-                    "alternative_charts": {"type": "array"},
-                    "confidence": {"type": "number"}
-                }
-            }
-
             suggestion = await self.llm_client.generate_structured_output(
                 prompt=prompt,
-                schema=schema,
+                schema=_SUGGESTION_SCHEMA,
                 system_prompt=SYSTEM_PROMPTS["data_analyst"],
-                max_tokens=800,
-                temperature=0.7
+                max_tokens=self.suggestion_max_tokens,
+                temperature=0.0
+            )
+            logger.info(
+                f"Chart suggestion response length: {len(json.dumps(suggestion))} chars "
+                f"(max_tokens={self.suggestion_max_tokens})"
             )
 
             # Add dataset info
@@ -162,139 +420,276 @@ class ChartSuggesterService:
             # Fallback to basic suggestion
             return self._generate_fallback_suggestion(question, columns)
 
+    async def _get_dataset_fields(self, dataset_id: UUID) -> Row:
+        """
+        Load only the dataset columns the suggester reads.
+
+        Read-only projection: avoids hydrating a full ORM instance and
+        registering it with the session.
+        """
+        result = await self.db.execute(
+            select(
+                Dataset.id,
+                Dataset.name,
+                Dataset.row_count,
+                Dataset.schema_info,
+                Dataset.updated_at
+            ).where(Dataset.id == dataset_id)
+        )
+        row = result.first()
+        if row is None:
+            raise ValueError(f"Dataset {dataset_id} not found")
+        return row
+
+    def _get_schema_projection(self, dataset: Row) -> SchemaProjection:
+        """Parse dataset.schema_info once per dataset version and cache the result."""
+        cache_key = (dataset.id, _dataset_fingerprint(dataset))
+        cached = _schema_projection_cache.get(cache_key)
+        if cached is not None:
+            _schema_projection_cache.move_to_end(cache_key)
+            return cached
+
+        columns = (dataset.schema_info or {}).get("columns", [])
+
+        numeric, categorical, datetime_cols = [], [], []
+        for col in columns:
+            col_type = col.get("type")
+            if col_type == "numeric":
+                numeric.append(col["name"])
+            elif col_type == "categorical":
+                categorical.append(col["name"])
+            elif col_type in ("date", "datetime", "timestamp"):
+                datetime_cols.append(col["name"])
+
+        column_key = schema_key(columns)
+        projection = SchemaProjection(
+            columns=columns,
+            numeric=tuple(numeric),
+            categorical=tuple(categorical),
+            datetime=tuple(datetime_cols),
+            column_types_str="\n".join(f"  - {col['name']}: {col.get('type', 'unknown')}" for col in columns),
+            schema_str=format_schema(column_key),
+            available_columns_str=format_column_list(column_key)
+        )
+
+        _schema_projection_cache[cache_key] = projection
+        if len(_schema_projection_cache) > _SCHEMA_PROJECTION_CACHE_MAXSIZE:
+            _schema_projection_cache.popitem(last=False)
+
+        return projection
+
     def _generate_rule_based_suggestions(
         self,
         summary: dict[str, Any],
-        dataset: Dataset
+        dataset: Row,
+        max_suggestions: int = 5
     ) -> list[dict[str, Any]]:
-        """Generate chart suggestions using rule-based heuristics."""
-        suggestions = []
+        """Generate the top chart suggestions using rule-based heuristics."""
+        fingerprint = _summary_fingerprint(summary)
+        candidates = _rules_cache.get(fingerprint)
+        if candidates is not None:
+            _rules_cache.move_to_end(fingerprint)
+        else:
+            candidates = self._rank_rule_candidates(summary)
+            _rules_cache[fingerprint] = candidates
+            if len(_rules_cache) > _RULES_CACHE_MAXSIZE:
+                _rules_cache.popitem(last=False)
+
+        # Fresh dicts on every call, so callers can mutate them freely
+        return [_materialize_suggestion(c) for c in candidates[:max_suggestions]]
+
+    def _rank_rule_candidates(self, summary: dict[str, Any]) -> list[tuple]:
+        """Run the chart rules and return candidates sorted by priority and confidence."""
+        candidates = []
         columns_info = summary.get("columns", {})
         numeric_columns = summary.get("numeric_columns", [])
         categorical_columns = summary.get("categorical_columns", [])
 
-        # Identify date/time columns
-        datetime_columns = [
-            col_name for col_name, col_info in columns_info.items()
-            if col_info.get("type") in ["date", "datetime", "timestamp"]
-        ]
+        def emit(priority: int, confidence: float, kind: str, *args):
+            # seq keeps ties in emission order, matching a stable sort
+            candidates.append((priority, -confidence, len(candidates), kind, args))
+
+        # Single pass over the columns: classify date/time columns and cache
+        # each column's cardinality for the categorical rules below
+        datetime_columns = []
+        unique_values_by_col = {}
+        for col_name, col_info in columns_info.items():
+            if col_info.get("type") in ("date", "datetime", "timestamp"):
+                datetime_columns.append(col_name)
+            unique_values_by_col[col_name] = col_info.get("stats", {}).get("unique_values", 0)
+
+        top_numeric = numeric_columns[:2]
+        datetime_col = datetime_columns[0] if datetime_columns else None
 
         # Rule 1: Time-series line chart
         if datetime_columns and numeric_columns:
-            for datetime_col in datetime_columns[:1]:  # Take first datetime column
-                for num_col in numeric_columns[:2]:  # Top 2 numeric columns
-                    suggestions.append({
-                        "chart_type": "line",
-                        "title": f"{num_col} Over Time",
-                        "x_axis": datetime_col,
-                        "y_axis": num_col,
-                        "aggregation": "avg",
-                        "reasoning": "Time-series data is best visualized with line charts to show trends.",
-                        "confidence": 0.9,
-                        "priority": 1
-                    })
-
-        # Rule 2: Categorical + Numeric = Bar chart
+            for num_col in top_numeric:
+                emit(1, 0.9, "line", datetime_col, num_col)
+
+        # Rule 2: Categorical + Numeric = Bar chart (reasonable number of categories only)
         if categorical_columns and numeric_columns:
             for cat_col in categorical_columns[:2]:
-                # Check cardinality
-                col_info = columns_info.get(cat_col, {})
-                unique_values = col_info.get("stats", {}).get("unique_values", 0)
-
-                # Only suggest if reasonable number of categories
-                if unique_values > 0 and unique_values <= 20:
-                    for num_col in numeric_columns[:2]:
-                        suggestions.append({
-                            "chart_type": "bar",
-                            "title": f"{num_col} by {cat_col}",
-                            "x_axis": cat_col,
-                            "y_axis": num_col,
-                            "aggregation": "sum",
-                            "reasoning": f"Bar charts effectively compare {num_col} across {unique_values} categories.",
-                            "confidence": 0.85,
-                            "priority": 2
-                        })
+                unique_values = unique_values_by_col.get(cat_col, 0)
+                if 0 < unique_values <= 20:
+                    for num_col in top_numeric:
+                        emit(2, 0.85, "bar", cat_col, num_col, unique_values)
 
         # Rule 3: Two numeric columns = Scatter plot
         if len(numeric_columns) >= 2:
-            # Take the first two numeric columns
-            col1, col2 = numeric_columns[0], numeric_columns[1]
-            suggestions.append({
-                "chart_type": "scatter",
-                "title": f"{col1} vs {col2}",
-                "x_axis": col1,
-                "y_axis": col2,
-                "reasoning": f"Scatter plots reveal relationships between {col1} and {col2}.",
-                "confidence": 0.8,
-                "priority": 3
-            })
+            emit(3, 0.8, "scatter", numeric_columns[0], numeric_columns[1])
 
         # Rule 4: Single numeric column = Histogram (distribution)
         if numeric_columns:
-            for num_col in numeric_columns[:1]:
-                suggestions.append({
-                    "chart_type": "bar",  # Using bar chart for distribution
-                    "title": f"Distribution of {num_col}",
-                    "x_axis": num_col,
-                    "y_axis": "count",
-                    "aggregation": "count",
-                    "reasoning": f"Shows the distribution of values in {num_col}.",
-                    "confidence": 0.75,
-                    "priority": 4
-                })
-
-        # Rule 5: Categorical column for composition = Pie chart
+            emit(4, 0.75, "histogram", numeric_columns[0])
+
+        # Rule 5: Categorical column for composition = Pie chart (3-10 categories)
         if categorical_columns:
-            for cat_col in categorical_columns[:1]:
-                col_info = columns_info.get(cat_col, {})
-                unique_values = col_info.get("stats", {}).get("unique_values", 0)
-
-                # Pie charts work best with 3-7 categories
-                if 3 <= unique_values <= 10:
-                    suggestions.append({
-                        "chart_type": "pie",
-                        "title": f"Composition by {cat_col}",
-                        "values_column": cat_col,
-                        "labels_column": cat_col,
-                        "reasoning": f"Pie chart shows proportions across {unique_values} categories.",
-                        "confidence": 0.7,
-                        "priority": 5
-                    })
+            cat_col = categorical_columns[0]
+            unique_values = unique_values_by_col.get(cat_col, 0)
+            if 3 <= unique_values <= 10:
+                emit(5, 0.7, "pie", cat_col, unique_values)
 
         # Rule 6: Time-series + area chart (for cumulative)
         if datetime_columns and numeric_columns:
-            for datetime_col in datetime_columns[:1]:
-                for num_col in numeric_columns[:1]:
-                    suggestions.append({
-                        "chart_type": "area",
-                        "title": f"Cumulative {num_col}",
-                        "x_axis": datetime_col,
-                        "y_axis": num_col,
-                        "aggregation": "sum",
-                        "reasoning": "Area charts emphasize magnitude and cumulative values over time.",
-                        "confidence": 0.75,
-                        "priority": 6
-                    })
+            emit(6, 0.75, "area", datetime_col, numeric_columns[0])
 
         # Sort by priority and confidence
-        suggestions.sort(key=lambda x: (x.get("priority", 999), -x.get("confidence", 0)))
+        candidates.sort()
+        return candidates
+
+    def _is_confident_enough(
+        self,
+        summary: dict[str, Any],
+        suggestions: list[dict[str, Any]]
+    ) -> bool:
+        """Check whether rule-based suggestions are confident enough to skip AI enhancement."""
+        if not all(s.get("confidence", 0) >= self.ai_skip_confidence for s in suggestions):
+            return False
+
+        datetime_count = sum(
+            1 for col_info in summary.get("columns", {}).values()
+            if col_info.get("type") in ("date", "datetime", "timestamp")
+        )
+        column_count = (
+            datetime_count
+            + len(summary.get("numeric_columns", []))
+            + len(summary.get("categorical_columns", []))
+        )
+        return column_count <= _AI_SKIP_MAX_COLUMNS
+
+    async def stream_visualizations(
+        self,
+        dataset_id: UUID,
+        use_ai: bool = False,
+        max_suggestions: int = 5
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream visualization suggestions for a dataset.
+
+        Rule-based suggestions are emitted immediately; when AI enhancement
+        runs, the re-ranked list follows once the LLM responds. Closing or
+        cancelling the generator after the first event abandons the LLM call.
+
+        Args:
+            dataset_id: Dataset UUID
+            use_ai: Whether to enhance suggestions with AI
+            max_suggestions: Maximum number of suggestions to return
+
+        Yields:
+            {"type": "suggestions", "suggestions": [...]} first, then
+            {"type": "ai_suggestions", "suggestions": [...]} if AI ran
+        """
+        logger.info(f"Streaming chart suggestions for dataset {dataset_id}")
+
+        dataset = await self._get_dataset_fields(dataset_id)
+
+        if use_ai:
+            summary = await self.summary_service.generate_dataset_summary(dataset_id)
+        else:
+            summary = self.summary_service.get_schema_projection(dataset)
 
-        return suggestions
+        suggestions = self._generate_rule_based_suggestions(summary, dataset, max_suggestions)
+        yield {"type": "suggestions", "suggestions": suggestions}
+
+        if not use_ai or not suggestions or self._is_confident_enough(summary, suggestions):
+            return
+
+        try:
+            suggestions = await self._enhance_with_ai(dataset, summary, suggestions)
+        except Exception as e:
+            logger.warning(f"AI enhancement failed: {e}")
+            return
+
+        yield {"type": "ai_suggestions", "suggestions": suggestions}
 
     async def _enhance_with_ai(
         self,
-        dataset: Dataset,
+        dataset: Row,
         summary: dict[str, Any],
         suggestions: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """Enhance suggestions with AI analysis."""
-        # Build prompt with existing suggestions
+        """Re-rank suggestions and refine their titles with AI."""
+        prompt = self._build_enhancement_prompt(dataset, summary, suggestions)
+
+        review = await self.llm_client.generate_structured_output(
+            prompt=prompt,
+            schema=_ENHANCEMENT_SCHEMA,
+            system_prompt=SYSTEM_PROMPTS["data_analyst"],
+            max_tokens=self.enhancement_max_tokens,
+            temperature=0.0
+        )
+        logger.info(
+            f"Chart enhancement response length: {len(json.dumps(review))} chars "
+            f"(max_tokens={self.enhancement_max_tokens})"
+        )
+
+        return self._apply_enhancement(suggestions, review)
+
+    @staticmethod
+    def _apply_enhancement(
+        suggestions: list[dict[str, Any]],
+        review: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Apply an AI review to the suggestion list.
+
+        Reviewed suggestions are numbered from 1 as in the prompt. Invalid or
+        duplicate numbers are ignored, and any suggestion the model left out
+        keeps its relative position after the ranked ones.
+        """
+        reviewed = len(suggestions[:_ENHANCEMENT_MAX_REVIEWED])
+
+        order: list[int] = []
+        for number in review.get("reordering") or []:
+            if isinstance(number, int) and 1 <= number <= reviewed and number - 1 not in order:
+                order.append(number - 1)
+        order.extend(i for i in range(len(suggestions)) if i not in order)
+
+        titles = review.get("improved_titles") or {}
+        enhanced = []
+        for rank, index in enumerate(order, start=1):
+            suggestion = dict(suggestions[index])
+            title = titles.get(str(index + 1)) if isinstance(titles, dict) else None
+            if isinstance(title, str) and title.strip():
+                suggestion["title"] = title.strip()
+            suggestion["priority"] = rank
+            enhanced.append(suggestion)
+
+        return enhanced
+
+    def _build_enhancement_prompt(
+        self,
+        dataset: Row,
+        summary: dict[str, Any],
+        suggestions: list[dict[str, Any]]
+    ) -> str:
+        """Build the prompt asking the LLM to review rule-based suggestions."""
         suggestions_text = "\n".join([
             f"{i+1}. {s['chart_type']}: {s['title']} (confidence: {s['confidence']})"
-            for i, s in enumerate(suggestions[:5])
+            for i, s in enumerate(suggestions[:_ENHANCEMENT_MAX_REVIEWED])
         ])
 
-        prompt = f"""Review and enhance these visualization suggestions for a dataset.
+        return f"""Review these visualization suggestions for a dataset.
 
 Dataset: {dataset.name}
 Rows: {summary.get('row_count', 0):,}
@@ -307,29 +702,8 @@ Numeric columns: {', '.join(summary.get('numeric_columns', []))}
 Categorical columns: {', '.join(summary.get('categorical_columns', []))}
 
 Please:
-1. Validate the suggestions
-2. Improve the reasoning/titles where needed
-3. Suggest any additional interesting visualizations
-4. Rank by usefulness
-
-Keep the same format but enhance the descriptions."""
-
-        try:
-            enhancement = await self.llm_client.generate_completion(
-                prompt=prompt,
-                system_prompt=SYSTEM_PROMPTS["data_analyst"],
-                max_tokens=1000,
-                temperature=0.7
-            )
-
-            # For now, just add AI feedback to first suggestion
-            if suggestions:
-                suggestions[0]["ai_enhancement"] = enhancement
-
-        except Exception as e:
-            logger.warning(f"AI enhancement failed: {e}")
-
-        return suggestions
+1. Rank the suggestions by usefulness, listing their numbers in "reordering"
+2. Give a clearer title where needed in "improved_titles", keyed by suggestion number"""
 
     def _generate_fallback_suggestion(
         self,
@@ -337,33 +711,20 @@ Keep the same format but enhance the descriptions."""
         columns: list[dict[str, Any]]
     ) -> dict[str, Any]:
         """Generate a basic suggestion when AI fails."""
-        # Simple intent detection
-        question_lower = question.lower()
-
-        # Look for keywords
-        if any(word in question_lower for word in ["trend", "over time", "change", "growth"]):
-            intent = "trend"
-            suggested_chart = "line"
-        elif any(word in question_lower for word in ["compare", "versus", "vs", "difference"]):
-            intent = "comparison"
-            suggested_chart = "bar"
-        elif any(word in question_lower for word in ["relationship", "correlation", "related"]):
-            intent = "relationship"
-            suggested_chart = "scatter"
-        elif any(word in question_lower for word in ["distribution", "spread", "range"]):
-            intent = "distribution"
-            suggested_chart = "bar"
-        elif any(word in question_lower for word in ["composition", "breakdown", "proportion"]):
-            intent = "composition"
-            suggested_chart = "pie"
-        else:
-            intent = "general"
-            suggested_chart = "bar"
-
-        # Pick first suitable columns
-        numeric_cols = [c for c in columns if c.get("type") == "numeric"]
-        categorical_cols = [c for c in columns if c.get("type") == "categorical"]
-        datetime_cols = [c for c in columns if c.get("type") in ["date", "datetime"]]
+        intent_info = self.classify_visualization_intent(question)
+        intent = intent_info["primary_intent"]
+        suggested_chart = intent_info["recommended_charts"][0]
+
+        # Bucket columns by type in a single pass
+        numeric_cols, categorical_cols, datetime_cols = [], [], []
+        for c in columns:
+            col_type = c.get("type")
+            if col_type == "numeric":
+                numeric_cols.append(c)
+            elif col_type == "categorical":
+                categorical_cols.append(c)
+            elif col_type in ("date", "datetime"):
+                datetime_cols.append(c)
 
         x_axis = None
         y_axis = None
@@ -387,7 +748,8 @@ Keep the same format but enhance the descriptions."""
             "fallback": True
         }
 
-    def classify_visualization_intent(self, question: str) -> dict[str, Any]:
+    @staticmethod
+    def classify_visualization_intent(question: str) -> dict[str, Any]:
         """
         Classify user's visualization intent from question.
 
@@ -399,41 +761,34 @@ Keep the same format but enhance the descriptions."""
         """
         question_lower = question.lower()
 
-        intents = {
-            "trend": ["trend", "over time", "change", "growth", "decline", "historical"],
-            "comparison": ["compare", "versus", "vs", "difference", "better", "worse"],
-            "relationship": ["relationship", "correlation", "related", "connected", "association"],
-            "distribution": ["distribution", "spread", "range", "variance", "outliers"],
-            "composition": ["composition", "breakdown", "proportion", "percentage", "share"],
-            "ranking": ["top", "bottom", "highest", "lowest", "rank", "best", "worst"]
-        }
+        if not _ALL_KEYWORDS_PATTERN.search(question_lower):
+            return {
+                "primary_intent": "general",
+                "all_intents": [],
+                "recommended_charts": list(_INTENT_TO_CHARTS["general"]),
+                "confidence": 0.5
+            }
 
-        detected_intents = []
-        for intent_type, keywords in intents.items():
-            if any(keyword in question_lower for keyword in keywords):
-                detected_intents.append(intent_type)
+        detected_intents = [
+            intent_type for intent_type, keywords in _INTENTS.items()
+            if any(keyword in question_lower for keyword in keywords)
+        ]
 
         primary_intent = detected_intents[0] if detected_intents else "general"
 
-        # Map intent to recommended chart types
-        intent_to_charts = {
-            "trend": ["line", "area"],
-            "comparison": ["bar", "line"],
-            "relationship": ["scatter", "heatmap"],
-            "distribution": ["bar", "area"],
-            "composition": ["pie", "doughnut", "bar"],
-            "ranking": ["bar"],
-            "general": ["bar", "line"]
-        }
-
         return {
             "primary_intent": primary_intent,
             "all_intents": detected_intents,
-            "recommended_charts": intent_to_charts.get(primary_intent, ["bar"]),
+            "recommended_charts": list(_INTENT_TO_CHARTS.get(primary_intent, ("bar",))),
             "confidence": 0.8 if detected_intents else 0.5
         }
 
 
+# One service per session: repeated lookups within a request share an instance,
+# which is dropped as soon as the request releases it
+_suggesters: "weakref.WeakValueDictionary[int, ChartSuggesterService]" = weakref.WeakValueDictionary()
+
+
 # Factory function
 async def get_chart_suggester(db: AsyncSession) -> ChartSuggesterService:
     """
@@ -443,6 +798,12 @@ async def get_chart_suggester(db: AsyncSession) -> ChartSuggesterService:
         db: Database session
 
     Returns:
-        ChartSuggesterService instance
+        ChartSuggesterService instance shared by all callers using ``db``
     """
-    return ChartSuggesterService(db)
+    # The cached service holds a strong reference to db, so its id can't be
+    # reused by another session while the entry is alive
+    suggester = _suggesters.get(id(db))
+    if suggester is None or suggester.db is not db:
+        suggester = ChartSuggesterService(db)
+        _suggesters[id(db)] = suggester
+    return suggester
@@ -3,25 +3,245 @@ LLM Client for AI-powered insights and completions.
 
 Provides a unified interface for multiple LLM providers (Anthropic Claude, OpenAI GPT)
 with retry logic, rate limiting, and structured output support.
+
+The client is entirely network-bound and runs best on uvloop. Uvicorn already
+uses it for the API when installed; processes that start their own loops
+(e.g. Celery tasks using asyncio.run) should call install_uvloop() first.
 """
 
 import asyncio
+import atexit
 import json
 import time
 import logging
-from typing import Any, Optional, Literal
+import os
+import queue
+import random
+import re
+import weakref
+from collections import Counter, OrderedDict, defaultdict
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Literal
 from enum import Enum
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timezone
 
-from anthropic import AsyncAnthropic, APIError as AnthropicAPIError
-from openai import AsyncOpenAI, APIError as OpenAIAPIError
+import httpx
+import orjson
 
 from app.core.config import settings
+from app.services.llm.cache import close_cache_redis_client, make_cache_key, response_cache
+from app.services.llm.throttle import get_provider_bucket, get_provider_semaphore, set_provider_concurrency
 
 
 logger = logging.getLogger(__name__)
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _RootForwardingHandler(logging.Handler):
+    """Hand queued records to the root logger's handlers (console, files, ...)."""
+
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger().handle(record)
+
+
+# Per-call API logs are formatted and written on a background thread so the
+# request coroutine only pays for a queue put
+_api_call_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_api_call_logger = logging.getLogger(f"{__name__}.api_calls")
+_api_call_logger.addHandler(_DeferredQueueHandler(_api_call_log_queue))
+_api_call_logger.propagate = False
+
+_api_call_log_listener: Optional[QueueListener] = None
+_api_call_log_listener_pid: Optional[int] = None
+
+
+def _ensure_api_call_log_listener():
+    """Start the log listener thread in this process (threads don't survive fork)."""
+    global _api_call_log_listener, _api_call_log_listener_pid
+    if _api_call_log_listener_pid == os.getpid():
+        return
+
+    _api_call_log_listener = QueueListener(_api_call_log_queue, _RootForwardingHandler())
+    _api_call_log_listener.start()
+    _api_call_log_listener_pid = os.getpid()
+    atexit.register(_api_call_log_listener.stop)
+
+# Connection pool limits for the HTTP client shared by all provider SDK clients
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+
+
+# Upper bound for a single retry backoff, in seconds
+_MAX_RETRY_DELAY = 30.0
+
+
+def _is_throttling_error(error: Exception) -> bool:
+    """Whether a provider error signals overload (429 or 5xx) rather than a bad request."""
+    status_code = getattr(error, "status_code", None)
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Whether a provider error is transient: overload, or a connection error/timeout (no status)."""
+    return getattr(error, "status_code", None) is None or _is_throttling_error(error)
+
+
+# Rendered schema instructions, keyed by id(schema). Entries keep a reference
+# to their schema so an id can't be reused by a different dict while cached.
+_SCHEMA_INSTRUCTION_CACHE_MAXSIZE = 128
+_schema_instruction_cache: "OrderedDict[int, tuple[dict[str, Any], str]]" = OrderedDict()
+
+
+def _with_schema_instruction(system_prompt: Optional[str], schema: dict[str, Any]) -> str:
+    """Append the JSON schema instruction used for structured output to a system prompt."""
+    key = id(schema)
+    cached = _schema_instruction_cache.get(key)
+    if cached is not None and cached[0] is schema:
+        _schema_instruction_cache.move_to_end(key)
+        schema_instruction = cached[1]
+    else:
+        # Compact separators roughly halve the schema's prompt tokens
+        schema_instruction = (
+            "\n\nYou must respond with valid JSON matching this schema:\n"
+            + orjson.dumps(schema).decode()
+        )
+        _schema_instruction_cache[key] = (schema, schema_instruction)
+        if len(_schema_instruction_cache) > _SCHEMA_INSTRUCTION_CACHE_MAXSIZE:
+            _schema_instruction_cache.popitem(last=False)
+
+    return (system_prompt or "") + schema_instruction
+
+
+# Non-object schemas are wrapped in {"result": ...} for native structured output
+_WRAPPED_RESULT_KEY = "result"
+
+# OpenAI model families with schema-constrained output, and with JSON mode only
+_OPENAI_JSON_SCHEMA_MODELS = ("gpt-4o",)
+_OPENAI_JSON_MODE_MODELS = ("gpt-4-turbo", "gpt-4-1106", "gpt-4-0125", "gpt-3.5-turbo")
+
+# Tool Anthropic is forced to call to emit structured output (input_schema is
+# filled in per request)
+_ANTHROPIC_OUTPUT_TOOL = "emit_output"
+_ANTHROPIC_OUTPUT_TOOL_SPEC = {
+    "name": _ANTHROPIC_OUTPUT_TOOL,
+    "description": "Return the response as structured data."
+}
+_ANTHROPIC_OUTPUT_TOOL_CHOICE = {"type": "tool", "name": _ANTHROPIC_OUTPUT_TOOL}
+
+_OPENAI_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+
+def _as_object_schema(schema: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+    """
+    Return a schema with an object root, wrapping the given schema if needed.
+
+    Returns:
+        (object schema, whether the original was wrapped)
+    """
+    if schema.get("type") == "object":
+        return schema, False
+    return {
+        "type": "object",
+        "properties": {_WRAPPED_RESULT_KEY: schema},
+        "required": [_WRAPPED_RESULT_KEY]
+    }, True
+
+
+# Markdown code fence around a response; the closing fence may be missing
+_CODE_FENCE_PATTERN = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.S)
+
+
+def _strip_code_fence(response: str) -> str:
+    """Extract JSON from a markdown code block if the model wrapped it in one."""
+    match = _CODE_FENCE_PATTERN.match(response)
+    return match.group(1) if match else response.strip()
+
+
+class _IncrementalObjectParser:
+    """
+    Incremental parser for a streamed top-level JSON object.
+
+    Text is fed as it arrives; each top-level member is returned as soon as
+    its value is complete, without waiting for the closing brace. Any text
+    before the opening brace (e.g. a markdown fence) is ignored.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = -1  # -1 until the opening brace is seen
+        self.done = False
+
+    def feed(self, text: str) -> list[tuple[str, Any]]:
+        """
+        Add streamed text and return the members it completed.
+
+        Args:
+            text: Next chunk of model output
+
+        Returns:
+            (key, value) pairs completed by this chunk, in document order
+        """
+        self._buffer += text
+        members = []
+
+        if self._pos < 0:
+            start = self._buffer.find("{")
+            if start < 0:
+                return members
+            self._pos = start + 1
+
+        buffer = self._buffer
+        while not self.done:
+            pos = self._skip(buffer, self._pos, self._WHITESPACE + ",")
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "}":
+                self.done = True
+                break
+
+            try:
+                key, pos = self._decoder.raw_decode(buffer, pos)
+                pos = self._skip(buffer, pos, self._WHITESPACE)
+                if pos >= len(buffer):
+                    break
+                if buffer[pos] != ":":
+                    raise ValueError(f"Expected ':' after key {key!r} in streamed JSON")
+                pos = self._skip(buffer, pos + 1, self._WHITESPACE)
+                value, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # member not complete yet
+
+            # A number is only complete once a delimiter follows it ("1" may
+            # still become "1.5", "-1." isn't decodable as a whole yet)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if end >= len(buffer) or buffer[end] not in self._WHITESPACE + ",}":
+                    break
+
+            members.append((key, value))
+            self._pos = end
+
+        return members
+
+    @staticmethod
+    def _skip(buffer: str, pos: int, chars: str) -> int:
+        while pos < len(buffer) and buffer[pos] in chars:
+            pos += 1
+        return pos
+
+
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
     ANTHROPIC = "anthropic"
@@ -42,14 +262,65 @@ class LLMModel(str, Enum):
     GPT_35_TURBO = "gpt-3.5-turbo"
 
 
+# Prices as (input, output) micro-USD per 1M tokens
+PRICING_MICRO: dict[str, tuple[int, int]] = {
+    LLMModel.CLAUDE_3_5_SONNET.value: (3_000_000, 15_000_000),
+    LLMModel.CLAUDE_3_OPUS.value: (15_000_000, 75_000_000),
+    LLMModel.CLAUDE_3_SONNET.value: (3_000_000, 15_000_000),
+    LLMModel.CLAUDE_3_HAIKU.value: (250_000, 1_250_000),
+    LLMModel.GPT_4_TURBO.value: (10_000_000, 30_000_000),
+    LLMModel.GPT_4.value: (30_000_000, 60_000_000),
+    LLMModel.GPT_35_TURBO.value: (500_000, 1_500_000),
+}
+
+# Context window sizes in tokens
+CONTEXT_WINDOWS: dict[str, int] = {
+    LLMModel.CLAUDE_3_5_SONNET.value: 200_000,
+    LLMModel.CLAUDE_3_OPUS.value: 200_000,
+    LLMModel.CLAUDE_3_SONNET.value: 200_000,
+    LLMModel.CLAUDE_3_HAIKU.value: 200_000,
+    LLMModel.GPT_4_TURBO.value: 128_000,
+    LLMModel.GPT_4.value: 8_192,
+    LLMModel.GPT_35_TURBO.value: 16_385,
+}
+
+# Tokens are rarely longer than this many characters, so dividing by it gives
+# a lower bound on the token count that won't reject prompts that would fit
+_MAX_CHARS_PER_TOKEN = 6
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap lower-bound estimate of the token count of a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated minimum number of tokens
+    """
+    return len(text) // _MAX_CHARS_PER_TOKEN
+
+
+# Process-wide usage per (provider, model): requests, input_tokens,
+# output_tokens and cost_micro (micro-USD per 1M tokens)
+_GLOBAL_USAGE: "defaultdict[tuple[str, str], Counter[str]]" = defaultdict(Counter)
+
+# Used for models missing from the table
+_DEFAULT_PRICING_MICRO: dict[LLMProvider, tuple[int, int]] = {
+    LLMProvider.ANTHROPIC: (3_000_000, 15_000_000),
+    LLMProvider.OPENAI: (30_000_000, 60_000_000),
+}
+
+
 class LLMClient:
     """
     Unified LLM client supporting multiple providers.
 
     Features:
     - Multi-provider support (Anthropic, OpenAI)
-    - Automatic retry with exponential backoff
-    - Rate limiting
+    - Automatic retry with jittered exponential backoff
+    - Adaptive per-model rate limiting
     - Structured JSON output
     - API call logging for debugging and cost tracking
     """
@@ -77,36 +348,84 @@ class LLMClient:
         # Determine provider
         if provider is None:
             provider = LLMProvider(settings.DEFAULT_LLM_PROVIDER)
-        self.provider = provider
+        # Normalize plain strings so identity checks against members hold
+        self.provider = LLMProvider(provider)
 
         # Get API key
         if api_key is None:
-            if self.provider == LLMProvider.ANTHROPIC:
+            if self.provider is LLMProvider.ANTHROPIC:
                 api_key = settings.ANTHROPIC_API_KEY
-            elif self.provider == LLMProvider.OPENAI:
+            elif self.provider is LLMProvider.OPENAI:
                 api_key = settings.OPENAI_API_KEY
 
         if not api_key:
             raise ValueError(f"API key not provided for {self.provider.value}")
 
-        # Initialize client
-        if self.provider == LLMProvider.ANTHROPIC:
-            self.client = AsyncAnthropic(api_key=api_key, timeout=timeout)
+        # Reuse the pooled HTTP client of the running loop so connections (and
+        # their TLS handshakes) are shared across client instances
+        http_client = _get_shared_http_client()
+        self._owns_http_client = http_client is None
+
+        # Initialize client. SDKs are imported here so a process only loads
+        # the provider it actually uses.
+        if self.provider is LLMProvider.ANTHROPIC:
+            from anthropic import AsyncAnthropic, APIError as AnthropicAPIError
+
+            self.client = AsyncAnthropic(api_key=api_key, timeout=timeout, http_client=http_client)
+            self._api_error = AnthropicAPIError
             self.model = model or LLMModel.CLAUDE_3_5_SONNET.value
-        elif self.provider == LLMProvider.OPENAI:
-            self.client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+        elif self.provider is LLMProvider.OPENAI:
+            from openai import AsyncOpenAI, APIError as OpenAIAPIError
+
+            self.client = AsyncOpenAI(api_key=api_key, timeout=timeout, http_client=http_client)
+            self._api_error = OpenAIAPIError
             self.model = model or LLMModel.GPT_4_TURBO.value
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
+        # Resolved once so the per-call paths skip Enum lookups and branching
+        self._provider_value: str = self.provider.value
+        self._is_anthropic: bool = self.provider is LLMProvider.ANTHROPIC
+        self._gen = (
+            self._generate_anthropic_completion if self._is_anthropic
+            else self._generate_openai_completion
+        )
+
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
 
-        # Statistics for logging
-        self.total_requests = 0
-        self.total_tokens = 0
-        self.total_cost = 0.0
+        # Per-token prices, resolved once
+        self._price_in, self._price_out = PRICING_MICRO.get(
+            self.model, _DEFAULT_PRICING_MICRO[self.provider]
+        )
+
+        # Usage statistics live in the process-wide per-model table
+        self._usage = _GLOBAL_USAGE[(self._provider_value, self.model)]
+
+    @property
+    def total_requests(self) -> int:
+        """Requests made to this provider/model in this process."""
+        return self._usage["requests"]
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens used on this provider/model in this process."""
+        return self._usage["input_tokens"] + self._usage["output_tokens"]
+
+    @property
+    def total_cost(self) -> float:
+        """Estimated spend in USD on this provider/model in this process."""
+        return self._usage["cost_micro"] / 1_000_000_000_000
+
+    def _record_usage(self, input_tokens: int = 0, output_tokens: int = 0):
+        """Count a completed request and its token usage."""
+        usage = self._usage
+        usage["requests"] += 1
+        usage["input_tokens"] += input_tokens
+        usage["output_tokens"] += output_tokens
+        # Integer micro-USD per 1M tokens, so the running total never drifts
+        usage["cost_micro"] += input_tokens * self._price_in + output_tokens * self._price_out
 
     async def generate_completion(
         self,
@@ -114,6 +433,7 @@ class LLMClient:
         system_prompt: Optional[str] = None,
         max_tokens: int = 2000,
         temperature: float = 0.7,
+        cache: Optional[bool] = None,
         **kwargs
     ) -> str:
         """
@@ -124,35 +444,47 @@ class LLMClient:
             system_prompt: Optional system prompt for context
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0-1)
+            cache: Serve/store the response via the shared response cache.
+                Defaults to on for deterministic (temperature 0) requests only.
             **kwargs: Additional provider-specific parameters
 
         Returns:
             Generated text response
         """
-        start_time = time.time()
+        if cache is None:
+            cache = temperature == 0
+
+        cache_key = None
+        if cache:
+            cache_key = make_cache_key(
+                provider=self._provider_value,
+                model=self.model,
+                system_prompt=system_prompt,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                params=kwargs
+            )
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM response cache hit ({self._provider_value}/{self.model})")
+                return cached
+
+        self._check_context_window(prompt, system_prompt, max_tokens)
+
+        start_time = time.perf_counter()
 
         try:
-            if self.provider == LLMProvider.ANTHROPIC:
-                response = await self._generate_anthropic_completion(
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    **kwargs
-                )
-            elif self.provider == LLMProvider.OPENAI:
-                response = await self._generate_openai_completion(
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    **kwargs
-                )
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
+            response = await self._gen(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs
+            )
 
             # Log the API call
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             self._log_api_call(
                 method="generate_completion",
                 prompt_length=len(prompt),
@@ -161,10 +493,13 @@ class LLMClient:
                 success=True
             )
 
+            if cache_key is not None:
+                await response_cache.set(cache_key, response)
+
             return response
 
         except Exception as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             self._log_api_call(
                 method="generate_completion",
                 prompt_length=len(prompt),
@@ -182,6 +517,7 @@ class LLMClient:
         system_prompt: Optional[str] = None,
         max_tokens: int = 2000,
         temperature: float = 0.7,
+        cache: Optional[bool] = None,
         **kwargs
     ) -> dict[str, Any]:
         """
@@ -193,16 +529,18 @@ class LLMClient:
             system_prompt: Optional system prompt for context
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0-1)
+            cache: Serve/store the response via the shared response cache
+                (see ``generate_completion``)
             **kwargs: Additional provider-specific parameters
 
         Returns:
             Parsed JSON object matching the schema
         """
-        # Add schema to system prompt
-        schema_instruction = f"\n\nYou must respond with valid JSON matching this schema:\n{json.dumps(schema, indent=2)}"
-        full_system_prompt = (system_prompt or "") + schema_instruction
+        full_system_prompt, output_schema, wrapped = self._prepare_structured_request(schema, system_prompt)
+        if output_schema is not None:
+            kwargs["output_schema"] = output_schema
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             response = await self.generate_completion(
@@ -210,23 +548,18 @@ class LLMClient:
                 system_prompt=full_system_prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,
+                cache=cache,
                 **kwargs
             )
 
-            # Parse JSON response
-            # Try to extract JSON from markdown code blocks if present
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            response = response.strip()
-
-            parsed_response = json.loads(response)
+            # Parse JSON response (only free-form output can arrive fenced)
+            if output_schema is None:
+                response = _strip_code_fence(response)
+            parsed_response = orjson.loads(response)
+            if wrapped:
+                parsed_response = parsed_response[_WRAPPED_RESULT_KEY]
 
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             self._log_api_call(
                 method="generate_structured_output",
                 prompt_length=len(prompt),
@@ -238,7 +571,7 @@ class LLMClient:
             return parsed_response
 
         except json.JSONDecodeError as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             logger.error(f"Failed to parse JSON response: {e}\nResponse: {response}")
             self._log_api_call(
                 method="generate_structured_output",
@@ -251,7 +584,7 @@ class LLMClient:
             raise ValueError(f"Failed to parse JSON response: {e}")
 
         except Exception as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             self._log_api_call(
                 method="generate_structured_output",
                 prompt_length=len(prompt),
@@ -262,61 +595,646 @@ class LLMClient:
             )
             raise
 
-    async def _generate_anthropic_completion(
+    def make_extractor(
+        self,
+        schema: dict[str, Any],
+        *,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.0
+    ) -> Callable[[str], Awaitable[Any]]:
+        """
+        Build a structured-output function specialized for one schema.
+
+        Everything that only depends on the schema (output mode, wrapping,
+        rendered system prompt, provider parameters) is resolved here once,
+        so each call only sends the prompt and parses the result. Use this
+        for call sites that apply a fixed schema repeatedly.
+
+        Args:
+            schema: JSON schema for the expected output structure
+            system_prompt: Optional system prompt for context
+            max_tokens: Maximum tokens to generate per call
+            temperature: Sampling temperature (0-1)
+
+        Returns:
+            Coroutine function taking a prompt and returning the parsed JSON
+        """
+        full_system_prompt, output_schema, wrapped = self._prepare_structured_request(schema, system_prompt)
+        extra = {"output_schema": output_schema} if output_schema is not None else {}
+        strip_fence = output_schema is None
+
+        async def extract(prompt: str) -> Any:
+            response = await self.generate_completion(
+                prompt=prompt,
+                system_prompt=full_system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **extra
+            )
+            if strip_fence:
+                response = _strip_code_fence(response)
+            try:
+                parsed = orjson.loads(response)
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON response: {e}\nResponse: {response}")
+                raise ValueError(f"Failed to parse JSON response: {e}")
+            return parsed[_WRAPPED_RESULT_KEY] if wrapped else parsed
+
+        return extract
+
+    def _prepare_structured_request(
+        self,
+        schema: dict[str, Any],
+        system_prompt: Optional[str]
+    ) -> tuple[Optional[str], Optional[dict[str, Any]], bool]:
+        """
+        Resolve how a structured-output request is sent for this model.
+
+        Returns:
+            (system prompt to send, schema for the provider-native mode or
+            None when prompting for JSON, whether the schema was wrapped)
+        """
+        native_mode = self._native_output_mode()
+        if native_mode is None:
+            return _with_schema_instruction(system_prompt, schema), None, False
+
+        # Native modes need an object at the root; wrap other schemas
+        output_schema, wrapped = _as_object_schema(schema)
+        # JSON mode only guarantees valid JSON, so it still needs the schema spelled out
+        if native_mode == "json_object":
+            return _with_schema_instruction(system_prompt, output_schema), output_schema, wrapped
+        return system_prompt, output_schema, wrapped
+
+    def _check_context_window(self, prompt: str, system_prompt: Optional[str], max_tokens: int):
+        """
+        Reject requests that can't fit the model's context window.
+
+        Uses a conservative token estimate, so only requests that would
+        certainly be refused by the provider fail here, without a round-trip.
+
+        Raises:
+            ValueError: If the prompt plus ``max_tokens`` exceeds the window
+        """
+        window = CONTEXT_WINDOWS.get(self.model)
+        if window is None:
+            return
+
+        prompt_tokens = estimate_tokens(prompt) + (estimate_tokens(system_prompt) if system_prompt else 0)
+        if prompt_tokens + max_tokens > window:
+            raise ValueError(
+                f"Prompt (at least ~{prompt_tokens} tokens) plus max_tokens={max_tokens} "
+                f"exceeds the {window}-token context window of {self.model}"
+            )
+
+    def _native_output_mode(self) -> Optional[Literal["tool", "json_schema", "json_object"]]:
+        """
+        Get the provider-native structured output mode for this model.
+
+        Returns:
+            "tool" (Anthropic forced tool use), "json_schema" or "json_object"
+            (OpenAI response_format), or None to fall back to prompting
+        """
+        if self._is_anthropic:
+            return "tool"
+        if self.model.startswith(_OPENAI_JSON_SCHEMA_MODELS):
+            return "json_schema"
+        if self.model.startswith(_OPENAI_JSON_MODE_MODELS):
+            return "json_object"
+        return None
+
+    async def generate_many(
+        self,
+        prompts: list[str],
+        *,
+        concurrency: int = 20,
+        **kwargs
+    ) -> list[str]:
+        """
+        Generate completions for many prompts concurrently.
+
+        At most ``concurrency`` requests are in flight at once. If any
+        request fails, the remaining ones are cancelled and the error is
+        raised (as an ExceptionGroup).
+
+        Args:
+            prompts: User prompts
+            concurrency: Maximum in-flight requests
+            **kwargs: Arguments passed to ``generate_completion``
+
+        Returns:
+            Generated text responses, in prompt order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate_completion(prompt, **kwargs)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(generate_one(prompt)) for prompt in prompts]
+
+        return [task.result() for task in tasks]
+
+    async def generate_structured_batch(
+        self,
+        prompts: list[str],
+        schema: dict[str, Any],
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        mode: Literal["realtime", "batch"] = "realtime",
+        concurrency: int = 20,
+        poll_interval: float = 60.0,
+        max_poll_interval: float = 600.0
+    ) -> AsyncIterator[tuple[int, Optional[dict[str, Any]]]]:
+        """
+        Generate structured JSON output for many prompts.
+
+        In "realtime" mode prompts are sent concurrently and results are
+        yielded as they complete. In "batch" mode they are submitted to the
+        provider's batch API, which is roughly half the price but may take up
+        to 24 hours; results are yielded in prompt order once the batch ends.
+        Use batch mode only for non-interactive workloads.
+
+        Args:
+            prompts: User prompts
+            schema: JSON schema for the expected output structure
+            system_prompt: Optional system prompt shared by all prompts
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature (0-1)
+            mode: "realtime" or "batch"
+            concurrency: Maximum in-flight requests in realtime mode
+            poll_interval: Initial batch status polling interval in seconds
+            max_poll_interval: Upper bound for the (doubling) polling interval
+
+        Yields:
+            (prompt index, parsed JSON) pairs; the JSON is None for prompts
+            that failed
+        """
+        if mode == "batch":
+            async for item in self._run_provider_batch(
+                prompts, schema, system_prompt, max_tokens, temperature,
+                poll_interval, max_poll_interval
+            ):
+                yield item
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate_one(index: int, prompt: str) -> tuple[int, Optional[dict[str, Any]]]:
+            async with semaphore:
+                try:
+                    return index, await self.generate_structured_output(
+                        prompt=prompt,
+                        schema=schema,
+                        system_prompt=system_prompt,
+                        max_tokens=max_tokens,
+                        temperature=temperature
+                    )
+                except Exception as e:
+                    logger.warning(f"Structured output failed for prompt {index}: {e}")
+                    return index, None
+
+        tasks = [asyncio.create_task(generate_one(i, p)) for i, p in enumerate(prompts)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_provider_batch(
+        self,
+        prompts: list[str],
+        schema: dict[str, Any],
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> AsyncIterator[tuple[int, Optional[dict[str, Any]]]]:
+        """Submit prompts to the provider batch API and yield parsed results in order."""
+        full_system_prompt = _with_schema_instruction(system_prompt, schema)
+        start_time = time.perf_counter()
+
+        run_batch = self._run_anthropic_batch if self._is_anthropic else self._run_openai_batch
+        texts = await run_batch(
+            prompts, full_system_prompt, max_tokens, temperature,
+            poll_interval, max_poll_interval
+        )
+
+        self._log_api_call(
+            method="generate_structured_batch",
+            prompt_length=sum(len(p) for p in prompts),
+            response_length=sum(len(t) for t in texts.values()),
+            elapsed_time=time.perf_counter() - start_time,
+            success=True
+        )
+
+        for index in range(len(prompts)):
+            text = texts.get(index)
+            if text is None:
+                yield index, None
+                continue
+            try:
+                yield index, orjson.loads(_strip_code_fence(text))
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Failed to parse batch result {index}: {e}")
+                yield index, None
+
+    async def _poll_batch(
+        self,
+        path: str,
+        is_done,
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> dict[str, Any]:
+        """Poll a batch resource with doubling intervals until ``is_done(batch)``."""
+        delay = poll_interval
+        while True:
+            batch = (await self.client.get(path, cast_to=httpx.Response)).json()
+            if is_done(batch):
+                return batch
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+
+    async def _run_anthropic_batch(
+        self,
+        prompts: list[str],
+        system_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> dict[int, str]:
+        """Run prompts through the Anthropic Message Batches API."""
+        requests = [
+            {
+                "custom_id": str(i),
+                "params": {
+                    "model": self.model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "system": system_prompt,
+                },
+            }
+            for i, prompt in enumerate(prompts)
+        ]
+
+        # The pinned SDK predates batch support, so use its generic request methods
+        created = await self.client.post(
+            "/v1/messages/batches",
+            body={"requests": requests},
+            cast_to=httpx.Response
+        )
+        batch_id = created.json()["id"]
+        logger.info(f"Submitted Anthropic message batch {batch_id} ({len(prompts)} prompts)")
+
+        batch = await self._poll_batch(
+            f"/v1/messages/batches/{batch_id}",
+            lambda b: b.get("processing_status") == "ended",
+            poll_interval,
+            max_poll_interval
+        )
+
+        results = await self.client.get(batch["results_url"], cast_to=httpx.Response)
+        texts = {}
+        for line in results.text.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            result = item.get("result", {})
+            if result.get("type") == "succeeded":
+                texts[int(item["custom_id"])] = result["message"]["content"][0]["text"]
+            else:
+                logger.warning(f"Batch request {item.get('custom_id')} did not succeed: {result.get('type')}")
+        return texts
+
+    async def _run_openai_batch(
+        self,
+        prompts: list[str],
+        system_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> dict[int, str]:
+        """Run prompts through the OpenAI Batch API."""
+        lines = [
+            orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt},
+                    ],
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                },
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+
+        input_file = await self.client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+
+        # The pinned SDK predates batch support, so use its generic request methods
+        created = await self.client.post(
+            "/batches",
+            body={
+                "input_file_id": input_file.id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+            cast_to=httpx.Response
+        )
+        batch_id = created.json()["id"]
+        logger.info(f"Submitted OpenAI batch {batch_id} ({len(prompts)} prompts)")
+
+        batch = await self._poll_batch(
+            f"/batches/{batch_id}",
+            lambda b: b.get("status") in ("completed", "failed", "expired", "cancelled"),
+            poll_interval,
+            max_poll_interval
+        )
+
+        if not batch.get("output_file_id"):
+            raise ValueError(f"OpenAI batch {batch_id} finished with status {batch.get('status')}")
+
+        output = await self.client.files.content(batch["output_file_id"])
+        texts = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") == 200:
+                texts[int(item["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+            else:
+                logger.warning(f"Batch request {item.get('custom_id')} failed: {item.get('error')}")
+        return texts
+
+    async def stream_structured_output(
         self,
         prompt: str,
+        schema: dict[str, Any],
         system_prompt: Optional[str] = None,
         max_tokens: int = 2000,
         temperature: float = 0.7,
         **kwargs
-    ) -> str:
-        """Generate completion using Anthropic Claude API."""
-        messages = [{"role": "user", "content": prompt}]
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Stream structured JSON output, one top-level field at a time.
+
+        Each field is yielded as soon as its value has been generated, so
+        callers can start on early fields while later ones are still decoding.
 
-        params = {
+        Args:
+            prompt: User prompt/message
+            schema: JSON schema for the expected output (object root)
+            system_prompt: Optional system prompt for context
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0-1)
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            (key, value) pairs in generation order
+        """
+        if schema.get("type") != "object":
+            raise ValueError("stream_structured_output requires a schema with an object root")
+
+        if self._native_output_mode() == "json_schema":
+            kwargs["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "output", "schema": schema}
+            }
+        elif self._native_output_mode() == "json_object":
+            kwargs["response_format"] = _OPENAI_JSON_OBJECT_FORMAT
+
+        parser = _IncrementalObjectParser()
+        async with aclosing(self.stream_completion(
+            prompt=prompt,
+            system_prompt=_with_schema_instruction(system_prompt, schema),
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )) as chunks:
+            async for chunk in chunks:
+                for member in parser.feed(chunk):
+                    yield member
+                if parser.done:
+                    break
+
+        if not parser.done:
+            raise ValueError("Streamed JSON response ended before the object was complete")
+
+    async def stream_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a text completion as it is generated.
+
+        Closing the iterator early (or cancelling the consuming task) aborts
+        the upstream request. Transient failures before the first chunk are
+        retried like ``generate_completion``; once text has been yielded the
+        error is raised, since a stream can't be resumed.
+
+        Args:
+            prompt: User prompt/message
+            system_prompt: Optional system prompt for context
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0-1)
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Text chunks in generation order
+        """
+        self._check_context_window(prompt, system_prompt, max_tokens)
+
+        start_time = time.perf_counter()
+        response_length = 0
+        bucket = get_provider_bucket(self._provider_value, self.model)
+        semaphore = get_provider_semaphore(self._provider_value)
+        attempts = max(1, self.max_retries)
+
+        try:
+            for attempt in range(attempts):
+                await bucket.acquire()
+                try:
+                    async with semaphore:
+                        async with aclosing(self._stream_chunks(
+                            prompt, system_prompt, max_tokens, temperature, kwargs
+                        )) as chunks:
+                            async for text in chunks:
+                                response_length += len(text)
+                                yield text
+                except self._api_error as e:
+                    if _is_throttling_error(e):
+                        bucket.decrease_rate()
+                    if response_length or not _is_retryable_error(e) or attempt == attempts - 1:
+                        raise
+
+                    delay = random.uniform(0, min(_MAX_RETRY_DELAY, self.retry_delay * (2 ** attempt)))
+                    logger.warning(
+                        f"{self._provider_value} stream error (attempt {attempt + 1}/{attempts}): {e}. "
+                        f"Retrying in {delay:.2f}s..."
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    bucket.increase_rate()
+                    break
+
+            self._record_usage()
+            elapsed_time = time.perf_counter() - start_time
+            self._log_api_call(
+                method="stream_completion",
+                prompt_length=len(prompt),
+                response_length=response_length,
+                elapsed_time=elapsed_time,
+                success=True
+            )
+
+        except Exception as e:
+            elapsed_time = time.perf_counter() - start_time
+            self._log_api_call(
+                method="stream_completion",
+                prompt_length=len(prompt),
+                response_length=response_length,
+                elapsed_time=elapsed_time,
+                success=False,
+                error=str(e)
+            )
+            raise
+
+    async def _stream_chunks(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        extra: dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Open one provider stream and yield its non-empty text chunks."""
+        if self._is_anthropic:
+            params = self._anthropic_params(prompt, system_prompt, max_tokens, temperature, extra)
+
+            async with self.client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        else:
+            params = self._openai_params(prompt, system_prompt, max_tokens, temperature, extra)
+
+            stream = await self.client.chat.completions.create(stream=True, **params)
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content or ""
+                if text:
+                    yield text
+
+    def _anthropic_params(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        extra: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build Messages API request parameters; ``extra`` entries take precedence."""
+        if system_prompt:
+            return {
+                "model": self.model,
+                "system": system_prompt,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                **extra
+            }
+        return {
             "model": self.model,
-            "messages": messages,
+            "messages": [{"role": "user", "content": prompt}],
             "max_tokens": max_tokens,
             "temperature": temperature,
+            **extra
         }
 
+    def _openai_params(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        extra: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build Chat Completions request parameters; ``extra`` entries take precedence."""
         if system_prompt:
-            params["system"] = system_prompt
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ]
+        else:
+            messages = [{"role": "user", "content": prompt}]
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            **extra
+        }
 
-        # Add any additional kwargs
-        params.update(kwargs)
+    async def _generate_anthropic_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        output_schema: Optional[dict[str, Any]] = None,
+        **kwargs
+    ) -> str:
+        """
+        Generate completion using Anthropic Claude API.
 
-        # Retry logic with exponential backoff
-        last_exception = None
-        for attempt in range(self.max_retries):
-            try:
-                response = await self.client.messages.create(**params)
-
-                # Track usage
-                self.total_requests += 1
-                if hasattr(response, "usage"):
-                    input_tokens = response.usage.input_tokens
-                    output_tokens = response.usage.output_tokens
-                    self.total_tokens += input_tokens + output_tokens
-
-                    # Estimate cost (Claude 3.5 Sonnet pricing as example)
-                    cost = (input_tokens * 0.003 / 1000) + (output_tokens * 0.015 / 1000)
-                    self.total_cost += cost
-
-                return response.content[0].text
-
-            except AnthropicAPIError as e:
-                last_exception = e
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(f"Anthropic API error (attempt {attempt + 1}/{self.max_retries}): {e}. Retrying in {delay}s...")
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(f"Anthropic API error after {self.max_retries} attempts: {e}")
-                    raise
+        With ``output_schema``, the model is forced to call a tool whose input
+        schema is ``output_schema`` and the tool input is returned as JSON text.
+        """
+        if output_schema is not None:
+            kwargs = {
+                "tools": [{**_ANTHROPIC_OUTPUT_TOOL_SPEC, "input_schema": output_schema}],
+                "tool_choice": _ANTHROPIC_OUTPUT_TOOL_CHOICE,
+                **kwargs
+            }
+
+        params = self._anthropic_params(prompt, system_prompt, max_tokens, temperature, kwargs)
+
+        if output_schema is not None:
+            # The pinned SDK predates tool use, so send the request through
+            # its generic request method and read the raw body
+            raw = await self._call_with_retry(
+                self.client.post, "/v1/messages", body=params, cast_to=httpx.Response
+            )
+            data = raw.json()
+            self._record_usage(data["usage"]["input_tokens"], data["usage"]["output_tokens"])
+            tool_input = next(
+                block["input"] for block in data["content"] if block["type"] == "tool_use"
+            )
+            return orjson.dumps(tool_input).decode()
 
-        if last_exception:
-            raise last_exception
+        response = await self._call_with_retry(self.client.messages.create, **params)
+        self._record_usage(response.usage.input_tokens, response.usage.output_tokens)
+        return response.content[0].text
 
     async def _generate_openai_completion(
         self,
@@ -324,57 +1242,81 @@ class LLMClient:
         system_prompt: Optional[str] = None,
         max_tokens: int = 2000,
         temperature: float = 0.7,
+        output_schema: Optional[dict[str, Any]] = None,
         **kwargs
     ) -> str:
-        """Generate completion using OpenAI GPT API."""
-        messages = []
+        """
+        Generate completion using OpenAI GPT API.
 
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        With ``output_schema``, the request sets ``response_format`` so the
+        model returns bare JSON (schema-constrained where the model supports it).
+        """
+        if output_schema is not None:
+            if self._native_output_mode() == "json_schema":
+                response_format = {
+                    "type": "json_schema",
+                    "json_schema": {"name": "output", "schema": output_schema}
+                }
+            else:
+                response_format = _OPENAI_JSON_OBJECT_FORMAT
+            kwargs = {"response_format": response_format, **kwargs}
 
-        messages.append({"role": "user", "content": prompt})
+        params = self._openai_params(prompt, system_prompt, max_tokens, temperature, kwargs)
 
-        params = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
+        response = await self._call_with_retry(self.client.chat.completions.create, **params)
+
+        usage = response.usage
+        if usage is not None:
+            self._record_usage(usage.prompt_tokens, usage.completion_tokens)
+        else:
+            self._record_usage()
+
+        return response.choices[0].message.content
+
+    async def _call_with_retry(self, request: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Call a provider API with adaptive rate limiting, a provider-wide
+        concurrency cap, and jittered retries.
+
+        Only transient failures (429, 5xx, connection errors and timeouts) are
+        retried; other client errors are raised immediately since repeating
+        the same request can't succeed.
 
-        # Add any additional kwargs
-        params.update(kwargs)
+        Args:
+            request: Provider SDK coroutine function
+            *args: Positional arguments for ``request``
+            **kwargs: Keyword arguments for ``request``
 
-        # Retry logic with exponential backoff
-        last_exception = None
-        for attempt in range(self.max_retries):
+        Returns:
+            The provider response
+        """
+        bucket = get_provider_bucket(self._provider_value, self.model)
+        semaphore = get_provider_semaphore(self._provider_value)
+        attempts = max(1, self.max_retries)
+
+        for attempt in range(attempts):
+            await bucket.acquire()
             try:
-                response = await self.client.chat.completions.create(**params)
-
-                # Track usage
-                self.total_requests += 1
-                if hasattr(response, "usage"):
-                    input_tokens = response.usage.prompt_tokens
-                    output_tokens = response.usage.completion_tokens
-                    self.total_tokens += input_tokens + output_tokens
-
-                    # Estimate cost (GPT-4 pricing as example)
-                    cost = (input_tokens * 0.03 / 1000) + (output_tokens * 0.06 / 1000)
-                    self.total_cost += cost
-
-                return response.choices[0].message.content
-
-            except OpenAIAPIError as e:
-                last_exception = e
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(f"OpenAI API error (attempt {attempt + 1}/{self.max_retries}): {e}. Retrying in {delay}s...")
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(f"OpenAI API error after {self.max_retries} attempts: {e}")
+                # The slot is held per attempt, not across the backoff sleep
+                async with semaphore:
+                    response = await request(*args, **kwargs)
+            except self._api_error as e:
+                if _is_throttling_error(e):
+                    bucket.decrease_rate()
+                if not _is_retryable_error(e) or attempt == attempts - 1:
+                    logger.error(f"{self._provider_value} API error after {attempt + 1} attempt(s): {e}")
                     raise
 
-        if last_exception:
-            raise last_exception
+                # Full jitter keeps concurrent callers from retrying in lockstep
+                delay = random.uniform(0, min(_MAX_RETRY_DELAY, self.retry_delay * (2 ** attempt)))
+                logger.warning(
+                    f"{self._provider_value} API error (attempt {attempt + 1}/{attempts}): {e}. "
+                    f"Retrying in {delay:.2f}s..."
+                )
+                await asyncio.sleep(delay)
+            else:
+                bucket.increase_rate()
+                return response
 
     def _log_api_call(
         self,
@@ -386,9 +1328,13 @@ class LLMClient:
         error: Optional[str] = None
     ):
         """Log API call for debugging and cost tracking."""
+        if not _api_call_logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
+        _ensure_api_call_log_listener()
+
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "provider": self.provider.value,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "provider": self._provider_value,
             "model": self.model,
             "method": method,
             "prompt_length": prompt_length,
@@ -403,20 +1349,42 @@ class LLMClient:
         if error:
             log_data["error"] = error
 
+        # Formatting happens on the listener thread
         if success:
-            logger.info(f"LLM API call successful: {json.dumps(log_data)}")
+            _api_call_logger.info("LLM API call successful: %s", log_data)
         else:
-            logger.error(f"LLM API call failed: {json.dumps(log_data)}")
+            _api_call_logger.error("LLM API call failed: %s", log_data)
+
+    async def aclose(self):
+        """
+        Release this client's HTTP resources.
+
+        The shared connection pool is left open for other clients; it is
+        closed by ``close_llm_clients`` on shutdown.
+        """
+        if self._owns_http_client:
+            await self.client.close()
+
+    @staticmethod
+    async def set_concurrency(provider: LLMProvider, limit: int):
+        """
+        Change the maximum number of concurrent requests to a provider.
+
+        Args:
+            provider: LLM provider
+            limit: Maximum concurrent requests
+        """
+        set_provider_concurrency(LLMProvider(provider).value, limit)
 
     def get_usage_stats(self) -> dict[str, Any]:
         """
-        Get usage statistics for this client instance.
+        Get usage statistics for this client's provider and model.
 
         Returns:
             Dict with usage metrics
         """
         return {
-            "provider": self.provider.value,
+            "provider": self._provider_value,
             "model": self.model,
             "total_requests": self.total_requests,
             "total_tokens": self.total_tokens,
@@ -424,6 +1392,90 @@ class LLMClient:
         }
 
 
+def get_global_usage_stats() -> list[dict[str, Any]]:
+    """
+    Get usage statistics for every provider/model used in this process.
+
+    Returns:
+        One dict of usage metrics per (provider, model)
+    """
+    return [
+        {
+            "provider": provider,
+            "model": model,
+            "total_requests": usage["requests"],
+            "input_tokens": usage["input_tokens"],
+            "output_tokens": usage["output_tokens"],
+            "estimated_cost_usd": round(usage["cost_micro"] / 1_000_000_000_000, 4)
+        }
+        for (provider, model), usage in _GLOBAL_USAGE.items()
+    ]
+
+
+# Shared HTTP clients and LLM clients. Both hold loop-bound connections, so
+# keep one set per running loop (Celery tasks may each run their own loop).
+_shared_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, LLMClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the event loop implementation for loops created from now on.
+
+    Returns:
+        True if uvloop was installed, False if it isn't available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_shared_http_client() -> Optional[httpx.AsyncClient]:
+    """
+    Get the pooled HTTP client for the running event loop.
+
+    Returns:
+        Shared httpx.AsyncClient, or None outside an event loop (the provider
+        SDK then creates its own)
+    """
+    loop = _get_running_loop()
+    if loop is None:
+        return None
+
+    http_client = _shared_http_clients.get(loop)
+    if http_client is None or http_client.is_closed:
+        http_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+        _shared_http_clients[loop] = http_client
+    return http_client
+
+
+async def close_llm_clients():
+    """Close the shared HTTP connection pool and drop cached clients for the running loop."""
+    loop = asyncio.get_running_loop()
+    _llm_clients.pop(loop, None)
+
+    http_client = _shared_http_clients.pop(loop, None)
+    if http_client is not None:
+        await http_client.aclose()
+
+    await close_cache_redis_client()
+
+
 # Factory functions
 def get_llm_client(
     provider: Optional[LLMProvider] = None,
@@ -432,6 +1484,8 @@ def get_llm_client(
     """
     Get LLM client instance.
 
+    Clients are reused per (provider, model) within the running event loop.
+
     Args:
         provider: LLM provider (defaults to config setting)
         model: Model name (defaults to provider's default)
@@ -439,7 +1493,20 @@ def get_llm_client(
     Returns:
         LLMClient instance
     """
-    return LLMClient(provider=provider, model=model)
+    loop = _get_running_loop()
+    if loop is None:
+        return LLMClient(provider=provider, model=model)
+
+    if provider is None:
+        provider = LLMProvider(settings.DEFAULT_LLM_PROVIDER)
+
+    clients = _llm_clients.setdefault(loop, {})
+    key = (provider, model)
+    client = clients.get(key)
+    if client is None:
+        client = LLMClient(provider=provider, model=model)
+        clients[key] = client
+    return client
 
 
 def get_anthropic_client(model: Optional[str] = None) -> LLMClient:
@@ -452,7 +1519,7 @@ def get_anthropic_client(model: Optional[str] = None) -> LLMClient:
     Returns:
         LLMClient configured for Anthropic
     """
-    return LLMClient(
+    return get_llm_client(
         provider=LLMProvider.ANTHROPIC,
         model=model or LLMModel.CLAUDE_3_5_SONNET.value
     )
@@ -468,7 +1535,7 @@ def get_openai_client(model: Optional[str] = None) -> LLMClient:
     Returns:
         LLMClient configured for OpenAI
     """
-    return LLMClient(
+    return get_llm_client(
         provider=LLMProvider.OPENAI,
         model=model or LLMModel.GPT_4_TURBO.value
     )
@@ -5,15 +5,24 @@ Orchestrates data analysis, LLM processing, and insight generation
 by combining statistical analysis with natural language AI.
 """
 
-import json
+import asyncio
 import logging
-from typing import Any, Optional
+import re
+import time
+from collections import OrderedDict, namedtuple
+from operator import itemgetter
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 
+import orjson
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from app.models import Dataset, Insight, InsightType, InsightGenerator as InsightGeneratorEnum, Visualization
+from app.db.session import AsyncSessionLocal
+from app.models import Dataset, Insight, InsightType, InsightGenerator as InsightGeneratorEnum, Record, Visualization
+from app.services.llm.cache import make_cache_key, response_cache
 from app.services.llm.client import get_llm_client, LLMClient
 from app.services.llm.prompts import (
     INSIGHT_GENERATION_PROMPT,
@@ -22,16 +31,125 @@ from app.services.llm.prompts import (
     CORRELATION_EXPLANATION_PROMPT,
     ANOMALY_DETECTION_PROMPT,
     SYSTEM_PROMPTS,
+    PromptTemplate,
     format_schema,
     format_stats,
     format_sample_data
 )
 from app.services.visualization.summary import SummaryService
-from app.services.visualization.aggregator import AggregationService
+from app.services.visualization.aggregator import AggregationService, MAX_CORRELATION_MATRIX_COLUMNS
 
 
 logger = logging.getLogger(__name__)
 
+# Max aggregator queries in flight per generator; each holds a pooled connection
+_ANALYSIS_CONCURRENCY = 8
+
+# Datasets analyzed at once by generate_insights_batch
+_BATCH_CONCURRENCY = 6
+
+# Rows fetched per round-trip when streaming sample records
+_SAMPLE_FETCH_SIZE = 100
+
+# Summary fields the insight helpers read, extracted once per summary
+SummaryFacts = namedtuple(
+    "SummaryFacts",
+    "dataset_name row_count column_count data_quality_score columns numeric_columns date_columns"
+)
+
+_DATE_TYPES = frozenset({"date", "datetime", "timestamp"})
+
+# Recent dataset summaries, keyed by dataset ID: (expires_at, summary). The
+# summary runs several stats queries, and one request often needs it twice.
+_SUMMARY_CACHE_MAXSIZE = 128
+_SUMMARY_CACHE_TTL = 300  # 5 minutes
+_summary_cache: "OrderedDict[UUID, tuple[float, dict[str, Any], SummaryFacts]]" = OrderedDict()
+
+# Insight type strings accepted from the LLM; anything else is stored as a summary
+_INSIGHT_TYPES = {t.value: t for t in InsightType}
+
+# Column types whose prompt line reports a distinct-value count
+_DISTINCT_COUNT_TYPES = frozenset({"categorical", "text"})
+
+# System prompts used by this service, resolved once
+_DATA_ANALYST_SYSTEM_PROMPT = SYSTEM_PROMPTS["data_analyst"]
+_TECHNICAL_WRITER_SYSTEM_PROMPT = SYSTEM_PROMPTS["technical_writer"]
+
+# Insight prompt with the anomalies section appended
+_INSIGHT_PROMPT_TEMPLATE = PromptTemplate(INSIGHT_GENERATION_PROMPT + "\n\nAnomalies Detected:\n{anomalies}")
+
+# Question prompts over this estimated size are cut down to the columns most
+# relevant to the question
+_QUESTION_PROMPT_TOKEN_BUDGET = 4000
+_QUESTION_MAX_COLUMNS = 40
+_CHARS_PER_TOKEN = 4  # Typical for English text and identifiers
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Expected structure of LLM-generated insights (module-level so the client's
+# per-schema instruction cache hits on every call)
+_INSIGHT_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "type": {"type": "string", "enum": list(_INSIGHT_TYPES)},
+            "title": {"type": "string"},
+            "description": {"type": "string"},
+            "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+            "supporting_data": {"type": "object"},
+            "suggested_action": {"type": "string"}
+        },
+        # Enforced by constrained decoding (Anthropic tool input / OpenAI json_schema)
+        "required": ["type", "title", "description", "confidence"]
+    }
+}
+
+
+def _summary_facts(summary: dict[str, Any]) -> SummaryFacts:
+    """Extract the fields the insight helpers read from a dataset summary."""
+    columns = summary.get("columns", {})
+    return SummaryFacts(
+        dataset_name=summary.get("dataset_name", "Unknown"),
+        row_count=summary.get("row_count", 0),
+        column_count=summary.get("column_count", 0),
+        data_quality_score=summary.get("data_quality_score", 0),
+        columns=columns,
+        numeric_columns=tuple(summary.get("numeric_columns", ())),
+        date_columns=tuple(
+            col_name for col_name, col_info in columns.items()
+            if col_info.get("type") in _DATE_TYPES
+        )
+    )
+
+
+def _rank_columns_for_question(column_names: Iterable[str], question: str) -> list[str]:
+    """
+    Order columns by how many of their name's words appear in the question.
+
+    Ties keep the dataset's column order.
+    """
+    question_words = set(_WORD_PATTERN.findall(question.lower()))
+    names = list(column_names)
+    scores = {
+        name: len(question_words.intersection(_WORD_PATTERN.findall(name.lower())))
+        for name in names
+    }
+    return sorted(names, key=lambda name: -scores[name])
+
+
+def _format_column_line(col_name: str, col_info: dict[str, Any]) -> str:
+    """Format one column's statistics as a prompt line."""
+    col_type = col_info.get("type", "unknown")
+    stats = col_info.get("stats")
+
+    if not stats:
+        return f"{col_name} ({col_type})"
+    if col_type == "numeric":
+        return f"{col_name} ({col_type}): mean={stats.get('mean', 0):.2f}, median={stats.get('median', 0):.2f}"
+    if col_type in _DISTINCT_COUNT_TYPES:
+        return f"{col_name} ({col_type}): {stats.get('unique_values', 0)} unique values"
+    return f"{col_name} ({col_type})"
+
 
 class InsightGeneratorService:
     """
@@ -41,18 +159,27 @@ class InsightGeneratorService:
     actionable insights, answer questions, and explain visualizations.
     """
 
-    def __init__(self, db: AsyncSession, llm_client: Optional[LLMClient] = None):
+    def __init__(
+        self,
+        db: AsyncSession,
+        llm_client: Optional[LLMClient] = None,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+    ):
         """
         Initialize insight generator.
 
         Args:
             db: Database session
             llm_client: Optional LLM client (creates default if not provided)
+            session_factory: Factory for the short-lived sessions used by
+                concurrent analysis queries (a session can't run them in parallel)
         """
         self.db = db
         self.llm_client = llm_client or get_llm_client()
-        self.summary_service = SummaryService(db)
         self.aggregator = AggregationService(db)
+        self.summary_service = SummaryService(db, aggregator=self.aggregator)
+        self.session_factory = session_factory
+        self._analysis_slots = asyncio.Semaphore(_ANALYSIS_CONCURRENCY)
 
     async def generate_insights(
         self,
@@ -87,49 +214,41 @@ class InsightGeneratorService:
             raise ValueError(f"Dataset {dataset_id} not found")
 
         # Step 1: Get dataset summary
-        summary = await self.summary_service.generate_dataset_summary(dataset_id)
-
-        # Step 2: Identify trends (if date column exists)
-        trends = await self._identify_trends(dataset_id, summary)
+        summary, facts = await self._get_dataset_summary(dataset_id)
 
-        # Step 3: Find correlations
-        correlations = await self._find_correlations(dataset_id, summary)
-
-        # Step 4: Detect anomalies
-        anomalies = await self._detect_anomalies(dataset_id, summary)
+        # Steps 2-4: Identify trends, find correlations and detect anomalies concurrently
+        trends, correlations, anomalies = await asyncio.gather(
+            self._identify_trends(dataset_id, facts),
+            self._find_correlations(dataset_id, facts),
+            self._detect_anomalies(dataset_id, facts)
+        )
 
         # Step 5: Generate LLM prompt
-        prompt = self._build_insight_prompt(summary, trends, correlations, anomalies)
-
-        # Step 6: Get insights from LLM
+        prompt = self._build_insight_prompt(facts, trends, correlations, anomalies)
+
+        # Step 6: Get insights from LLM (reused while the summary is unchanged)
+        cache_key = make_cache_key(
+            kind="insights",
+            model=self.llm_client.model,
+            dataset_id=dataset_id,
+            summary=summary
+        )
         try:
-            schema = {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "type": {"type": "string"},
-                        "title": {"type": "string"},
-                        "description": {"type": "string"},
-                        "confidence": {"type": "number"},
-                        "supporting_data": {"type": "object"},
-                        "suggested_action": {"type": "string"}
-                    }
-                }
-            }
-
-            llm_insights = await self.llm_client.generate_structured_output(
-                prompt=prompt,
-                schema=schema,
-                system_prompt=SYSTEM_PROMPTS["data_analyst"],
-                max_tokens=3000,
-                temperature=0.7
+            llm_insights = await self._cached_llm_call(
+                cache_key,
+                lambda: self.llm_client.generate_structured_output(
+                    prompt=prompt,
+                    schema=_INSIGHT_SCHEMA,
+                    system_prompt=_DATA_ANALYST_SYSTEM_PROMPT,
+                    max_tokens=3000,
+                    temperature=0.7
+                )
             )
 
         except Exception as e:
             logger.error(f"LLM insight generation failed: {e}")
             # Fallback to rule-based insights
-            llm_insights = self._generate_fallback_insights(summary, trends, correlations, anomalies)
+            llm_insights = self._generate_fallback_insights(facts, trends, correlations, anomalies)
 
         # Step 7: Save to database if requested
         if save_to_db:
@@ -138,6 +257,50 @@ class InsightGeneratorService:
         logger.info(f"Generated {len(llm_insights)} insights for dataset {dataset_id}")
         return llm_insights
 
+    @classmethod
+    async def generate_insights_batch(
+        cls,
+        dataset_ids: list[UUID],
+        save_to_db: bool = True,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        concurrency: int = _BATCH_CONCURRENCY
+    ) -> dict[UUID, list[dict[str, Any]]]:
+        """
+        Generate insights for several datasets concurrently.
+
+        Each dataset is analyzed by its own generator on its own session; LLM
+        requests across all of them share the client's per-provider limits.
+
+        Args:
+            dataset_ids: Dataset UUIDs
+            save_to_db: Whether to save insights to database
+            session_factory: Factory for the per-dataset sessions
+            concurrency: Maximum datasets analyzed at once
+
+        Returns:
+            Insights by dataset ID; datasets that failed are logged and omitted
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        results: dict[UUID, list[dict[str, Any]]] = {}
+
+        async def run(dataset_id: UUID):
+            async with semaphore:
+                async with session_factory() as session:
+                    generator = cls(session, session_factory=session_factory)
+                    try:
+                        results[dataset_id] = await generator.generate_insights(
+                            dataset_id,
+                            save_to_db=save_to_db
+                        )
+                    except Exception as e:
+                        logger.error(f"Insight generation failed for dataset {dataset_id}: {e}")
+
+        async with asyncio.TaskGroup() as tg:
+            for dataset_id in dataset_ids:
+                tg.create_task(run(dataset_id))
+
+        return results
+
     async def answer_data_question(
         self,
         dataset_id: UUID,
@@ -161,45 +324,25 @@ class InsightGeneratorService:
         """
         logger.info(f"Answering question for dataset {dataset_id}: {question}")
 
-        # Get dataset
-        dataset = await self.db.get(Dataset, dataset_id)
-        if not dataset:
-            raise ValueError(f"Dataset {dataset_id} not found")
-
-        # Get dataset summary
-        summary = await self.summary_service.generate_dataset_summary(dataset_id)
-
-        # Get sample data
-        sample_data = await self._get_sample_data(dataset_id, limit=10)
-
-        # Build prompt
-        schema_info = summary.get("columns", {})
-        column_stats = self._format_column_stats(schema_info)
-
-        prompt = DATA_QUESTION_PROMPT.format(
-            dataset_name=dataset.name,
-            row_count=summary.get("row_count", 0),
-            column_count=summary.get("column_count", 0),
-            schema=format_schema(dataset.schema_info.get("columns", [])),
-            column_stats=column_stats,
-            sample_data=format_sample_data(sample_data, limit=5),
-            user_question=question
-        )
+        dataset, prompt, cache_key = await self._prepare_data_question(dataset_id, question)
 
         # Get answer from LLM
         try:
-            answer = await self.llm_client.generate_completion(
-                prompt=prompt,
-                system_prompt=SYSTEM_PROMPTS["data_analyst"],
-                max_tokens=1000,
-                temperature=0.7
+            answer = await self._cached_llm_call(
+                cache_key,
+                lambda: self.llm_client.generate_completion(
+                    prompt=prompt,
+                    system_prompt=_DATA_ANALYST_SYSTEM_PROMPT,
+                    max_tokens=1000,
+                    temperature=0.7
+                )
             )
 
             return {
                 "question": question,
                 "answer": answer,
                 "dataset_name": dataset.name,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds")
             }
 
         except Exception as e:
@@ -210,6 +353,130 @@ class InsightGeneratorService:
                 "error": True
             }
 
+    async def answer_data_question_stream(
+        self,
+        dataset_id: UUID,
+        question: str
+    ) -> AsyncIterator[str]:
+        """
+        Answer a natural language question, streaming the answer as it is generated.
+
+        All database work happens here, before the stream is returned, so the
+        caller can hand the stream to a response after its session is closed.
+        A cached answer is yielded in one chunk; a freshly streamed answer is
+        cached once complete, so both variants share the same cache entries.
+
+        Args:
+            dataset_id: Dataset UUID
+            question: User's question in natural language
+
+        Returns:
+            Async iterator of answer text chunks
+        """
+        logger.info(f"Streaming answer for dataset {dataset_id}: {question}")
+
+        _, prompt, cache_key = await self._prepare_data_question(dataset_id, question)
+        return self._stream_data_answer(prompt, cache_key)
+
+    async def _stream_data_answer(self, prompt: str, cache_key: str) -> AsyncIterator[str]:
+        """Yield a data question's answer chunks, from the cache or the LLM."""
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            yield orjson.loads(cached)
+            return
+
+        chunks: list[str] = []
+        try:
+            async for chunk in self.llm_client.stream_completion(
+                prompt=prompt,
+                system_prompt=_DATA_ANALYST_SYSTEM_PROMPT,
+                max_tokens=1000,
+                temperature=0.7
+            ):
+                chunks.append(chunk)
+                yield chunk
+
+        except Exception as e:
+            logger.error(f"Failed to stream answer: {e}")
+            if not chunks:
+                yield f"I encountered an error while analyzing your data: {str(e)}"
+            return
+
+        await response_cache.set(cache_key, orjson.dumps("".join(chunks)).decode())
+
+    async def _prepare_data_question(
+        self,
+        dataset_id: UUID,
+        question: str
+    ) -> tuple[Dataset, str, str]:
+        """
+        Load the context for a data question and build its prompt.
+
+        Returns:
+            Tuple of (dataset, prompt, answer cache key)
+        """
+        # Get dataset
+        dataset = await self.db.get(Dataset, dataset_id)
+        if not dataset:
+            raise ValueError(f"Dataset {dataset_id} not found")
+
+        # Get dataset summary
+        summary, facts = await self._get_dataset_summary(dataset_id)
+
+        # Get sample data
+        sample_data = await self._get_sample_data(dataset_id, limit=10)
+
+        # Build prompt
+        columns_info = facts.columns
+        schema_columns = dataset.schema_info.get("columns", [])
+        prompt = self._format_question_prompt(
+            dataset, facts, columns_info, schema_columns, sample_data, 5, question
+        )
+
+        # Wide datasets: keep the columns most relevant to the question
+        if len(prompt) > _QUESTION_PROMPT_TOKEN_BUDGET * _CHARS_PER_TOKEN:
+            keep = set(_rank_columns_for_question(columns_info, question)[:_QUESTION_MAX_COLUMNS])
+            prompt = self._format_question_prompt(
+                dataset,
+                facts,
+                {name: info for name, info in columns_info.items() if name in keep},
+                [col for col in schema_columns if col.get("name") in keep],
+                [{k: v for k, v in row.items() if k in keep} for row in sample_data],
+                3,
+                question
+            )
+
+        cache_key = make_cache_key(
+            kind="data_question",
+            model=self.llm_client.model,
+            dataset_id=dataset_id,
+            summary=summary,
+            question=question
+        )
+
+        return dataset, prompt, cache_key
+
+    def _format_question_prompt(
+        self,
+        dataset: Dataset,
+        facts: SummaryFacts,
+        columns_info: dict[str, Any],
+        schema_columns: list[dict],
+        sample_data: list[dict[str, Any]],
+        sample_limit: int,
+        question: str
+    ) -> str:
+        """Format the data question prompt for the given subset of columns."""
+        return DATA_QUESTION_PROMPT.render(
+            dataset_name=dataset.name,
+            row_count=facts.row_count,
+            column_count=facts.column_count,
+            schema=format_schema(schema_columns),
+            column_stats=self._format_column_stats(columns_info),
+            sample_data=format_sample_data(sample_data, limit=sample_limit),
+            user_question=question
+        )
+
     async def explain_visualization(
         self,
         visualization_id: UUID
@@ -231,13 +498,17 @@ class InsightGeneratorService:
         """
         logger.info(f"Explaining visualization {visualization_id}")
 
-        # Get visualization
-        viz = await self.db.get(Visualization, visualization_id)
+        # Get visualization and its dataset in one query
+        result = await self.db.execute(
+            select(Visualization)
+            .options(joinedload(Visualization.dataset))
+            .where(Visualization.id == visualization_id)
+        )
+        viz = result.scalar_one_or_none()
         if not viz:
             raise ValueError(f"Visualization {visualization_id} not found")
 
-        # Get dataset
-        dataset = await self.db.get(Dataset, viz.dataset_id)
+        dataset = viz.dataset
         if not dataset:
             raise ValueError(f"Dataset {viz.dataset_id} not found")
 
@@ -264,7 +535,7 @@ Visualization Details:
 - Aggregation: {aggregation}
 
 Configuration:
-{json.dumps(config, indent=2)}
+{orjson.dumps(config, option=orjson.OPT_INDENT_2, default=str).decode()}
 
 Please provide:
 1. What this visualization shows (2-3 sentences)
@@ -274,12 +545,24 @@ Please provide:
 
 Be specific and reference the actual data being visualized."""
 
+        cache_key = make_cache_key(
+            kind="visualization_explanation",
+            model=self.llm_client.model,
+            visualization_id=visualization_id,
+            name=viz.name,
+            chart_type=chart_type,
+            config=config,
+            dataset_name=dataset.name
+        )
         try:
-            explanation = await self.llm_client.generate_completion(
-                prompt=prompt,
-                system_prompt=SYSTEM_PROMPTS["technical_writer"],
-                max_tokens=800,
-                temperature=0.7
+            explanation = await self._cached_llm_call(
+                cache_key,
+                lambda: self.llm_client.generate_completion(
+                    prompt=prompt,
+                    system_prompt=_TECHNICAL_WRITER_SYSTEM_PROMPT,
+                    max_tokens=800,
+                    temperature=0.7
+                )
             )
 
             return {
@@ -287,7 +570,7 @@ Be specific and reference the actual data being visualized."""
                 "visualization_name": viz.name,
                 "chart_type": chart_type,
                 "explanation": explanation,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds")
             }
 
         except Exception as e:
@@ -298,120 +581,180 @@ Be specific and reference the actual data being visualized."""
                 "error": True
             }
 
+    async def _get_dataset_summary(self, dataset_id: UUID) -> tuple[dict[str, Any], SummaryFacts]:
+        """
+        Get the dataset summary, reusing one computed in the last few minutes.
+
+        The returned dict is shared; callers must not mutate it.
+
+        Returns:
+            Tuple of (summary, facts extracted from it)
+        """
+        entry = _summary_cache.get(dataset_id)
+        if entry is not None:
+            expires_at, summary, facts = entry
+            if expires_at > time.monotonic():
+                _summary_cache.move_to_end(dataset_id)
+                return summary, facts
+            del _summary_cache[dataset_id]
+
+        summary = await self.summary_service.generate_dataset_summary(dataset_id)
+        facts = _summary_facts(summary)
+
+        _summary_cache[dataset_id] = (time.monotonic() + _SUMMARY_CACHE_TTL, summary, facts)
+        if len(_summary_cache) > _SUMMARY_CACHE_MAXSIZE:
+            _summary_cache.popitem(last=False)
+
+        return summary, facts
+
+    async def _cached_llm_call(
+        self,
+        cache_key: str,
+        call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return a cached LLM result, or make the call and cache its result.
+
+        Keys include the dataset summary, so new or changed records produce a
+        new key instead of serving a stale answer. Failed calls are not cached.
+
+        Args:
+            cache_key: Key from ``make_cache_key``
+            call: Zero-argument callable making the LLM request
+
+        Returns:
+            JSON-serializable LLM result
+        """
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Insight cache hit ({cache_key})")
+            return orjson.loads(cached)
+
+        result = await call()
+        await response_cache.set(
+            cache_key,
+            orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+        )
+        return result
+
     async def _identify_trends(
         self,
         dataset_id: UUID,
-        summary: dict[str, Any]
+        facts: SummaryFacts
     ) -> list[dict[str, Any]]:
         """Identify trends in time-series data."""
         trends = []
 
         # Look for date/time columns
-        columns = summary.get("columns", {})
-        date_columns = [
-            col_name for col_name, col_info in columns.items()
-            if col_info.get("type") in ["date", "datetime", "timestamp"]
-        ]
-
-        if not date_columns:
+        if not facts.date_columns:
             return trends
 
         # Analyze trends for numeric columns over time
-        numeric_columns = summary.get("numeric_columns", [])
-
-        for date_col in date_columns[:1]:  # Limit to first date column
-            for num_col in numeric_columns[:3]:  # Limit to first 3 numeric columns
-                try:
-                    trend_data = await self.aggregator.group_by_time(
-                        dataset_id=dataset_id,
-                        date_column=date_col,
-                        interval="month",
-                        metric={"column": num_col, "aggregation": "avg"}
-                    )
-
-                    if trend_data.get("data"):
-                        trends.append({
-                            "time_column": date_col,
-                            "metric_column": num_col,
-                            "data_points": len(trend_data["data"]),
-                            "summary": f"Analyzed {num_col} over time"
-                        })
-
-                except Exception as e:
-                    logger.warning(f"Failed to analyze trend for {num_col}: {e}")
+        date_col = facts.date_columns[0]  # Limit to first date column
+        numeric_columns = facts.numeric_columns[:3]  # Limit to first 3 numeric columns
+
+        results = await asyncio.gather(*(
+            self._aggregate(
+                "group_by_time",
+                dataset_id=dataset_id,
+                date_column=date_col,
+                interval="month",
+                metric={"column": num_col, "aggregation": "avg"}
+            )
+            for num_col in numeric_columns
+        ), return_exceptions=True)
+
+        for num_col, trend_data in zip(numeric_columns, results):
+            if isinstance(trend_data, Exception):
+                logger.warning(f"Failed to analyze trend for {num_col}: {trend_data}")
+                continue
+
+            if trend_data.get("data"):
+                trends.append({
+                    "time_column": date_col,
+                    "metric_column": num_col,
+                    "data_points": len(trend_data["data"]),
+                    "summary": f"Analyzed {num_col} over time"
+                })
 
         return trends
 
     async def _find_correlations(
         self,
         dataset_id: UUID,
-        summary: dict[str, Any]
+        facts: SummaryFacts
     ) -> list[dict[str, Any]]:
         """Find correlations between numeric columns."""
-        correlations = []
-        numeric_columns = summary.get("numeric_columns", [])
+        numeric_columns = list(facts.numeric_columns[:MAX_CORRELATION_MATRIX_COLUMNS])
 
-        # Limit to top correlations to avoid too many API calls
+        # Limit to top correlations to keep the prompt focused
         max_pairs = 5
-        count = 0
-
-        for i, col1 in enumerate(numeric_columns):
-            for col2 in numeric_columns[i+1:]:
-                if count >= max_pairs:
-                    break
-
-                try:
-                    corr_result = await self.aggregator.calculate_correlation(
-                        dataset_id=dataset_id,
-                        column1=col1,
-                        column2=col2
-                    )
 
-                    if "error" not in corr_result:
-                        # Only include significant correlations
-                        if abs(corr_result.get("correlation", 0)) > 0.5:
-                            correlations.append(corr_result)
-                            count += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to calculate correlation for {col1} and {col2}: {e}")
+        # All pairs in one scan rather than one query per pair
+        try:
+            matrix = await self._aggregate(
+                "calculate_correlation_matrix",
+                dataset_id=dataset_id,
+                columns=numeric_columns
+            )
+        except Exception as e:
+            logger.warning(f"Failed to calculate correlations: {e}")
+            return []
 
-        return correlations
+        # Only include significant correlations
+        return [
+            corr_result for corr_result in matrix
+            if abs(corr_result["correlation"]) > 0.5
+        ][:max_pairs]
 
     async def _detect_anomalies(
         self,
         dataset_id: UUID,
-        summary: dict[str, Any]
+        facts: SummaryFacts
     ) -> list[dict[str, Any]]:
         """Detect anomalies in numeric columns."""
-        anomalies = []
-        numeric_columns = summary.get("numeric_columns", [])
-
         # Limit to first few columns
-        for col in numeric_columns[:5]:
-            try:
-                outliers = await self.aggregator.detect_outliers(
-                    dataset_id=dataset_id,
-                    column=col,
-                    method="iqr"
-                )
+        numeric_columns = list(facts.numeric_columns[:5])
 
-                if "error" not in outliers and outliers.get("outlier_count", 0) > 0:
-                    anomalies.append({
-                        "column": col,
-                        "outlier_count": outliers["outlier_count"],
-                        "total_records": outliers["total_records"],
-                        "method": outliers["method"]
-                    })
+        try:
+            results = await self._aggregate(
+                "detect_outliers_batch",
+                dataset_id=dataset_id,
+                columns=numeric_columns
+            )
+        except Exception as e:
+            logger.warning(f"Failed to detect outliers: {e}")
+            return []
 
-            except Exception as e:
-                logger.warning(f"Failed to detect outliers for {col}: {e}")
+        return [
+            {
+                "column": outliers["column"],
+                "outlier_count": outliers["outlier_count"],
+                "total_records": outliers["total_records"],
+                "method": outliers["method"]
+            }
+            for outliers in results
+            if outliers["outlier_count"] > 0
+        ]
 
-        return anomalies
+    async def _aggregate(self, method: str, **kwargs: Any) -> dict[str, Any]:
+        """
+        Run one AggregationService query on its own short-lived session.
+
+        Args:
+            method: AggregationService method name
+            **kwargs: Arguments for the method
+
+        Returns:
+            Method result
+        """
+        async with self._analysis_slots:
+            async with self.session_factory() as session:
+                return await getattr(AggregationService(session), method)(**kwargs)
 
     def _build_insight_prompt(
         self,
-        summary: dict[str, Any],
+        facts: SummaryFacts,
         trends: list[dict[str, Any]],
         correlations: list[dict[str, Any]],
         anomalies: list[dict[str, Any]]
@@ -419,10 +762,10 @@ Be specific and reference the actual data being visualized."""
         """Build the insight generation prompt."""
         # Format summary
         dataset_summary = f"""
-Dataset: {summary.get('dataset_name', 'Unknown')}
-Rows: {summary.get('row_count', 0):,}
-Columns: {summary.get('column_count', 0)}
-Data Quality Score: {summary.get('data_quality_score', 0)}/100
+Dataset: {facts.dataset_name}
+Rows: {facts.row_count:,}
+Columns: {facts.column_count}
+Data Quality Score: {facts.data_quality_score}/100
 """
 
         # Format trends
@@ -449,22 +792,18 @@ Data Quality Score: {summary.get('data_quality_score', 0)}/100
                 for a in anomalies
             ])
 
-        # Build full prompt
-        prompt = INSIGHT_GENERATION_PROMPT.format(
+        # Build full prompt (anomalies section included) in one pass
+        return _INSIGHT_PROMPT_TEMPLATE.render(
             dataset_summary=dataset_summary,
-            statistical_analysis=f"Quality Score: {summary.get('data_quality_score', 0)}/100",
+            statistical_analysis=f"Quality Score: {facts.data_quality_score}/100",
             correlations=correlations_text,
-            trends=trends_text
+            trends=trends_text,
+            anomalies=anomalies_text
         )
 
-        # Add anomalies section
-        prompt += f"\n\nAnomalies Detected:\n{anomalies_text}"
-
-        return prompt
-
     def _generate_fallback_insights(
         self,
-        summary: dict[str, Any],
+        facts: SummaryFacts,
         trends: list[dict[str, Any]],
         correlations: list[dict[str, Any]],
         anomalies: list[dict[str, Any]]
@@ -473,7 +812,7 @@ Data Quality Score: {summary.get('data_quality_score', 0)}/100
         insights = []
 
         # Data quality insight
-        quality_score = summary.get("data_quality_score", 0)
+        quality_score = facts.data_quality_score
         if quality_score < 80:
             insights.append({
                 "type": "summary",
@@ -497,7 +836,7 @@ Data Quality Score: {summary.get('data_quality_score', 0)}/100
 
         # Anomaly insights
         if anomalies:
-            total_anomalies = sum(a["outlier_count"] for a in anomalies)
+            total_anomalies = sum(map(itemgetter("outlier_count"), anomalies))
             insights.append({
                 "type": "anomaly",
                 "title": f"Outliers Detected in {len(anomalies)} Columns",
@@ -515,30 +854,26 @@ Data Quality Score: {summary.get('data_quality_score', 0)}/100
         organization_id: UUID,
         insights: list[dict[str, Any]]
     ):
-        """Save insights to database."""
-        for insight_data in insights:
-            try:
-                # Map insight type string to enum
-                insight_type_str = insight_data.get("type", "summary")
-                insight_type = InsightType(insight_type_str) if insight_type_str in [t.value for t in InsightType] else InsightType.SUMMARY
-
-                insight = Insight(
-                    dataset_id=dataset_id,
-                    organization_id=organization_id,
-                    insight_type=insight_type,
-                    title=insight_data.get("title", "Insight"),
-                    description=insight_data.get("description", ""),
-                    confidence=insight_data.get("confidence", 0.5),
-                    data_support=insight_data.get("supporting_data", {}),
-                    suggested_action=insight_data.get("suggested_action"),
-                    generated_by=InsightGeneratorEnum.LLM
-                )
-
-                self.db.add(insight)
-
-            except Exception as e:
-                logger.error(f"Failed to save insight: {e}")
+        """Save insights to database in a single multi-row INSERT."""
+        rows = [
+            {
+                "dataset_id": dataset_id,
+                "organization_id": organization_id,
+                "insight_type": _INSIGHT_TYPES.get(insight_data.get("type", "summary"), InsightType.SUMMARY),
+                "title": insight_data.get("title", "Insight"),
+                "description": insight_data.get("description", ""),
+                "confidence": insight_data.get("confidence", 0.5),
+                "data_support": insight_data.get("supporting_data", {}),
+                "suggested_action": insight_data.get("suggested_action"),
+                "generated_by": InsightGeneratorEnum.LLM
+            }
+            for insight_data in insights
+            if isinstance(insight_data, dict)
+        ]
+        if not rows:
+            return
 
+        await self.db.execute(insert(Insight), rows)
         await self.db.commit()
 
     async def _get_sample_data(
@@ -547,34 +882,22 @@ Data Quality Score: {summary.get('data_quality_score', 0)}/100
         limit: int = 10
     ) -> list[dict[str, Any]]:
         """Get sample data records."""
-        from sqlalchemy import select, text
-        from app.models import Record
-
         query = select(Record.data).where(
             Record.dataset_id == dataset_id,
-            Record.is_valid == True
-        ).limit(limit)
+            Record.is_valid == True,
+            Record.data.is_not(None)
+        ).limit(limit).execution_options(yield_per=_SAMPLE_FETCH_SIZE)
 
-        result = await self.db.execute(query)
-        rows = result.scalars().all()
-
-        return [row for row in rows if row]
+        # Stream so large samples are fetched in chunks rather than all at once
+        result = await self.db.stream_scalars(query)
+        return [row async for row in result if row]
 
     def _format_column_stats(self, columns: dict[str, Any]) -> str:
         """Format column statistics for prompts."""
-        lines = []
-        for col_name, col_info in columns.items():
-            col_type = col_info.get("type", "unknown")
-            stats = col_info.get("stats", {})
-
-            if col_type == "numeric" and stats:
-                lines.append(f"{col_name} ({col_type}): mean={stats.get('mean', 0):.2f}, median={stats.get('median', 0):.2f}")
-            elif col_type in ["categorical", "text"] and stats:
-                lines.append(f"{col_name} ({col_type}): {stats.get('unique_values', 0)} unique values")
-            else:
-                lines.append(f"{col_name} ({col_type})")
-
-        return "\n  ".join(lines)
+        return "\n  ".join(
+            _format_column_line(col_name, col_info)
+            for col_name, col_info in columns.items()
+        )
 
 
 # Factory function
@@ -5,10 +5,66 @@ Provides structured prompts for various data analysis tasks including
 summaries, insights, chart suggestions, anomaly detection, and Q&A.
 """
 
-from typing import Any
-
-
-# System prompts for different roles
+import io
+import sys
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Iterable, Union
+
+
+class PromptTemplate(str):
+    """
+    Prompt template parsed once at import.
+
+    Still a plain string (``format``, concatenation and comparisons behave as
+    before); ``render`` substitutes fields from the pre-parsed segments
+    instead of re-parsing the template on every call.
+    """
+
+    def __new__(cls, template: str):
+        self = super().__new__(cls, template)
+        parts = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if conversion or (format_spec and "{" in format_spec):
+                raise ValueError(f"Unsupported template field: {field_name}")
+            parts.append((literal, field_name, format_spec or ""))
+        self._parts = tuple(parts)
+        return self
+
+    def render(self, **values: Any) -> str:
+        """
+        Render the template; equivalent to ``str.format(**values)``.
+
+        Args:
+            **values: Field values
+
+        Returns:
+            Rendered prompt
+        """
+        return "".join([
+            literal if field_name is None else literal + format(values[field_name], format_spec)
+            for literal, field_name, format_spec in self._parts
+        ])
+
+
+def render_prompt_batch(specs: Iterable[tuple[PromptTemplate, dict[str, Any]]]) -> list[str]:
+    """
+    Render several prompts up front so they can be dispatched together.
+
+    Pass the result to ``LLMClient.generate_many`` to send the requests
+    concurrently instead of rendering and awaiting one prompt at a time.
+
+    Args:
+        specs: ``(template, values)`` pairs
+
+    Returns:
+        Rendered prompts, in spec order
+    """
+    return [template.render(**values) for template, values in specs]
+
+
+# System prompts for different roles. Interned so every route that sends the
+# same role shares one string object.
 SYSTEM_PROMPTS = {
     "data_analyst": """You are an expert data analyst with deep knowledge of statistics,
 data visualization, and business intelligence. You provide clear, actionable insights
@@ -20,12 +76,16 @@ data analysis results in clear, accessible language for business users.""",
     "statistician": """You are a professional statistician with expertise in
 statistical analysis, hypothesis testing, and data quality assessment.""",
 }
+SYSTEM_PROMPTS = {role: sys.intern(prompt) for role, prompt in SYSTEM_PROMPTS.items()}
 
 
-# Dataset Summary Prompt
-DATASET_SUMMARY_PROMPT = """Analyze this dataset and provide a comprehensive summary.
+# Templates put the fixed instructions and response format first and the
+# per-request data last, so consecutive requests share the longest possible
+# prefix for provider-side prompt caching. Keep the static part byte-stable.
 
-Dataset Information:
+# Dataset block shared by the summary and question templates; defined once so
+# both routes send it byte-identical
+_DATASET_INFO_FIELDS = sys.intern("""Dataset Information:
 - Name: {dataset_name}
 - Rows: {row_count:,}
 - Columns: {column_count}
@@ -34,10 +94,10 @@ Schema:
 {schema}
 
 Column Statistics:
-{column_stats}
+{column_stats}""")
 
-Sample Data (first 5 rows):
-{sample_data}
+# Dataset Summary Prompt
+DATASET_SUMMARY_PROMPT = PromptTemplate("""Analyze the dataset below and provide a comprehensive summary.
 
 Please provide:
 1. A brief overview of what this dataset contains
@@ -46,23 +106,16 @@ Please provide:
 4. Notable patterns or initial observations
 5. Suggestions for potential analyses
 
-Keep your response concise and business-focused."""
-
+Keep your response concise and business-focused.
 
-# Insight Generation Prompt
-INSIGHT_GENERATION_PROMPT = """Analyze this dataset and generate data-driven insights.
-
-Dataset Summary:
-{dataset_summary}
+""" + _DATASET_INFO_FIELDS + """
 
-Statistical Analysis:
-{statistical_analysis}
+Sample Data (first 5 rows):
+{sample_data}""")
 
-Correlations:
-{correlations}
 
-Trends:
-{trends}
+# Insight Generation Prompt
+INSIGHT_GENERATION_PROMPT = PromptTemplate("""Analyze the dataset below and generate data-driven insights.
 
 Instructions:
 1. Identify 3-5 significant insights from the data
@@ -89,20 +142,23 @@ Respond with a JSON array of insights:
     }},
     "suggested_action": "Optional recommendation based on this insight"
   }}
-]"""
+]
 
+Dataset Summary:
+{dataset_summary}
 
-# Chart Suggestion Prompt
-CHART_SUGGESTION_PROMPT = """Recommend the best chart type for visualizing this data.
+Statistical Analysis:
+{statistical_analysis}
 
-Dataset Schema:
-{schema}
+Correlations:
+{correlations}
 
-Column Types:
-{column_types}
+Trends:
+{trends}""")
 
-User Question/Goal:
-{user_question}
+
+# Chart Suggestion Prompt
+CHART_SUGGESTION_PROMPT = PromptTemplate("""Recommend the best chart type for visualizing the data described below.
 
 Available Chart Types:
 - line: Time series, trends over continuous data
@@ -113,9 +169,6 @@ Available Chart Types:
 - area: Cumulative trends over time
 - table: Detailed data inspection
 
-Available Columns:
-{available_columns}
-
 Instructions:
 1. Recommend the MOST appropriate chart type
 2. Specify which columns to use for X and Y axes (or other dimensions)
@@ -132,29 +185,23 @@ Respond with JSON:
   "reasoning": "Explanation of why this visualization is appropriate",
   "alternative_charts": ["line", "area"],
   "confidence": 0.9
-}}"""
+}}
 
+Dataset Schema:
+{schema}
 
-# Anomaly Detection Prompt
-ANOMALY_DETECTION_PROMPT = """Analyze this data for anomalies and provide explanations.
+Column Types:
+{column_types}
 
-Column: {column_name}
-Type: {column_type}
+Available Columns:
+{available_columns}
 
-Statistics:
-- Mean: {mean}
-- Median: {median}
-- Std Dev: {std}
-- Min: {min_val}
-- Max: {max_val}
-- Q1: {q1}
-- Q3: {q3}
+User Question/Goal:
+{user_question}""")
 
-Detected Outliers:
-{outliers}
 
-Time Series Context (if applicable):
-{time_context}
+# Anomaly Detection Prompt
+ANOMALY_DETECTION_PROMPT = PromptTemplate("""Analyze the column data below for anomalies and provide explanations.
 
 Instructions:
 1. Analyze the detected outliers
@@ -181,28 +228,29 @@ Respond with JSON:
     }}
   ],
   "overall_assessment": "General assessment of data quality for this column"
-}}"""
+}}
 
+Column: {column_name}
+Type: {column_type}
 
-# Data Question Answering Prompt
-DATA_QUESTION_PROMPT = """Answer the user's question about their dataset.
-
-Dataset Information:
-- Name: {dataset_name}
-- Rows: {row_count:,}
-- Columns: {column_count}
+Statistics:
+- Mean: {mean}
+- Median: {median}
+- Std Dev: {std}
+- Min: {min_val}
+- Max: {max_val}
+- Q1: {q1}
+- Q3: {q3}
 
-Schema:
-{schema}
+Detected Outliers:
+{outliers}
 
-Column Statistics:
-{column_stats}
+Time Series Context (if applicable):
+{time_context}""")
 
-Sample Data:
-{sample_data}
 
-User Question:
-{user_question}
+# Data Question Answering Prompt
+DATA_QUESTION_PROMPT = PromptTemplate("""Answer the user's question about their dataset, described below.
 
 Instructions:
 1. Answer the question directly and clearly
@@ -211,11 +259,28 @@ Instructions:
 4. Provide relevant statistics or examples
 5. Suggest follow-up analyses if appropriate
 
-Keep your response conversational but precise. Use numbers and specifics from the data."""
+Keep your response conversational but precise. Use numbers and specifics from the data.
+
+""" + _DATASET_INFO_FIELDS + """
+
+Sample Data:
+{sample_data}
+
+User Question:
+{user_question}""")
 
 
 # Correlation Explanation Prompt
-CORRELATION_EXPLANATION_PROMPT = """Explain the correlation between two variables.
+CORRELATION_EXPLANATION_PROMPT = PromptTemplate("""Explain the correlation between the two variables described below.
+
+Instructions:
+1. Explain what this correlation means in plain language
+2. Describe the relationship (positive/negative, strong/weak)
+3. Provide real-world interpretation
+4. Note any limitations or caveats
+5. Suggest potential follow-up analyses
+
+Keep it accessible for non-technical users.
 
 Variable 1: {column1}
 Variable 2: {column2}
@@ -232,34 +297,11 @@ Statistics for {column1}:
 Statistics for {column2}:
 - Mean: {col2_mean}
 - Std: {col2_std}
-- Range: {col2_min} to {col2_max}
-
-Instructions:
-1. Explain what this correlation means in plain language
-2. Describe the relationship (positive/negative, strong/weak)
-3. Provide real-world interpretation
-4. Note any limitations or caveats
-5. Suggest potential follow-up analyses
-
-Keep it accessible for non-technical users."""
+- Range: {col2_min} to {col2_max}""")
 
 
 # Trend Analysis Prompt
-TREND_ANALYSIS_PROMPT = """Analyze trends in this time series data.
-
-Column: {column_name}
-Time Column: {time_column}
-Interval: {interval}
-
-Data Points:
-{time_series_data}
-
-Statistics:
-- Starting Value: {start_value}
-- Ending Value: {end_value}
-- Change: {change_value} ({change_percent}%)
-- Average Value: {avg_value}
-- Volatility (Std): {volatility}
+TREND_ANALYSIS_PROMPT = PromptTemplate("""Analyze trends in the time series data below.
 
 Instructions:
 1. Identify the overall trend (increasing, decreasing, stable, volatile)
@@ -281,11 +323,34 @@ Respond with JSON:
     "Specific recommendation based on trend"
   ],
   "forecast_suggestion": "Optional: methodology for forecasting"
-}}"""
+}}
+
+Column: {column_name}
+Time Column: {time_column}
+Interval: {interval}
+
+Data Points:
+{time_series_data}
+
+Statistics:
+- Starting Value: {start_value}
+- Ending Value: {end_value}
+- Change: {change_value} ({change_percent}%)
+- Average Value: {avg_value}
+- Volatility (Std): {volatility}""")
 
 
 # Dataset Comparison Prompt
-DATASET_COMPARISON_PROMPT = """Compare two datasets and highlight key differences.
+DATASET_COMPARISON_PROMPT = PromptTemplate("""Compare the two datasets below and highlight key differences.
+
+Instructions:
+1. Summarize the main differences between datasets
+2. Highlight significant changes in data distributions
+3. Identify new or removed columns
+4. Note any data quality differences
+5. Provide context on what these differences might indicate
+
+Keep the comparison structured and easy to understand.
 
 Dataset 1:
 - Name: {dataset1_name}
@@ -301,20 +366,20 @@ Schema Differences:
 {schema_differences}
 
 Distribution Comparisons (for common numeric columns):
-{distribution_comparisons}
+{distribution_comparisons}""")
 
-Instructions:
-1. Summarize the main differences between datasets
-2. Highlight significant changes in data distributions
-3. Identify new or removed columns
-4. Note any data quality differences
-5. Provide context on what these differences might indicate
 
-Keep the comparison structured and easy to understand."""
+# Column Profiling Summary Prompt
+COLUMN_PROFILING_SUMMARY_PROMPT = PromptTemplate("""Provide a detailed profile summary for the column below.
 
+Instructions:
+1. Describe the column's characteristics
+2. Note data quality (completeness, outliers, consistency)
+3. Suggest appropriate uses for this column in analysis
+4. Recommend any data cleaning steps if needed
+5. Identify potential issues or interesting patterns
 
-# Column Profiling Summary Prompt
-COLUMN_PROFILING_SUMMARY_PROMPT = """Provide a detailed profile summary for this column.
+Keep it concise and actionable.
 
 Column: {column_name}
 Type: {column_type}
@@ -329,29 +394,13 @@ Null Analysis:
 - Null Count: {null_count}
 - Completeness: {completeness}%
 
-{additional_info}
-
-Instructions:
-1. Describe the column's characteristics
-2. Note data quality (completeness, outliers, consistency)
-3. Suggest appropriate uses for this column in analysis
-4. Recommend any data cleaning steps if needed
-5. Identify potential issues or interesting patterns
-
-Keep it concise and actionable."""
+{additional_info}""")
 
 
 # Chart Configuration Prompt
-CHART_CONFIG_PROMPT = """Generate a detailed configuration for a {chart_type} chart.
-
-Data to Visualize:
-{data_description}
-
-User Requirements:
-{user_requirements}
+CHART_CONFIG_PROMPT = PromptTemplate("""Generate a detailed configuration for the chart described below.
 
 Available Options:
-- Colors: {color_schemes}
 - Themes: light, dark
 - Aggregations: sum, avg, count, min, max
 - Grouping: available
@@ -378,26 +427,21 @@ Respond with JSON:
     "stacked": false,
     "smooth": true
   }}
-}}"""
+}}
 
+Chart Type: {chart_type}
 
-# Data Quality Assessment Prompt
-DATA_QUALITY_ASSESSMENT_PROMPT = """Assess the overall quality of this dataset.
+Available Colors: {color_schemes}
 
-Dataset: {dataset_name}
-Total Records: {row_count:,}
-Total Fields: {column_count}
-
-Missing Values:
-{missing_analysis}
+Data to Visualize:
+{data_description}
 
-Outliers Detected:
-{outliers_summary}
+User Requirements:
+{user_requirements}""")
 
-Column Types Distribution:
-{column_types_dist}
 
-Data Completeness: {completeness_score}%
+# Data Quality Assessment Prompt
+DATA_QUALITY_ASSESSMENT_PROMPT = PromptTemplate("""Assess the overall quality of the dataset below.
 
 Instructions:
 1. Provide an overall data quality score (0-100)
@@ -423,25 +467,61 @@ Respond with JSON:
     "Prioritized list of actions to improve quality"
   ],
   "ready_for_analysis": true
-}}"""
+}}
 
+Dataset: {dataset_name}
+Total Records: {row_count:,}
+Total Fields: {column_count}
 
-# Helper function to format data for prompts
-def format_schema(columns: list[dict]) -> str:
-    """Format schema information for prompts."""
-    lines = []
-    for col in columns:
-        col_type = col.get("type", "unknown")
-        col_name = col.get("name", "unknown")
-        nullable = " (nullable)" if col.get("nullable", False) else ""
-        lines.append(f"  - {col_name}: {col_type}{nullable}")
-    return "\n".join(lines)
+Missing Values:
+{missing_analysis}
 
+Outliers Detected:
+{outliers_summary}
 
-def format_stats(stats: dict[str, Any]) -> str:
-    """Format statistics for prompts."""
+Column Types Distribution:
+{column_types_dist}
+
+Data Completeness: {completeness_score}%""")
+
+
+# Formatted helper output is memoized on hashable tuple keys, so a dataset
+# that drives several prompts in one request is only formatted once
+_FORMAT_CACHE_MAXSIZE = 1024
+
+SchemaColumns = tuple[tuple[Any, Any, bool], ...]
+ColumnPairs = tuple[tuple[Any, Any], ...]
+
+
+def schema_key(columns: list[dict]) -> SchemaColumns:
+    """Convert column dicts to hashable ``(name, type, nullable)`` triples."""
+    return tuple(
+        (
+            col.get("name", "unknown"),
+            col.get("type", "unknown"),
+            bool(col.get("nullable", False))
+        )
+        for col in columns
+    )
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_MAXSIZE)
+def _format_schema(columns: SchemaColumns) -> str:
+    return "\n".join(
+        f"  - {col_name}: {col_type}{' (nullable)' if nullable else ''}"
+        for col_name, col_type, nullable in columns
+    )
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_MAXSIZE)
+def _format_column_list(columns: ColumnPairs) -> str:
+    return "\n".join(f"  - {col_name} ({col_type})" for col_name, col_type in columns)
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_MAXSIZE)
+def _format_stats(items: tuple[tuple[str, type, Any], ...]) -> str:
     lines = []
-    for key, value in stats.items():
+    for key, _, value in items:
         if isinstance(value, float):
             lines.append(f"  {key}: {value:.2f}")
         elif isinstance(value, int):
@@ -451,6 +531,26 @@ def format_stats(stats: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# Helper function to format data for prompts
+def format_schema(columns: Union[list[dict], SchemaColumns]) -> str:
+    """Format schema information for prompts (column dicts or ``schema_key`` triples)."""
+    if not isinstance(columns, tuple):
+        columns = schema_key(columns)
+    return _format_schema(columns)
+
+
+def format_stats(stats: dict[str, Any]) -> str:
+    """Format statistics for prompts."""
+    # The value type is part of the key: 1, 1.0 and True compare equal but
+    # format differently
+    items = tuple((key, type(value), value) for key, value in stats.items())
+    try:
+        return _format_stats(items)
+    except TypeError:
+        # Unhashable values (lists, nested dicts) can't be cached
+        return _format_stats.__wrapped__(items)
+
+
 def format_sample_data(data: list[dict], limit: int = 5) -> str:
     """Format sample data as a readable table."""
     if not data:
@@ -459,26 +559,31 @@ def format_sample_data(data: list[dict], limit: int = 5) -> str:
     # Take only first N rows
     sample = data[:limit]
 
-    # Format as simple table
-    if sample:
-        headers = list(sample[0].keys())
-        lines = ["  " + " | ".join(headers)]
-        lines.append("  " + "-" * (len(lines[0]) - 2))
-
-        for row in sample:
-            values = [str(row.get(h, ""))[:20] for h in headers]  # Truncate long values
-            lines.append("  " + " | ".join(values))
-
-        return "\n".join(lines)
-
-    return "  (No data)"
-
-
-def format_column_list(columns: list[dict]) -> str:
-    """Format column list with types."""
-    lines = []
-    for col in columns:
-        col_name = col.get("name", "unknown")
-        col_type = col.get("type", "unknown")
-        lines.append(f"  - {col_name} ({col_type})")
-    return "\n".join(lines)
+    # Format as a simple table with columns padded to their widest value
+    headers = list(sample[0].keys())
+    rows = [[str(row.get(h, ""))[:20] for h in headers] for row in sample]  # Truncate long values
+    widths = [
+        max(len(h), *(len(r[i]) for r in rows))
+        for i, h in enumerate(headers)
+    ]
+    separator = "-" * (sum(widths) + 3 * (len(widths) - 1))
+
+    buf = io.StringIO()
+    buf.write("  " + " | ".join(f"{h:<{w}}" for h, w in zip(headers, widths)))
+    buf.write(f"\n  {separator}")
+    for values in rows:
+        buf.write("\n  " + " | ".join(f"{v:<{w}}" for v, w in zip(values, widths)))
+
+    return buf.getvalue()
+
+
+def format_column_list(columns: Union[list[dict], SchemaColumns, ColumnPairs]) -> str:
+    """Format column list with types (column dicts or ``schema_key`` triples)."""
+    if isinstance(columns, tuple):
+        pairs = tuple(col[:2] for col in columns)
+    else:
+        pairs = tuple(
+            (col.get("name", "unknown"), col.get("type", "unknown"))
+            for col in columns
+        )
+    return _format_column_list(pairs)
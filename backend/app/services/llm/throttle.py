@@ -0,0 +1,183 @@
+"""
+Process-wide throttling for outbound LLM requests.
+
+Bounds the number of concurrent LLM calls per provider and adapts the request
+rate per model, so bursts of traffic queue locally instead of triggering
+provider rate limits and retry storms. LLMClient applies these limits to
+every request attempt.
+"""
+
+import asyncio
+import time
+import weakref
+
+from app.core.config import settings
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiter allowing `rate` acquisitions per `period` seconds.
+
+    Bursts up to `rate` are allowed; beyond that, callers wait until tokens
+    are replenished.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Number of acquisitions allowed per period
+            period: Period length in seconds
+        """
+        self.capacity = float(rate)
+        self.fill_rate = rate / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+class AdaptiveTokenBucket(AsyncRateLimiter):
+    """
+    Token bucket whose refill rate adapts to provider feedback.
+
+    The rate backs off multiplicatively when the provider throttles or errors
+    and recovers additively on success (AIMD), so concurrent callers converge
+    on the sustainable rate instead of retrying in synchronized bursts.
+    """
+
+    def __init__(
+        self,
+        rate: int,
+        period: float = 60.0,
+        min_rate: int = 1,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5
+    ):
+        """
+        Initialize adaptive token bucket.
+
+        Args:
+            rate: Maximum acquisitions per period (also the starting rate)
+            period: Period length in seconds
+            min_rate: Lowest acquisitions per period the bucket backs off to
+            increase_step: Fraction of the maximum rate regained per success
+            decrease_factor: Multiplier applied to the rate on throttling
+        """
+        super().__init__(rate, period)
+        self.max_fill_rate = self.fill_rate
+        self.min_fill_rate = min_rate / period
+        self.increase_step = self.max_fill_rate * increase_step
+        self.decrease_factor = decrease_factor
+
+    def increase_rate(self):
+        """Additively raise the rate after a successful request."""
+        self.fill_rate = min(self.max_fill_rate, self.fill_rate + self.increase_step)
+
+    def decrease_rate(self):
+        """Multiplicatively lower the rate and drop any saved-up burst."""
+        self.fill_rate = max(self.min_fill_rate, self.fill_rate * self.decrease_factor)
+        self._tokens = min(self._tokens, 0.0)
+
+
+# asyncio primitives are bound to the loop they are first used on, so keep one
+# set per running loop (Celery tasks may each run their own loop)
+_loop_buckets: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], AdaptiveTokenBucket]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_provider_bucket(provider: str, model: str) -> AdaptiveTokenBucket:
+    """
+    Get the adaptive rate limiter for a provider/model on the running loop.
+
+    Args:
+        provider: Provider name
+        model: Model name
+
+    Returns:
+        AdaptiveTokenBucket shared by all requests to that model
+    """
+    buckets = _loop_buckets.setdefault(asyncio.get_running_loop(), {})
+    bucket = buckets.get((provider, model))
+    if bucket is None:
+        bucket = AdaptiveTokenBucket(settings.LLM_REQUESTS_PER_MINUTE, 60.0)
+        buckets[(provider, model)] = bucket
+    return bucket
+
+
+_loop_provider_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Runtime overrides of the configured per-provider concurrency
+_provider_concurrency: dict[str, int] = {}
+
+
+def _configured_concurrency(provider: str) -> int:
+    if provider in _provider_concurrency:
+        return _provider_concurrency[provider]
+    if provider == "anthropic":
+        return settings.ANTHROPIC_CONCURRENCY
+    if provider == "openai":
+        return settings.OPENAI_CONCURRENCY
+    return settings.LLM_CONCURRENCY
+
+
+def get_provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """
+    Get the semaphore capping in-flight requests to a provider on the running loop.
+
+    Args:
+        provider: Provider name
+
+    Returns:
+        Semaphore shared by all requests to that provider
+    """
+    semaphores = _loop_provider_semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = semaphores.get(provider)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_configured_concurrency(provider))
+        semaphores[provider] = semaphore
+    return semaphore
+
+
+def set_provider_concurrency(provider: str, limit: int):
+    """
+    Change the in-flight request cap for a provider.
+
+    Requests already holding a slot finish under the old cap; new requests
+    use the new one.
+
+    Args:
+        provider: Provider name
+        limit: Maximum concurrent requests
+    """
+    if limit < 1:
+        raise ValueError("Concurrency limit must be at least 1")
+
+    _provider_concurrency[provider] = limit
+    for semaphores in _loop_provider_semaphores.values():
+        semaphores.pop(provider, None)
+
@@ -1,7 +1,9 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import JSON, cast, delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status, Depends
 
@@ -16,10 +18,8 @@ class OrganizationService:
         self.db = db
 
     async def get_by_id(self, organization_id: UUID) -> Optional[Organization]:
-        result = await self.db.execute(
-            select(Organization).where(Organization.id == organization_id)
-        )
-        return result.scalar_one_or_none()
+        # Served from the identity map when the organization is already loaded
+        return await self.db.get(Organization, organization_id)
 
     async def get_by_slug(self, slug: str) -> Optional[Organization]:
         result = await self.db.execute(
@@ -28,23 +28,27 @@ class OrganizationService:
         return result.scalar_one_or_none()
 
     async def create(self, org_data: OrganizationCreate) -> Organization:
-        # Check if slug already exists
-        existing_org = await self.get_by_slug(org_data.slug)
-        if existing_org:
+        # Insert unless the slug is taken; the unique index on slug makes the
+        # check atomic, so concurrent creates can't both succeed
+        result = await self.db.execute(
+            insert(Organization)
+            .values(
+                name=org_data.name,
+                slug=org_data.slug,
+                settings=org_data.settings or {}
+            )
+            .on_conflict_do_nothing(index_elements=[Organization.slug])
+            .returning(Organization)
+        )
+        organization = result.scalar_one_or_none()
+
+        if not organization:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Organization with this slug already exists"
             )
 
-        organization = Organization(
-            name=org_data.name,
-            slug=org_data.slug,
-            settings=org_data.settings or {}
-        )
-
-        self.db.add(organization)
         await self.db.commit()
-        await self.db.refresh(organization)
 
         return organization
 
@@ -53,18 +57,10 @@ class OrganizationService:
         organization_id: UUID,
         update_data: OrganizationUpdate
     ) -> Organization:
-        organization = await self.get_by_id(organization_id)
-
-        if not organization:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Organization not found"
-            )
-
         # Check slug uniqueness if being updated
-        if update_data.slug and update_data.slug != organization.slug:
+        if update_data.slug:
             existing_org = await self.get_by_slug(update_data.slug)
-            if existing_org:
+            if existing_org and existing_org.id != organization_id:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Organization with this slug already exists"
@@ -73,53 +69,88 @@ class OrganizationService:
         # Update only provided fields
         update_dict = update_data.model_dump(exclude_unset=True)
 
-        for field, value in update_dict.items():
-            setattr(organization, field, value)
+        if not update_dict:
+            organization = await self.get_by_id(organization_id)
+        else:
+            # Update and read back in one round-trip
+            try:
+                result = await self.db.execute(
+                    update(Organization)
+                    .where(Organization.id == organization_id)
+                    .values(**update_dict)
+                    .returning(Organization)
+                )
+            except IntegrityError:
+                # A concurrent write took the slug after the check above
+                await self.db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Organization with this slug already exists"
+                )
+            organization = result.scalar_one_or_none()
+
+        if not organization:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Organization not found"
+            )
 
         await self.db.commit()
-        await self.db.refresh(organization)
 
         return organization
 
     async def delete(self, organization_id: UUID) -> bool:
-        organization = await self.get_by_id(organization_id)
+        # Check if organization has users
+        user_count = await self.get_user_count(organization_id)
 
-        if not organization:
+        if user_count:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Organization not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot delete organization with {user_count} active users"
             )
 
-        # Check if organization has users
+        # Dependent rows are removed by the ON DELETE CASCADE foreign keys
         result = await self.db.execute(
-            select(User).where(User.organization_id == organization_id)
+            delete(Organization)
+            .where(Organization.id == organization_id)
+            .returning(Organization.id)
         )
-        users = result.scalars().all()
 
-        if users:
+        if result.scalar_one_or_none() is None:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot delete organization with {len(users)} active users"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Organization not found"
             )
 
-        await self.db.delete(organization)
         await self.db.commit()
 
         return True
 
     async def get_user_count(self, organization_id: UUID) -> int:
         result = await self.db.execute(
-            select(User).where(User.organization_id == organization_id)
+            select(func.count()).select_from(User).where(User.organization_id == organization_id)
         )
-        users = result.scalars().all()
-        return len(users)
+        return result.scalar_one()
 
     async def update_settings(
         self,
         organization_id: UUID,
         settings: dict
     ) -> Organization:
-        organization = await self.get_by_id(organization_id)
+        # Merge with existing settings server-side (jsonb ||) and read back
+        # in one round-trip
+        merged_settings = cast(
+            func.coalesce(cast(Organization.settings, JSONB), literal({}, JSONB))
+            .op("||")(literal(settings, JSONB)),
+            JSON
+        )
+        result = await self.db.execute(
+            update(Organization)
+            .where(Organization.id == organization_id)
+            .values(settings=merged_settings)
+            .returning(Organization)
+        )
+        organization = result.scalar_one_or_none()
 
         if not organization:
             raise HTTPException(
@@ -127,13 +158,7 @@ class OrganizationService:
                 detail="Organization not found"
             )
 
-        # Merge with existing settings
-        current_settings = organization.settings or {}
-        current_settings.update(settings)
-        organization.settings = current_settings
-
         await self.db.commit()
-        await self.db.refresh(organization)
 
         return organization
 
@@ -6,13 +6,52 @@ standardizing text case, removing outliers, normalizing dates, and cleaning nume
 """
 
 import logging
+import os
 import re
-from typing import Dict, List, Any, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Union, Tuple
 from datetime import datetime
 import pandas as pd
 import numpy as np
 from scipy import stats
 
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    # Only public from pandas 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+    _ARROW_STRINGS = False
+else:
+    # Arrow-backed strings run .str methods as native kernels over contiguous
+    # buffers instead of looping over Python objects
+    _ARROW_STRINGS = True
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+CLEANING_BACKENDS = ('pandas', 'polars', 'hash')
+
+# Characters clean_numeric strips by default: currency symbols, commas, spaces
+_DEFAULT_REMOVE_CHARS = ('$', '€', '£', '¥', '₹', ',', ' ', '%')
+
+# Leading non-null values normalize_dates tries when guessing a date format
+_DATE_FORMAT_SAMPLE_SIZE = 20
+
+# Strings clean_numeric's Arrow path parses itself (RE2 syntax); anything
+# else is left to pd.to_numeric
+_INTEGER_PATTERN = r'^[+-]?[0-9]+$'
+_DECIMAL_PATTERN = r'^[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?$'
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,10 +95,230 @@ class CleaningReport:
         }
 
 
+def _with_columns(dataframe: pd.DataFrame, updates: Dict[Any, pd.Series]) -> pd.DataFrame:
+    """
+    Return a shallow copy of a DataFrame with some columns replaced.
+
+    Untouched columns share memory with the input instead of being copied;
+    replaced columns are swapped in whole, so the input is never modified.
+    """
+    cleaned_df = dataframe.copy(deep=False)
+    for col, values in updates.items():
+        cleaned_df[col] = values
+    return cleaned_df
+
+
+@lru_cache(maxsize=64)
+def _remove_chars_pattern(remove_chars: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Compile one regex matching any of ``remove_chars``.
+
+    A character class is used when every entry is a single character and
+    escaped alternation otherwise. Returns None when there is nothing to remove.
+    """
+    if remove_chars and all(len(char) == 1 for char in remove_chars):
+        return re.compile('[' + re.escape(''.join(remove_chars)) + ']')
+    if any(remove_chars):
+        return re.compile('|'.join(re.escape(char) for char in remove_chars if char))
+    return None
+
+
+@lru_cache(maxsize=32)
+def _remove_chars_stripper(remove_chars: Tuple[str, ...]) -> Optional[Callable[[str], str]]:
+    """
+    Build a function deleting every character in ``remove_chars`` from a string.
+
+    Characters are removed with chained ``str.replace`` calls. Each call is
+    one C-level scan, and a string without the character comes back
+    untouched, so this beats running the regex engine per value. The larger
+    the set, the smaller the gain. Returns None when an entry is longer than
+    one character (removal order would then matter; use the regex from
+    ``_remove_chars_pattern``) or there is nothing to remove.
+    """
+    if any(len(char) > 1 for char in remove_chars):
+        return None
+    remove_chars = tuple(dict.fromkeys(char for char in remove_chars if char))
+    if not remove_chars:
+        return None
+    
+    def strip(value: str) -> str:
+        for char in remove_chars:
+            value = value.replace(char, '')
+        return value
+    
+    return strip
+
+
+def _as_strings(values: pd.Series) -> pd.Series:
+    """
+    Cast a column to strings the way ``astype(str)`` does.
+
+    The result is Arrow-backed (``string[pyarrow]``) when pyarrow is
+    installed, so ``.str`` methods run as Arrow kernels; columns already in
+    that form are returned as-is. Callers convert results back with
+    ``_from_strings`` unless Arrow output was asked for.
+    """
+    if not _ARROW_STRINGS:
+        return values.astype(str)
+    if values.hasnans:
+        # Missing values must become 'nan'/'None' strings, as with astype(str)
+        return values.astype(str).astype('string[pyarrow]')
+    if values.dtype == 'string[pyarrow]':
+        return values
+    if values.dtype == object:
+        # Build the Arrow array straight from the Python strings, skipping
+        # the intermediate object array; mixed-type columns fall through
+        try:
+            array = pa.chunked_array([pa.array(values.to_numpy(), type=pa.string())])
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        else:
+            return pd.Series(pd.arrays.ArrowStringArray(array), index=values.index, name=values.name)
+    return values.astype(str).astype('string[pyarrow]')
+
+
+def _from_strings(values: pd.Series, arrow_strings: bool) -> pd.Series:
+    """
+    Return ``_as_strings`` results as object-dtype strings, as ``astype(str)``
+    gives, unless ``arrow_strings`` asks to keep them Arrow-backed.
+    """
+    if arrow_strings or values.dtype == object:
+        return values
+    return values.astype(object)
+
+
+def _map_columns(func: Callable[[Any], Any], columns: List[Any], parallel: bool) -> List[Any]:
+    """
+    Apply ``func`` to each column name, in order.
+
+    With ``parallel``, columns are processed on a thread pool. This pays off
+    when the per-column work runs in kernels that release the GIL (NumPy,
+    Arrow-backed strings); object-dtype string methods mostly don't.
+    """
+    if parallel and len(columns) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as executor:
+            return list(executor.map(func, columns))
+    return [func(col) for col in columns]
+
+
+def _count_changed(original_values: pd.Series, before: pd.Series, after: pd.Series) -> int:
+    """Count non-null values whose string form differs between ``before`` and ``after``."""
+    changed = before.ne(after).to_numpy(dtype=bool, na_value=False)
+    return int((original_values.notna().to_numpy() & changed).sum())
+
+
+def _arrow_clean_numeric(
+    values: pd.Series,
+    remove_options: Optional['pc.ReplaceSubstringOptions']
+) -> Optional[Tuple[np.ndarray, pd.Series]]:
+    """
+    Strip characters and parse numbers with Arrow compute kernels.
+
+    Returns the mask of values cleaning changed and the numeric column, as
+    the pandas path in ``clean_numeric`` would, or None when the column
+    needs that path: non-string values, a pattern RE2 can't run, integers
+    beyond int64, or strings only ``pd.to_numeric`` parses (padded with
+    whitespace, 'inf', ...).
+    """
+    if len(values) == 0:
+        return None
+    try:
+        strings = pa.array(values.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+        if remove_options is None:
+            cleaned = strings
+        else:
+            cleaned = pc.replace_substring_regex(strings, options=remove_options)
+    except pa.ArrowException:
+        return None
+    
+    changed = pc.fill_null(pc.not_equal(strings, cleaned), False).to_numpy(zero_copy_only=False)
+    
+    # pd.to_numeric returns int64 only when every value is an integer
+    if strings.null_count == 0 and pc.all(pc.match_substring_regex(cleaned, _INTEGER_PATTERN)).as_py():
+        try:
+            numeric = pc.cast(cleaned, pa.int64()).to_numpy()
+        except pa.ArrowInvalid:
+            return None
+        return changed, pd.Series(numeric, index=values.index, name=values.name)
+    
+    is_decimal = pc.fill_null(pc.match_substring_regex(cleaned, _DECIMAL_PATTERN), False)
+    numeric = pc.cast(
+        pc.if_else(is_decimal, cleaned, pa.scalar(None, pa.string())),
+        pa.float64()
+    ).to_numpy(zero_copy_only=False)
+    if np.isinf(numeric).any():
+        # Overflow, which pd.to_numeric reports as a failure
+        return None
+    
+    # The rest must fail to parse in pandas too, or pandas handles the column
+    rest = np.flatnonzero(~is_decimal.to_numpy(zero_copy_only=False) & pc.is_valid(cleaned).to_numpy(zero_copy_only=False))
+    if len(rest) and pd.to_numeric(pd.Series(cleaned.take(rest).to_pylist(), dtype=object), errors='coerce').notna().any():
+        return None
+    
+    return changed, pd.Series(numeric, index=values.index, name=values.name)
+
+
+def _polars_duplicated(
+    dataframe: pd.DataFrame,
+    subset: Optional[List[str]],
+    keep: Union[str, bool]
+) -> np.ndarray:
+    """
+    Mark duplicate rows like ``DataFrame.duplicated``, hashing in Polars.
+
+    Only the duplicate mask is computed in Polars; the caller filters the
+    original pandas frame with it, so index and dtypes are preserved.
+    """
+    source = dataframe[subset] if subset else dataframe
+    # Polars needs unique string column names
+    source = source.set_axis([f"c{i}" for i in range(source.shape[1])], axis=1)
+    frame = pl.from_pandas(source, include_index=False)
+    
+    if keep is False:
+        return frame.is_duplicated().to_numpy()
+    
+    row = pl.struct(pl.all())
+    distinct = row.is_first_distinct() if keep == 'first' else row.is_last_distinct()
+    return ~frame.select(distinct).to_series().to_numpy()
+
+
+def _hashed_duplicated(
+    dataframe: pd.DataFrame,
+    subset: Optional[List[str]],
+    keep: Union[str, bool]
+) -> np.ndarray:
+    """
+    Mark duplicate rows like ``DataFrame.duplicated``, via 64-bit row hashes.
+
+    Rows whose hash is unique can't be duplicates. Only the rows sharing a
+    hash go through the exact ``duplicated`` check, so hash collisions never
+    drop distinct rows. Only integer and boolean columns are accepted: for
+    them equal values always hash equally, unlike floats (0.0 and -0.0) or
+    objects (1 and 1.0).
+
+    Raises:
+        TypeError: If a column has another dtype
+    """
+    source = dataframe[subset] if subset else dataframe
+    for dtype in source.dtypes:
+        if not (pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)):
+            raise TypeError(f"Row hashing supports integer and boolean columns only, not {dtype}")
+    hashes = pd.util.hash_pandas_object(source, index=False).to_numpy()
+    _, inverse, counts = np.unique(hashes, return_inverse=True, return_counts=True)
+    candidates = np.flatnonzero(counts[inverse] > 1)
+    
+    duplicate_mask = np.zeros(len(source), dtype=bool)
+    if len(candidates):
+        duplicate_mask[candidates] = source.iloc[candidates].duplicated(keep=keep).to_numpy()
+    return duplicate_mask
+
+
 def remove_duplicates(
     dataframe: pd.DataFrame,
     subset: Optional[Union[str, List[str]]] = None,
-    keep: str = 'first'
+    keep: str = 'first',
+    backend: str = 'pandas',
+    detailed_stats: bool = False
 ) -> Tuple[pd.DataFrame, CleaningReport]:
     """
     Remove duplicate rows from DataFrame.
@@ -68,6 +327,13 @@ def remove_duplicates(
         dataframe: Pandas DataFrame to clean
         subset: Column name(s) to consider for duplicates (None = all columns)
         keep: Which duplicates to keep ('first', 'last', or False to remove all)
+        backend: 'pandas', 'polars' to hash rows in Polars (multi-threaded;
+            requires polars), or 'hash' to compare 64-bit row hashes (pays
+            off on wide integer frames). Both fall back to pandas for columns
+            they can't handle.
+        detailed_stats: Count duplicate groups exactly, at the cost of a
+            second hash pass. Otherwise ``duplicate_groups`` is estimated from
+            the removed rows (exact when every group is a pair).
 
     Returns:
         Tuple of (cleaned_dataframe, report)
@@ -77,6 +343,14 @@ def remove_duplicates(
     """
     report = CleaningReport('remove_duplicates')
     
+    if backend not in CLEANING_BACKENDS:
+        raise CleaningError(f"Invalid backend '{backend}'. Valid backends: {list(CLEANING_BACKENDS)}")
+    if backend == 'polars' and pl is None:
+        raise CleaningError("The polars backend requires the polars package")
+    if backend != 'pandas':
+        if keep not in ('first', 'last', False):
+            raise CleaningError(f"Invalid keep '{keep}'. Valid values: 'first', 'last', False")
+    
     try:
         original_count = len(dataframe)
         
@@ -90,20 +364,43 @@ def remove_duplicates(
             if missing_cols:
                 raise CleaningError(f"Columns not found: {', '.join(missing_cols)}")
         
-        # Find duplicates before removal
-        duplicate_mask = dataframe.duplicated(subset=subset, keep=False)
-        duplicate_count = duplicate_mask.sum()
-        
-        # Remove duplicates
-        cleaned_df = dataframe.drop_duplicates(subset=subset, keep=keep, ignore_index=False)
+        # Find and remove duplicates with a single hash pass
+        duplicate_mask = None
+        if backend == 'polars':
+            try:
+                duplicate_mask = _polars_duplicated(dataframe, subset, keep)
+            except Exception as e:
+                # e.g. object columns mixing types, which Polars can't represent
+                logger.debug(f"Polars duplicate detection unavailable, using pandas: {e}")
+        elif backend == 'hash':
+            try:
+                duplicate_mask = _hashed_duplicated(dataframe, subset, keep)
+            except Exception as e:
+                logger.debug(f"Hashed duplicate detection unavailable, using pandas: {e}")
+        if duplicate_mask is None:
+            duplicate_mask = dataframe.duplicated(subset=subset, keep=keep).to_numpy()
+        cleaned_df = dataframe.iloc[~duplicate_mask]
         removed_count = original_count - len(cleaned_df)
         
+        if detailed_stats:
+            # Rows in any duplicate group minus the repeats = one per group
+            if keep is False:
+                repeat_count = int(dataframe.duplicated(subset=subset, keep='first').sum())
+                duplicate_groups = removed_count - repeat_count
+            else:
+                grouped_count = int(dataframe.duplicated(subset=subset, keep=False).sum())
+                duplicate_groups = grouped_count - removed_count
+        elif keep is False:
+            duplicate_groups = removed_count // 2
+        else:
+            duplicate_groups = removed_count
+        
         # Build report
         report.set_summary(
             original_rows=original_count,
             cleaned_rows=len(cleaned_df),
             duplicates_removed=removed_count,
-            duplicate_groups=int(duplicate_count / 2) if duplicate_count > 0 else 0,
+            duplicate_groups=duplicate_groups,
             subset_columns=subset or 'all columns',
             keep_strategy=keep
         )
@@ -129,6 +426,121 @@ def remove_duplicates(
         raise CleaningError(f"Duplicate removal failed: {str(e)}")
 
 
+def _canonical_for_hashing(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast columns so that values ``duplicated`` treats as equal hash equally.
+
+    Chunks read with ``read_csv(chunksize=...)`` change dtype whenever a chunk
+    holds a missing value (int64 -> float64, bool -> object), and
+    ``hash_pandas_object`` hashes 1 and 1.0 (or True and an object True)
+    differently. Numbers are hashed as float64, with -0.0 folded into 0.0,
+    and booleans as objects. Integers beyond 2**53 keep their dtype, since
+    float64 can't tell them apart.
+    """
+    columns = {}
+    for position, (_, values) in enumerate(dataframe.items()):
+        dtype = values.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            columns[position] = values.astype(object).to_numpy()
+            continue
+        if pd.api.types.is_numeric_dtype(dtype):
+            as_float = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            if not (pd.api.types.is_integer_dtype(dtype) and (np.abs(as_float) > 2 ** 53).any()):
+                columns[position] = as_float + 0.0
+                continue
+        columns[position] = values.array
+    return pd.DataFrame(columns)
+
+
+def remove_duplicates_chunked(
+    chunks: Iterable[pd.DataFrame],
+    subset: Optional[Union[str, List[str]]] = None
+) -> Tuple[Iterator[pd.DataFrame], CleaningReport]:
+    """
+    Remove duplicate rows from a stream of DataFrame chunks.
+
+    For data that doesn't fit in memory (e.g. ``pd.read_csv(..., chunksize=...)``).
+    Rows are compared by a 64-bit hash of their values, and only the hashes
+    of rows already seen are kept, so the first occurrence of each row is
+    yielded and later ones are dropped. Columns are hashed in a canonical
+    dtype, so duplicates are still found when a column's dtype drifts
+    between chunks (see ``_canonical_for_hashing``).
+
+    Hashes are not verified against the rows themselves, which are no
+    longer in memory: a 64-bit collision silently drops a distinct row. The
+    chance is about n**2 / 2**65 for n distinct rows, roughly one in
+    37 million at a million rows and one in 37 at a billion.
+
+    Args:
+        chunks: DataFrame chunks with the same columns
+        subset: Column name(s) to consider for duplicates (None = all columns)
+
+    Returns:
+        Tuple of (iterator over deduplicated chunks, report). The report's
+        summary is filled in once the iterator is exhausted.
+
+    Raises:
+        CleaningError: If a chunk is missing subset columns (raised while iterating)
+    """
+    report = CleaningReport('remove_duplicates')
+    
+    # Normalize subset to list
+    if isinstance(subset, str):
+        subset = [subset]
+    
+    def deduplicate() -> Iterator[pd.DataFrame]:
+        seen = set()
+        original_count = 0
+        cleaned_count = 0
+        
+        for chunk in chunks:
+            if subset:
+                missing_cols = set(subset) - set(chunk.columns)
+                if missing_cols:
+                    raise CleaningError(f"Columns not found: {', '.join(missing_cols)}")
+            
+            hashes = pd.util.hash_pandas_object(
+                _canonical_for_hashing(chunk[subset] if subset else chunk),
+                index=False
+            )
+            keep_mask = ~hashes.duplicated(keep='first').to_numpy()
+            keep_mask &= np.fromiter(
+                (h not in seen for h in hashes.tolist()),
+                dtype=bool,
+                count=len(hashes)
+            )
+            seen.update(hashes.tolist())
+            
+            cleaned_chunk = chunk.iloc[keep_mask]
+            original_count += len(chunk)
+            cleaned_count += len(cleaned_chunk)
+            yield cleaned_chunk
+        
+        removed_count = original_count - cleaned_count
+        report.set_summary(
+            original_rows=original_count,
+            cleaned_rows=cleaned_count,
+            duplicates_removed=removed_count,
+            duplicate_groups=removed_count,
+            subset_columns=subset or 'all columns',
+            keep_strategy='first'
+        )
+        if removed_count > 0:
+            report.add_change(
+                f"Removed {removed_count} duplicate rows",
+                {
+                    'removed_count': removed_count,
+                    'percentage_removed': round(removed_count / original_count * 100, 2)
+                }
+            )
+        else:
+            report.add_change("No duplicates found")
+        
+        logger.info(f"Removed {removed_count} duplicates from {original_count} rows (chunked)")
+    
+    return deduplicate(), report
+
+
 def handle_missing_values(
     dataframe: pd.DataFrame,
     strategy: str = 'drop',
@@ -171,7 +583,8 @@ def handle_missing_values(
     
     try:
         original_count = len(dataframe)
-        cleaned_df = dataframe.copy()
+        cleaned_df = dataframe
+        updates: Dict[Any, pd.Series] = {}
         
         # Get columns to process
         if columns:
@@ -182,10 +595,17 @@ def handle_missing_values(
         else:
             process_columns = list(dataframe.columns)
         
-        # Count missing values before
+        # Count missing values before in one vectorized pass. The strategies
+        # reuse these counts and record what is left in remaining_counts, so
+        # the summary needs no further scans of untouched columns.
+        null_counts = {
+            col: int(count)
+            for col, count in dataframe[process_columns].isna().sum().items()
+        }
+        remaining_counts = dict(null_counts)
         missing_before = {}
         for col in process_columns:
-            null_count = dataframe[col].isna().sum()
+            null_count = null_counts[col]
             if null_count > 0:
                 missing_before[col] = {
                     'count': int(null_count),
@@ -196,126 +616,157 @@ def handle_missing_values(
         
         # Apply strategy
         if strategy == 'drop':
-            cleaned_df = cleaned_df.dropna(subset=process_columns, how='any')
+            cleaned_df = dataframe.dropna(subset=process_columns, how='any')
             rows_removed = original_count - len(cleaned_df)
+            remaining_counts = dict.fromkeys(process_columns, 0)
             report.add_change(
                 f"Dropped {rows_removed} rows with missing values",
                 {'rows_removed': rows_removed}
             )
         
         elif strategy == 'drop_all':
-            cleaned_df = cleaned_df.dropna(subset=process_columns, how='all')
+            cleaned_df = dataframe.dropna(subset=process_columns, how='all')
             rows_removed = original_count - len(cleaned_df)
+            if rows_removed:
+                remaining_counts = {
+                    col: int(count)
+                    for col, count in cleaned_df[process_columns].isna().sum().items()
+                }
             report.add_change(
                 f"Dropped {rows_removed} rows where all values are missing",
                 {'rows_removed': rows_removed}
             )
         
-        elif strategy == 'fill_mean':
-            for col in process_columns:
-                if pd.api.types.is_numeric_dtype(cleaned_df[col]):
-                    mean_val = cleaned_df[col].mean()
-                    filled_count = cleaned_df[col].isna().sum()
-                    cleaned_df[col] = cleaned_df[col].fillna(mean_val)
-                    if filled_count > 0:
-                        report.add_change(
-                            f"Filled {filled_count} missing values in '{col}' with mean ({mean_val:.2f})",
-                            {'column': col, 'filled_count': int(filled_count), 'fill_value': float(mean_val)}
-                        )
-                else:
-                    report.add_warning(f"Column '{col}' is not numeric, skipped for mean fill")
-        
-        elif strategy == 'fill_median':
+        elif strategy in ('fill_mean', 'fill_median'):
+            stat = 'mean' if strategy == 'fill_mean' else 'median'
+            fill_columns = []
             for col in process_columns:
-                if pd.api.types.is_numeric_dtype(cleaned_df[col]):
-                    median_val = cleaned_df[col].median()
-                    filled_count = cleaned_df[col].isna().sum()
-                    cleaned_df[col] = cleaned_df[col].fillna(median_val)
-                    if filled_count > 0:
-                        report.add_change(
-                            f"Filled {filled_count} missing values in '{col}' with median ({median_val:.2f})",
-                            {'column': col, 'filled_count': int(filled_count), 'fill_value': float(median_val)}
-                        )
-                else:
-                    report.add_warning(f"Column '{col}' is not numeric, skipped for median fill")
+                if not pd.api.types.is_numeric_dtype(cleaned_df[col]):
+                    report.add_warning(f"Column '{col}' is not numeric, skipped for {stat} fill")
+                elif null_counts[col]:
+                    fill_columns.append(col)
+            
+            # Statistics are computed per column: a frame-wide reduction over
+            # mixed dtypes (e.g. Int64 next to float64) upcasts to a nullable
+            # result, turning an all-NaN column's NaN into pd.NA
+            for col in fill_columns:
+                filled_count = null_counts[col]
+                stat_val = getattr(cleaned_df[col], stat)()
+                updates[col] = cleaned_df[col].fillna(stat_val)
+                if pd.notna(stat_val):
+                    remaining_counts[col] = 0
+                report.add_change(
+                    f"Filled {filled_count} missing values in '{col}' with {stat} ({stat_val:.2f})",
+                    {'column': col, 'filled_count': filled_count, 'fill_value': float(stat_val)}
+                )
         
         elif strategy == 'fill_mode':
             for col in process_columns:
-                mode_values = cleaned_df[col].mode()
-                if len(mode_values) > 0:
-                    mode_val = mode_values[0]
-                    filled_count = cleaned_df[col].isna().sum()
-                    cleaned_df[col] = cleaned_df[col].fillna(mode_val)
-                    if filled_count > 0:
-                        report.add_change(
-                            f"Filled {filled_count} missing values in '{col}' with mode ({mode_val})",
-                            {'column': col, 'filled_count': int(filled_count), 'fill_value': str(mode_val)}
-                        )
-        
-        elif strategy == 'fill_forward':
-            for col in process_columns:
-                filled_count = cleaned_df[col].isna().sum()
-                cleaned_df[col] = cleaned_df[col].fillna(method='ffill')
-                remaining_nulls = cleaned_df[col].isna().sum()
-                actual_filled = filled_count - remaining_nulls
-                if actual_filled > 0:
+                filled_count = null_counts[col]
+                if not filled_count:
+                    continue
+                # One hashtable count instead of mode()'s sort of every unique
+                # value; ties still go to the smallest value, as with mode()[0]
+                value_counts = cleaned_df[col].value_counts(dropna=True, sort=False)
+                counts = value_counts.to_numpy()
+                # Categoricals also count unobserved categories, as zero
+                if len(counts) > 0 and counts.max() > 0:
+                    top_values = value_counts.index[counts == counts.max()]
+                    try:
+                        mode_val = top_values.min()
+                    except TypeError:
+                        mode_val = top_values[0]
+                    updates[col] = cleaned_df[col].fillna(mode_val)
+                    remaining_counts[col] = 0
                     report.add_change(
-                        f"Forward filled {actual_filled} missing values in '{col}'",
-                        {'column': col, 'filled_count': int(actual_filled)}
+                        f"Filled {filled_count} missing values in '{col}' with mode ({mode_val})",
+                        {'column': col, 'filled_count': filled_count, 'fill_value': str(mode_val)}
                     )
-                if remaining_nulls > 0:
-                    report.add_warning(f"Column '{col}' still has {remaining_nulls} missing values (no prior values to fill)")
+        
+        elif strategy == 'fill_forward':
+            fill_columns = [col for col in process_columns if null_counts[col]]
+            if fill_columns:
+                filled_df = cleaned_df[fill_columns].ffill()
+                remaining = filled_df.isna().sum()
+                for col in fill_columns:
+                    updates[col] = filled_df[col]
+                    remaining_nulls = int(remaining[col])
+                    remaining_counts[col] = remaining_nulls
+                    actual_filled = null_counts[col] - remaining_nulls
+                    if actual_filled > 0:
+                        report.add_change(
+                            f"Forward filled {actual_filled} missing values in '{col}'",
+                            {'column': col, 'filled_count': actual_filled}
+                        )
+                    if remaining_nulls > 0:
+                        report.add_warning(f"Column '{col}' still has {remaining_nulls} missing values (no prior values to fill)")
         
         elif strategy == 'fill_backward':
-            for col in process_columns:
-                filled_count = cleaned_df[col].isna().sum()
-                cleaned_df[col] = cleaned_df[col].fillna(method='bfill')
-                remaining_nulls = cleaned_df[col].isna().sum()
-                actual_filled = filled_count - remaining_nulls
-                if actual_filled > 0:
-                    report.add_change(
-                        f"Backward filled {actual_filled} missing values in '{col}'",
-                        {'column': col, 'filled_count': int(actual_filled)}
-                    )
-                if remaining_nulls > 0:
-                    report.add_warning(f"Column '{col}' still has {remaining_nulls} missing values (no subsequent values to fill)")
+            fill_columns = [col for col in process_columns if null_counts[col]]
+            if fill_columns:
+                filled_df = cleaned_df[fill_columns].bfill()
+                remaining = filled_df.isna().sum()
+                for col in fill_columns:
+                    updates[col] = filled_df[col]
+                    remaining_nulls = int(remaining[col])
+                    remaining_counts[col] = remaining_nulls
+                    actual_filled = null_counts[col] - remaining_nulls
+                    if actual_filled > 0:
+                        report.add_change(
+                            f"Backward filled {actual_filled} missing values in '{col}'",
+                            {'column': col, 'filled_count': actual_filled}
+                        )
+                    if remaining_nulls > 0:
+                        report.add_warning(f"Column '{col}' still has {remaining_nulls} missing values (no subsequent values to fill)")
         
         elif strategy == 'fill_value':
             if fill_value is None:
                 raise CleaningError("fill_value must be provided when strategy='fill_value'")
-            for col in process_columns:
-                filled_count = cleaned_df[col].isna().sum()
-                cleaned_df[col] = cleaned_df[col].fillna(fill_value)
-                if filled_count > 0:
+            fill_columns = [col for col in process_columns if null_counts[col]]
+            if fill_columns:
+                filled_df = cleaned_df[fill_columns].fillna(fill_value)
+                for col in fill_columns:
+                    filled_count = null_counts[col]
+                    updates[col] = filled_df[col]
+                    if pd.notna(fill_value):
+                        remaining_counts[col] = 0
                     report.add_change(
                         f"Filled {filled_count} missing values in '{col}' with {fill_value}",
-                        {'column': col, 'filled_count': int(filled_count), 'fill_value': str(fill_value)}
+                        {'column': col, 'filled_count': filled_count, 'fill_value': str(fill_value)}
                     )
         
         elif strategy == 'interpolate':
+            fill_columns = []
             for col in process_columns:
-                if pd.api.types.is_numeric_dtype(cleaned_df[col]):
-                    filled_count = cleaned_df[col].isna().sum()
-                    cleaned_df[col] = cleaned_df[col].interpolate(method='linear')
-                    remaining_nulls = cleaned_df[col].isna().sum()
-                    actual_filled = filled_count - remaining_nulls
+                if not pd.api.types.is_numeric_dtype(cleaned_df[col]):
+                    report.add_warning(f"Column '{col}' is not numeric, skipped for interpolation")
+                elif null_counts[col]:
+                    fill_columns.append(col)
+            
+            if fill_columns:
+                filled_df = cleaned_df[fill_columns].interpolate(method='linear')
+                remaining = filled_df.isna().sum()
+                for col in fill_columns:
+                    updates[col] = filled_df[col]
+                    remaining_counts[col] = int(remaining[col])
+                    actual_filled = null_counts[col] - remaining_counts[col]
                     if actual_filled > 0:
                         report.add_change(
                             f"Interpolated {actual_filled} missing values in '{col}'",
-                            {'column': col, 'filled_count': int(actual_filled)}
+                            {'column': col, 'filled_count': actual_filled}
                         )
-                else:
-                    report.add_warning(f"Column '{col}' is not numeric, skipped for interpolation")
         
-        # Count missing values after
+        if strategy not in ('drop', 'drop_all'):
+            cleaned_df = _with_columns(dataframe, updates)
+        
+        # Missing values after, as recorded by the strategy
         missing_after = {}
         total_missing_after = 0
         for col in process_columns:
-            if col in cleaned_df.columns:
-                null_count = cleaned_df[col].isna().sum()
-                if null_count > 0:
-                    missing_after[col] = int(null_count)
-                total_missing_after += null_count
+            null_count = remaining_counts[col]
+            if null_count > 0:
+                missing_after[col] = null_count
+            total_missing_after += null_count
         
         # Build summary
         report.set_summary(
@@ -341,7 +792,9 @@ def handle_missing_values(
 
 def trim_whitespace(
     dataframe: pd.DataFrame,
-    columns: Optional[List[str]] = None
+    columns: Optional[List[str]] = None,
+    parallel: bool = False,
+    arrow_strings: bool = False
 ) -> Tuple[pd.DataFrame, CleaningReport]:
     """
     Trim leading and trailing whitespace from string columns.
@@ -349,6 +802,9 @@ def trim_whitespace(
     Args:
         dataframe: Pandas DataFrame to clean
         columns: Specific columns to trim (None = all string columns)
+        parallel: Process columns on a thread pool
+        arrow_strings: Return trimmed columns as ``string[pyarrow]`` instead
+            of object dtype (requires pyarrow)
 
     Returns:
         Tuple of (cleaned_dataframe, report)
@@ -359,7 +815,7 @@ def trim_whitespace(
     report = CleaningReport('trim_whitespace')
     
     try:
-        cleaned_df = dataframe.copy()
+        updates: Dict[Any, pd.Series] = {}
         
         # Determine columns to process
         if columns:
@@ -378,33 +834,37 @@ def trim_whitespace(
         if not process_columns:
             report.add_warning("No string columns found to trim")
             report.set_summary(columns_processed=0, values_changed=0)
-            return cleaned_df, report
+            return dataframe.copy(deep=False), report
         
-        total_changed = 0
-        
-        for col in process_columns:
+        def trim_column(col) -> Tuple[pd.Series, int]:
             # Convert to string and trim
-            original_values = cleaned_df[col].copy()
-            cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
+            original_values = dataframe[col]
+            str_values = _as_strings(original_values)
+            trimmed = str_values.str.strip()
             
             # Count changes (excluding NaN)
-            non_null_mask = original_values.notna()
-            if non_null_mask.any():
-                changed_mask = (original_values[non_null_mask].astype(str) != cleaned_df.loc[non_null_mask, col])
-                changed_count = changed_mask.sum()
-                
-                if changed_count > 0:
-                    total_changed += changed_count
-                    report.add_change(
-                        f"Trimmed whitespace from {changed_count} values in '{col}'",
-                        {'column': col, 'values_changed': int(changed_count)}
-                    )
+            changed_count = _count_changed(original_values, str_values, trimmed)
+            return _from_strings(trimmed, arrow_strings), changed_count
+        
+        total_changed = 0
+        results = _map_columns(trim_column, process_columns, parallel)
+        
+        for col, (trimmed, changed_count) in zip(process_columns, results):
+            updates[col] = trimmed
+            if changed_count > 0:
+                total_changed += changed_count
+                report.add_change(
+                    f"Trimmed whitespace from {changed_count} values in '{col}'",
+                    {'column': col, 'values_changed': changed_count}
+                )
         
         report.set_summary(
             columns_processed=len(process_columns),
             total_values_changed=total_changed
         )
         
+        cleaned_df = _with_columns(dataframe, updates)
+        
         logger.info(f"Trimmed whitespace from {len(process_columns)} columns, {total_changed} values changed")
         return cleaned_df, report
     
@@ -418,7 +878,9 @@ def trim_whitespace(
 def standardize_case(
     dataframe: pd.DataFrame,
     columns: Union[str, List[str]],
-    case: str = 'lower'
+    case: str = 'lower',
+    parallel: bool = False,
+    arrow_strings: bool = False
 ) -> Tuple[pd.DataFrame, CleaningReport]:
     """
     Standardize text case in string columns.
@@ -427,6 +889,9 @@ def standardize_case(
         dataframe: Pandas DataFrame to clean
         columns: Column name(s) to standardize
         case: Case to convert to ('lower', 'upper', 'title', 'capitalize')
+        parallel: Process columns on a thread pool
+        arrow_strings: Return converted columns as ``string[pyarrow]``
+            instead of object dtype (requires pyarrow)
 
     Returns:
         Tuple of (cleaned_dataframe, report)
@@ -441,7 +906,7 @@ def standardize_case(
         raise CleaningError(f"Invalid case '{case}'. Valid cases: {valid_cases}")
     
     try:
-        cleaned_df = dataframe.copy()
+        updates: Dict[Any, pd.Series] = {}
         
         # Normalize to list
         if isinstance(columns, str):
@@ -452,33 +917,28 @@ def standardize_case(
         if missing_cols:
             raise CleaningError(f"Columns not found: {', '.join(missing_cols)}")
         
-        total_changed = 0
-        
-        for col in columns:
-            original_values = cleaned_df[col].copy()
+        def convert_column(col) -> Tuple[pd.Series, int]:
+            original_values = dataframe[col]
+            str_values = _as_strings(original_values)
             
-            # Apply case transformation
-            if case == 'lower':
-                cleaned_df[col] = cleaned_df[col].astype(str).str.lower()
-            elif case == 'upper':
-                cleaned_df[col] = cleaned_df[col].astype(str).str.upper()
-            elif case == 'title':
-                cleaned_df[col] = cleaned_df[col].astype(str).str.title()
-            elif case == 'capitalize':
-                cleaned_df[col] = cleaned_df[col].astype(str).str.capitalize()
+            # Apply case transformation (.str.lower(), .str.upper(), ...)
+            converted = getattr(str_values.str, case)()
             
-            # Count changes
-            non_null_mask = original_values.notna()
-            if non_null_mask.any():
-                changed_mask = (original_values[non_null_mask].astype(str) != cleaned_df.loc[non_null_mask, col])
-                changed_count = changed_mask.sum()
-                
-                if changed_count > 0:
-                    total_changed += changed_count
-                    report.add_change(
-                        f"Standardized {changed_count} values in '{col}' to {case} case",
-                        {'column': col, 'case': case, 'values_changed': int(changed_count)}
-                    )
+            # Count changes (excluding NaN)
+            changed_count = _count_changed(original_values, str_values, converted)
+            return _from_strings(converted, arrow_strings), changed_count
+        
+        total_changed = 0
+        results = _map_columns(convert_column, columns, parallel)
+        
+        for col, (converted, changed_count) in zip(columns, results):
+            updates[col] = converted
+            if changed_count > 0:
+                total_changed += changed_count
+                report.add_change(
+                    f"Standardized {changed_count} values in '{col}' to {case} case",
+                    {'column': col, 'case': case, 'values_changed': changed_count}
+                )
         
         report.set_summary(
             case=case,
@@ -486,6 +946,8 @@ def standardize_case(
             total_values_changed=total_changed
         )
         
+        cleaned_df = _with_columns(dataframe, updates)
+        
         logger.info(f"Standardized case to '{case}' for {len(columns)} columns, {total_changed} values changed")
         return cleaned_df, report
     
@@ -536,23 +998,26 @@ def remove_outliers(
             raise CleaningError(f"Column '{column}' is not numeric")
         
         original_count = len(dataframe)
-        col_data = dataframe[column].dropna()
+        # Work on a float ndarray; NaN (and pd.NA) never compare as outliers
+        values = dataframe[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        non_null_count = int(np.count_nonzero(~np.isnan(values)))
         
-        if len(col_data) == 0:
+        if non_null_count == 0:
             report.add_warning(f"Column '{column}' has no non-null values")
             report.set_summary(original_rows=original_count, cleaned_rows=original_count, outliers_removed=0)
-            return dataframe.copy(), report
+            return dataframe.copy(deep=False), report
         
         # Detect outliers based on method
         if method == 'iqr':
-            Q1 = col_data.quantile(0.25)
-            Q3 = col_data.quantile(0.75)
+            # Both quartiles from a single partition of the column
+            Q1, Q3 = np.nanquantile(values, [0.25, 0.75])
             IQR = Q3 - Q1
             
             lower_bound = Q1 - threshold * IQR
             upper_bound = Q3 + threshold * IQR
             
-            outlier_mask = (dataframe[column] < lower_bound) | (dataframe[column] > upper_bound)
+            outlier_mask = values < lower_bound
+            outlier_mask |= values > upper_bound
             
             method_details = {
                 'Q1': float(Q1),
@@ -564,15 +1029,20 @@ def remove_outliers(
             }
         
         elif method == 'zscore':
-            mean = col_data.mean()
-            std = col_data.std()
+            mean = np.nanmean(values)
+            # Sample standard deviation, matching pandas; undefined for one value
+            std = np.nanstd(values, ddof=1) if non_null_count > 1 else np.nan
             
             if std == 0:
                 report.add_warning(f"Column '{column}' has zero standard deviation, no outliers detected")
                 report.set_summary(original_rows=original_count, cleaned_rows=original_count, outliers_removed=0)
-                return dataframe.copy(), report
+                return dataframe.copy(deep=False), report
             
-            z_scores = np.abs((dataframe[column] - mean) / std)
+            # Compute |x - mean| / std in one scratch buffer instead of an
+            # intermediate array per operation
+            z_scores = np.subtract(values, mean)
+            z_scores /= std
+            np.abs(z_scores, out=z_scores)
             outlier_mask = z_scores > threshold
             
             method_details = {
@@ -582,20 +1052,23 @@ def remove_outliers(
             }
         
         # Remove outliers
-        outlier_count = outlier_mask.sum()
-        cleaned_df = dataframe[~outlier_mask].copy()
+        outlier_count = int(outlier_mask.sum())
         
-        # Get outlier statistics
+        # Get outlier statistics from the ndarray (the mask never selects NaN),
+        # without materializing a filtered copy of the column
         if outlier_count > 0:
-            outlier_values = dataframe.loc[outlier_mask, column].dropna()
+            outlier_values = values[outlier_mask]
+            sample_positions = np.flatnonzero(outlier_mask)[:10]
             outlier_stats = {
-                'min_outlier': float(outlier_values.min()) if len(outlier_values) > 0 else None,
-                'max_outlier': float(outlier_values.max()) if len(outlier_values) > 0 else None,
-                'sample_outliers': outlier_values.head(10).tolist()
+                'min_outlier': float(outlier_values.min()),
+                'max_outlier': float(outlier_values.max()),
+                'sample_outliers': dataframe[column].iloc[sample_positions].tolist()
             }
         else:
             outlier_stats = {}
         
+        cleaned_df = dataframe.iloc[np.flatnonzero(~outlier_mask)]
+        
         report.add_change(
             f"Removed {outlier_count} outliers from '{column}' using {method} method",
             {
@@ -626,11 +1099,27 @@ def remove_outliers(
         raise CleaningError(f"Outlier removal failed: {str(e)}")
 
 
+def _guess_date_format(values: pd.Series) -> Optional[str]:
+    """
+    Guess a strftime format from the first parseable strings in a column.
+
+    Unlike pandas' own inference, which looks at the first value only, a
+    leading bad value doesn't send the whole column to the flexible parser.
+    """
+    for value in values.dropna().head(_DATE_FORMAT_SAMPLE_SIZE):
+        if isinstance(value, str):
+            date_format = guess_datetime_format(value)
+            if date_format:
+                return date_format
+    return None
+
+
 def normalize_dates(
     dataframe: pd.DataFrame,
     columns: Union[str, List[str]],
     target_format: str = 'ISO8601',
-    parse_format: Optional[str] = None
+    parse_format: Optional[str] = None,
+    parallel: bool = False
 ) -> Tuple[pd.DataFrame, CleaningReport]:
     """
     Normalize date columns to a standard format.
@@ -639,9 +1128,13 @@ def normalize_dates(
         dataframe: Pandas DataFrame to clean
         columns: Column name(s) to normalize
         target_format: Target date format:
-            - 'ISO8601': ISO 8601 format (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)
-            - Custom strftime format string (e.g., '%Y-%m-%d', '%m/%d/%Y')
+            - 'ISO8601': ISO 8601 format (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS),
+              kept as datetime64 values (recommended; format with
+              ``format_for_export`` when strings are needed)
+            - Custom strftime format string (e.g., '%Y-%m-%d', '%m/%d/%Y'),
+              stored as object-dtype strings
         parse_format: Optional format string to help parse input dates
+        parallel: Process columns on a thread pool
 
     Returns:
         Tuple of (cleaned_dataframe, report)
@@ -652,7 +1145,7 @@ def normalize_dates(
     report = CleaningReport('normalize_dates')
     
     try:
-        cleaned_df = dataframe.copy()
+        updates: Dict[Any, pd.Series] = {}
         
         # Normalize to list
         if isinstance(columns, str):
@@ -663,38 +1156,48 @@ def normalize_dates(
         if missing_cols:
             raise CleaningError(f"Columns not found: {', '.join(missing_cols)}")
         
-        total_converted = 0
-        total_failed = 0
-        
-        for col in columns:
-            original_values = cleaned_df[col].copy()
+        def normalize_column(col) -> Tuple[pd.Series, int, int]:
+            original_values = dataframe[col]
             
             # Parse dates
             if parse_format:
                 datetime_series = pd.to_datetime(
-                    cleaned_df[col],
+                    original_values,
                     format=parse_format,
                     errors='coerce'
                 )
             else:
+                # Parse with a format guessed from a sample on the fixed-format
+                # fast path; repeated strings are parsed once via the cache
+                date_format = _guess_date_format(original_values)
                 datetime_series = pd.to_datetime(
-                    cleaned_df[col],
+                    original_values,
+                    format=date_format,
                     errors='coerce',
-                    infer_datetime_format=True
+                    cache=True
                 )
             
             # Count successful conversions
-            non_null_original = original_values.notna().sum()
-            successful_conversions = datetime_series.notna().sum()
+            non_null_original = int(original_values.notna().sum())
+            successful_conversions = int(datetime_series.notna().sum())
             failed_conversions = non_null_original - successful_conversions
             
             # Format dates
             if target_format == 'ISO8601':
                 # Keep as datetime object for ISO format
-                cleaned_df[col] = datetime_series
+                normalized = datetime_series
             else:
                 # Format using custom format string
-                cleaned_df[col] = datetime_series.dt.strftime(target_format)
+                normalized = datetime_series.dt.strftime(target_format)
+            
+            return normalized, successful_conversions, failed_conversions
+        
+        total_converted = 0
+        total_failed = 0
+        results = _map_columns(normalize_column, columns, parallel)
+        
+        for col, (normalized, successful_conversions, failed_conversions) in zip(columns, results):
+            updates[col] = normalized
             
             if successful_conversions > 0:
                 total_converted += successful_conversions
@@ -722,6 +1225,8 @@ def normalize_dates(
             total_failed=int(total_failed)
         )
         
+        cleaned_df = _with_columns(dataframe, updates)
+        
         logger.info(f"Normalized dates in {len(columns)} columns: {total_converted} converted, {total_failed} failed")
         return cleaned_df, report
     
@@ -732,6 +1237,44 @@ def normalize_dates(
         raise CleaningError(f"Date normalization failed: {str(e)}")
 
 
+def format_for_export(
+    dataframe: pd.DataFrame,
+    columns: Union[str, List[str]],
+    date_format: str = '%Y-%m-%d'
+) -> pd.DataFrame:
+    """
+    Format datetime columns as strings for export or display.
+
+    Keep dates as datetime64 while cleaning (8 bytes per value, vectorized
+    date operations) and call this only at the output boundary.
+
+    Args:
+        dataframe: Pandas DataFrame with datetime columns
+        columns: Column name(s) to format
+        date_format: strftime format string
+
+    Returns:
+        DataFrame with the columns formatted (missing dates stay missing)
+
+    Raises:
+        CleaningError: If a column is missing or not datetime
+    """
+    if isinstance(columns, str):
+        columns = [columns]
+    
+    missing_cols = set(columns) - set(dataframe.columns)
+    if missing_cols:
+        raise CleaningError(f"Columns not found: {', '.join(missing_cols)}")
+    
+    updates: Dict[Any, pd.Series] = {}
+    for col in columns:
+        if not pd.api.types.is_datetime64_any_dtype(dataframe[col]):
+            raise CleaningError(f"Column '{col}' is not a datetime column")
+        updates[col] = dataframe[col].dt.strftime(date_format)
+    
+    return _with_columns(dataframe, updates)
+
+
 def clean_numeric(
     dataframe: pd.DataFrame,
     columns: Union[str, List[str]],
@@ -754,7 +1297,7 @@ def clean_numeric(
     report = CleaningReport('clean_numeric')
     
     try:
-        cleaned_df = dataframe.copy()
+        updates: Dict[Any, pd.Series] = {}
         
         # Normalize to list
         if isinstance(columns, str):
@@ -767,13 +1310,22 @@ def clean_numeric(
         
         # Default characters to remove
         if remove_chars is None:
-            remove_chars = ['$', '€', '£', '¥', '₹', ',', ' ', '%']
+            remove_chars = list(_DEFAULT_REMOVE_CHARS)
+        
+        # One regex strips every character in a single pass over each value;
+        # patterns are cached across calls, and both the pattern and the
+        # Arrow kernel options are built once for all columns
+        remove_pattern = _remove_chars_pattern(tuple(remove_chars))
+        strip_chars = _remove_chars_stripper(tuple(remove_chars))
+        remove_options = None
+        if pa is not None and remove_pattern is not None:
+            remove_options = pc.ReplaceSubstringOptions(remove_pattern.pattern, '')
         
         total_converted = 0
         total_failed = 0
         
         for col in columns:
-            original_values = cleaned_df[col].copy()
+            original_values = dataframe[col]
             
             # Skip if already numeric
             if pd.api.types.is_numeric_dtype(original_values):
@@ -783,27 +1335,42 @@ def clean_numeric(
                 )
                 continue
             
-            # Convert to string and clean
-            str_values = original_values.astype(str)
-            
-            # Remove specified characters
-            cleaned_values = str_values
-            for char in remove_chars:
-                cleaned_values = cleaned_values.str.replace(char, '', regex=False)
+            not_null = original_values.notna().to_numpy()
             
-            # Convert to numeric
-            numeric_values = pd.to_numeric(cleaned_values, errors='coerce')
+            # Strip and parse in Arrow kernels when possible, else in pandas
+            arrow_result = _arrow_clean_numeric(original_values, remove_options) if pa is not None else None
+            if arrow_result is not None:
+                changed_mask, numeric_values = arrow_result
+            else:
+                # Convert to string once; the cast is reused for change detection
+                original_str = original_values.astype(str)
+                
+                # Remove specified characters over the object array directly
+                if remove_pattern is not None:
+                    strip = strip_chars or partial(remove_pattern.sub, '')
+                    cleaned_values = pd.Series(
+                        [strip(value) for value in original_str.to_numpy()],
+                        index=original_str.index,
+                        name=original_str.name,
+                        dtype=object
+                    )
+                else:
+                    cleaned_values = original_str
+                
+                # Convert to numeric
+                numeric_values = pd.to_numeric(cleaned_values, errors='coerce')
+                
+                # Where cleaning made a difference, comparing the object
+                # arrays directly rather than aligning two Series
+                changed_mask = not_null & (original_str.to_numpy() != cleaned_values.to_numpy())
             
-            # Count conversions
-            non_null_original = original_values.notna().sum()
-            successful_conversions = numeric_values.notna().sum()
+            # Count conversions and actual changes
+            non_null_original = int(not_null.sum())
+            successful_conversions = int(numeric_values.notna().sum())
             failed_conversions = non_null_original - successful_conversions
+            changed_count = int(changed_mask.sum())
             
-            # Count actual changes (where cleaning made a difference)
-            changed_mask = (original_values.notna()) & (original_values.astype(str) != cleaned_values)
-            changed_count = changed_mask.sum()
-            
-            cleaned_df[col] = numeric_values
+            updates[col] = numeric_values
             
             if successful_conversions > 0:
                 total_converted += successful_conversions
@@ -835,6 +1402,8 @@ def clean_numeric(
             removed_chars=remove_chars
         )
         
+        cleaned_df = _with_columns(dataframe, updates)
+        
         logger.info(f"Cleaned numeric data in {len(columns)} columns: {total_converted} converted, {total_failed} failed")
         return cleaned_df, report
     
@@ -869,7 +1438,8 @@ def apply_cleaning_pipeline(
         CleaningError: If any cleaning operation fails
     """
     try:
-        cleaned_df = dataframe.copy()
+        # Operations never modify their input, so no defensive copy is needed
+        cleaned_df = dataframe
         reports = []
         
         operation_map = {
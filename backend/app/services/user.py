@@ -1,7 +1,7 @@
 from typing import Optional, List
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status, Depends
 
@@ -180,10 +180,9 @@ class UserService:
 
     async def count_by_organization(self, organization_id: UUID) -> int:
         result = await self.db.execute(
-            select(User).where(User.organization_id == organization_id)
+            select(func.count()).select_from(User).where(User.organization_id == organization_id)
         )
-        users = result.scalars().all()
-        return len(users)
+        return result.scalar_one()
 
     async def assign_role(self, user_id: UUID, role_id: UUID) -> bool:
         """Assign a role to a user."""
@@ -14,6 +14,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Dataset, Record
 
+# Each pair adds two result columns; Postgres caps a SELECT list at 1664 entries
+MAX_CORRELATION_MATRIX_COLUMNS = 40
+
 
 class AggregationService:
     """Service for aggregating and analyzing dataset data."""
@@ -413,6 +416,201 @@ class AggregationService:
         correlation = float(row[0]) if row[0] is not None else 0.0
         sample_size = int(row[1])
 
+        return self._correlation_result(column1, column2, correlation, sample_size)
+
+    async def calculate_correlation_matrix(
+        self,
+        dataset_id: UUID,
+        columns: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Calculate correlation coefficients for every pair of columns in one scan.
+
+        Pairs are computed over the rows where both values are numeric, as in
+        ``calculate_correlation``.
+
+        Args:
+            dataset_id: Dataset UUID
+            columns: Column names (at most MAX_CORRELATION_MATRIX_COLUMNS)
+
+        Returns:
+            List of correlation dicts (same shape as ``calculate_correlation``)
+            in pair order, omitting pairs with fewer than 2 valid rows
+        """
+        if len(columns) > MAX_CORRELATION_MATRIX_COLUMNS:
+            raise ValueError(
+                f"Correlation matrix supports at most {MAX_CORRELATION_MATRIX_COLUMNS} columns"
+            )
+
+        # Validate dataset
+        dataset = await self.db.get(Dataset, dataset_id)
+        if not dataset:
+            raise ValueError(f"Dataset {dataset_id} not found")
+
+        pairs = [
+            (i, j)
+            for i in range(len(columns))
+            for j in range(i + 1, len(columns))
+        ]
+        if not pairs:
+            return []
+
+        # CORR and REGR_COUNT skip pairs where either value is NULL (non-numeric)
+        aggregates = ",\n".join(
+            f"CORR(v{i}, v{j}), REGR_COUNT(v{i}, v{j})"
+            for i, j in pairs
+        )
+        query = text(f"""
+            SELECT
+                {aggregates}
+            FROM ({self._numeric_values_subquery(len(columns))}) AS numeric_values
+        """)
+
+        result = await self.db.execute(query, self._numeric_values_params(dataset_id, columns))
+        row = result.fetchone()
+
+        correlations = []
+        for k, (i, j) in enumerate(pairs):
+            correlation, sample_size = row[2 * k], row[2 * k + 1]
+            if not sample_size or sample_size < 2:
+                continue
+
+            correlations.append(self._correlation_result(
+                columns[i],
+                columns[j],
+                float(correlation) if correlation is not None else 0.0,
+                int(sample_size)
+            ))
+
+        return correlations
+
+    async def detect_outliers_batch(
+        self,
+        dataset_id: UUID,
+        columns: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Detect IQR outliers in several numeric columns with two queries in total.
+
+        The first query computes quartiles for every column in one scan; the
+        second counts values outside each column's bounds in another.
+
+        Args:
+            dataset_id: Dataset UUID
+            columns: Column names to analyze
+
+        Returns:
+            List of dicts in column order, omitting columns without numeric data:
+            {
+                "column": str,
+                "method": "iqr",
+                "outlier_count": int,
+                "total_records": int,
+                "threshold_low": float,
+                "threshold_high": float,
+                "q1": float,
+                "q3": float,
+                "iqr": float
+            }
+        """
+        if not columns:
+            return []
+
+        # Validate dataset
+        dataset = await self.db.get(Dataset, dataset_id)
+        if not dataset:
+            raise ValueError(f"Dataset {dataset_id} not found")
+
+        subquery = self._numeric_values_subquery(len(columns))
+        params = self._numeric_values_params(dataset_id, columns)
+
+        # Quartiles and counts; the ordered-set aggregates ignore NULL (non-numeric) values
+        quartiles = ",\n".join(
+            f"PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY v{i}), "
+            f"PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY v{i}), "
+            f"COUNT(v{i})"
+            for i in range(len(columns))
+        )
+        stats_query = text(f"""
+            SELECT
+                {quartiles}
+            FROM ({subquery}) AS numeric_values
+        """)
+        row = (await self.db.execute(stats_query, params)).fetchone()
+
+        bounds = {}
+        for i in range(len(columns)):
+            q1, q3, total = row[3 * i], row[3 * i + 1], row[3 * i + 2]
+            if not total:
+                continue
+            q1, q3 = float(q1), float(q3)
+            iqr = q3 - q1
+            bounds[i] = (q1, q3, int(total), q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+
+        if not bounds:
+            return []
+
+        outlier_counts = ",\n".join(
+            f"COUNT(*) FILTER (WHERE v{i} < :lower{i} OR v{i} > :upper{i})"
+            for i in bounds
+        )
+        outliers_query = text(f"""
+            SELECT
+                {outlier_counts}
+            FROM ({subquery}) AS numeric_values
+        """)
+        for i, (_, _, _, lower_bound, upper_bound) in bounds.items():
+            params[f"lower{i}"] = lower_bound
+            params[f"upper{i}"] = upper_bound
+        counts = (await self.db.execute(outliers_query, params)).fetchone()
+
+        return [
+            {
+                "column": columns[i],
+                "method": "iqr",
+                "outlier_count": int(count),
+                "total_records": total,
+                "threshold_low": lower_bound,
+                "threshold_high": upper_bound,
+                "q1": q1,
+                "q3": q3,
+                "iqr": q3 - q1
+            }
+            for (i, (q1, q3, total, lower_bound, upper_bound)), count in zip(bounds.items(), counts)
+        ]
+
+    def _numeric_values_subquery(self, column_count: int) -> str:
+        """
+        Build a subquery projecting columns ``:column0..N`` of a dataset's valid
+        records as numerics ``v0..vN``, with non-numeric values as NULL.
+        """
+        values = ",\n".join(
+            rf"CASE WHEN data->>:column{i} ~ '^-?[0-9]+\.?[0-9]*$' "
+            rf"THEN (data->>:column{i})::numeric END AS v{i}"
+            for i in range(column_count)
+        )
+        return f"""
+                SELECT
+                    {values}
+                FROM records
+                WHERE dataset_id = :dataset_id
+                  AND is_valid = true
+        """
+
+    def _numeric_values_params(self, dataset_id: UUID, columns: list[str]) -> dict[str, Any]:
+        """Bind parameters for ``_numeric_values_subquery``."""
+        params: dict[str, Any] = {f"column{i}": column for i, column in enumerate(columns)}
+        params["dataset_id"] = str(dataset_id)
+        return params
+
+    def _correlation_result(
+        self,
+        column1: str,
+        column2: str,
+        correlation: float,
+        sample_size: int
+    ) -> dict[str, Any]:
+        """Build a correlation result dict with strength and direction labels."""
         # Determine correlation strength
         abs_corr = abs(correlation)
         if abs_corr < 0.3:
@@ -8,6 +8,7 @@ and dataset comparison capabilities.
 from typing import Any, Optional
 from uuid import UUID
 from sqlalchemy import text
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Dataset
@@ -17,15 +18,17 @@ from app.services.visualization.aggregator import AggregationService
 class SummaryService:
     """Service for generating data summaries and profiles."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, aggregator: Optional[AggregationService] = None):
         """
         Initialize summary service.
 
         Args:
             db: Database session
+            aggregator: Optional aggregation service on the same session to
+                share with the caller (creates one if not provided)
         """
         self.db = db
-        self.aggregator = AggregationService(db)
+        self.aggregator = aggregator or AggregationService(db)
 
     async def generate_dataset_summary(
         self,
@@ -148,6 +151,70 @@ class SummaryService:
             }
         }
 
+    def get_schema_projection(self, dataset: Dataset | Row) -> dict[str, Any]:
+        """
+        Build a lightweight, schema-only summary from an already loaded dataset.
+
+        Unlike generate_dataset_summary, this issues no queries: column types
+        and cardinalities come straight from dataset.schema_info. Useful for
+        callers that only need the shape of the data (e.g. chart rules).
+
+        Args:
+            dataset: Loaded Dataset, or a row with id, name, row_count and schema_info
+
+        Returns:
+            Dict with the subset of summary keys:
+            {
+                "dataset_id": str,
+                "dataset_name": str,
+                "row_count": int,
+                "column_count": int,
+                "columns": {
+                    "column_name": {
+                        "type": str,
+                        "stats": {"unique_values": int}
+                    }
+                },
+                "numeric_columns": [...],
+                "categorical_columns": [...]
+            }
+        """
+        schema_info = dataset.schema_info or {}
+        columns_info = schema_info.get("columns", [])
+        column_stats = schema_info.get("column_stats", {})
+
+        column_summaries = {}
+        numeric_columns = []
+        categorical_columns = []
+
+        for col_info in columns_info:
+            col_name = col_info.get("name")
+            col_type = col_info.get("type", "unknown")
+
+            unique_values = col_info.get("stats", {}).get("unique_values")
+            if unique_values is None:
+                unique_values = column_stats.get(col_name, {}).get("unique_count", 0)
+
+            column_summaries[col_name] = {
+                "type": col_type,
+                "stats": {"unique_values": unique_values}
+            }
+
+            if col_type == "numeric":
+                numeric_columns.append(col_name)
+            elif col_type == "categorical":
+                categorical_columns.append(col_name)
+
+        return {
+            "dataset_id": str(dataset.id),
+            "dataset_name": dataset.name,
+            "row_count": dataset.row_count or 0,
+            "column_count": len(columns_info),
+            "columns": column_summaries,
+            "numeric_columns": numeric_columns,
+            "categorical_columns": categorical_columns
+        }
+
     async def generate_column_profile(
         self,
         dataset_id: UUID,
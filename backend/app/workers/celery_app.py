@@ -23,6 +23,7 @@ celery_app = Celery(
     include=[
         "app.workers.ingestion_worker",
         "app.workers.transformation_worker",
+        "app.workers.suggestion_worker",
     ]
 )
 
@@ -144,6 +145,12 @@ celery_app.conf.task_routes = {
         "routing_key": "transformation"
     },
     
+    # Chart suggestion jobs are polled by the UI, so keep them ahead of bulk work
+    "app.workers.suggestion_worker.generate_chart_suggestions": {
+        "queue": "high_priority",
+        "routing_key": "high_priority"
+    },
+    
     # High priority tasks (e.g., user-initiated operations)
     "app.workers.tasks.high_priority_*": {
         "queue": "high_priority",
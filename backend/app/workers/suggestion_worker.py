@@ -0,0 +1,155 @@
+"""
+Celery worker for chart suggestion jobs.
+
+Runs the chart suggester outside the request cycle so the API can return a
+job handle immediately. Progress is written to Redis under
+``chart_suggestions:{job_id}``, which the API polls.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Any, List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.redis import get_redis_client_sync
+from app.workers.celery_app import celery_app
+from app.workers.tasks import BaseTask
+from app.services.llm.client import close_llm_clients, install_uvloop
+from app.services.llm.chart_suggester import (
+    ChartSuggesterService,
+    SUGGESTION_JOB_KEY_PREFIX,
+    SUGGESTION_JOB_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+# Each task runs its LLM calls on a fresh event loop; use uvloop when available
+install_uvloop()
+
+# Each task runs in its own event loop, so pooled connections can't be shared
+# between tasks; NullPool opens and closes a connection per session instead.
+_engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+_AsyncSessionLocal = sessionmaker(
+    _engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+def _store_job_state(
+    job_id: str,
+    dataset_id: str,
+    status: str,
+    suggestions: List[Dict[str, Any]],
+    error: Optional[str] = None
+):
+    """
+    Write a suggestion job record to Redis.
+
+    Args:
+        job_id: Job (Celery task) ID
+        dataset_id: Dataset ID
+        status: Job status ("partial", "completed" or "failed")
+        suggestions: Suggestions available so far
+        error: Error message for failed jobs
+    """
+    record = {
+        "job_id": job_id,
+        "dataset_id": dataset_id,
+        "status": status,
+        "suggestions": suggestions
+    }
+    if error:
+        record["error"] = error
+
+    redis = get_redis_client_sync()
+    redis.setex(
+        f"{SUGGESTION_JOB_KEY_PREFIX}:{job_id}",
+        SUGGESTION_JOB_TTL,
+        json.dumps(record, default=str)
+    )
+
+
+async def _run_suggestions(
+    job_id: str,
+    dataset_id: str,
+    use_ai: bool,
+    max_suggestions: int
+) -> List[Dict[str, Any]]:
+    """
+    Generate suggestions, persisting rule-based results before AI enhancement.
+
+    Returns:
+        Final list of suggestions
+    """
+    try:
+        async with _AsyncSessionLocal() as session:
+            chart_suggester = ChartSuggesterService(session)
+
+            suggestions: List[Dict[str, Any]] = []
+            async for event in chart_suggester.stream_visualizations(
+                dataset_id=UUID(dataset_id),
+                use_ai=use_ai,
+                max_suggestions=max_suggestions
+            ):
+                suggestions = event["suggestions"][:max_suggestions]
+                if event["type"] == "suggestions" and use_ai:
+                    # Let the client render rule-based charts while the LLM runs
+                    _store_job_state(job_id, dataset_id, "partial", suggestions)
+
+            return suggestions
+    finally:
+        # The loop ends with this task, so release its pooled connections now
+        await close_llm_clients()
+
+
+@celery_app.task(
+    base=BaseTask,
+    name="app.workers.suggestion_worker.generate_chart_suggestions",
+    bind=True,
+    max_retries=0
+)
+def generate_chart_suggestions(
+    self,
+    dataset_id: str,
+    use_ai: bool = False,
+    max_suggestions: int = 5
+) -> Dict[str, Any]:
+    """
+    Generate chart suggestions for a dataset.
+
+    Args:
+        dataset_id: Dataset ID
+        use_ai: Whether to enhance suggestions with AI
+        max_suggestions: Maximum number of suggestions to return
+
+    Returns:
+        Dictionary with job ID and suggestion count
+    """
+    job_id = self.request.id
+    logger.info(f"Generating chart suggestions for dataset {dataset_id} (job {job_id})")
+
+    try:
+        suggestions = asyncio.run(
+            _run_suggestions(job_id, dataset_id, use_ai, max_suggestions)
+        )
+    except Exception as e:
+        logger.error(f"Chart suggestion job {job_id} failed: {e}", exc_info=True)
+        _store_job_state(job_id, dataset_id, "failed", [], error=str(e))
+        raise
+
+    _store_job_state(job_id, dataset_id, "completed", suggestions)
+
+    return {
+        "job_id": job_id,
+        "dataset_id": dataset_id,
+        "suggestion_count": len(suggestions)
+    }